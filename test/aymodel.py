@@ -0,0 +1,329 @@
+# Python/NumPy reference model of tt_um_rejunity_ay8913
+#
+# The model is cycle-accurate on the clk_master_strobe granularity: a single model "step" equals
+# one strobe of the tone, noise and envelope counters (master clock / 8 on the real chip).
+# Instead of ticking the counters one by one, the model computes the state of every counter
+# analytically for a whole span of steps during which the registers are not modified.
+# Writes to the mixer and amplitude registers (R7..R10) do not touch the counters, render_commands()
+# gathers the spans between such writes and renders them all at once with per sample mixer and amplitudes.
+# This makes it possible to render a complete VGM tune in a fraction of the real time, even tunes
+# that play samples by writing amplitude registers every few samples.
+#
+# How to run this script from command line:
+#
+# python aymodel.py ../music/Arcanoid_01Story.vgz [MAX_TIME]
+#
+
+import numpy as np
+
+REGISTERS = 16
+MIXING_REGISTERS = range(7, 11)     # mixer and amplitudes of channels A, B, C
+ENVELOPE_SHAPE_REGISTER = 13
+
+# Same order as the WAV files produced by record.py
+CHANNELS = ["master", "channelA", "channelB", "channelC", "noise", "envelope"]
+CHANNEL_BITS = [8, 8, 8, 8, 1, 4]
+
+LFSR_BITS = 17
+LFSR_TAP0 = 0
+LFSR_TAP1 = 3
+
+# Volume levels from attenuation.v, YM2149 manual numbers, every 2nd step is taken
+ATTENUATION_LEVELS = [0.0,   0.008, 0.012, 0.016, 0.023, 0.032, 0.045, 0.063,
+                      0.089, 0.125, 0.177, 0.25,  0.354, 0.5,   0.707, 1.0  ]
+
+def attenuation_table(volume_bits=8):
+    # mimics `ATLEAST1(MAX_VOLUME * level) from attenuation.v, $rtoi() truncates just like int()
+    max_volume = float((1 << volume_bits) - 1)
+    return np.array([0] + [max(int(max_volume * level), 1) for level in ATTENUATION_LEVELS[1:]], dtype=np.int64)
+
+def to_pcm(values, bits):
+    # Converts unsigned N-bit signal into signed 16-bit PCM exactly like play_and_record_wav() does
+    # Fractional levels (for example from resampled signal) are rounded to the nearest PCM value
+    values = np.asarray(values)
+    if np.issubdtype(values.dtype, np.integer):
+        samples = values.astype(np.int64) << (15 - bits)
+        samples = samples * 2 - 32767
+    else:
+        samples = np.rint(values * (1 << (16 - bits)) - 32767)
+    return np.clip(samples, -32767, 32767).astype(np.int16)
+
+_lfsr_orbit = None
+_lfsr_index = None
+def lfsr_orbit():
+    # 17-bit LFSR with taps 0 and 3 is maximal: all non-zero states form a single cycle of 2^17-1 states.
+    # Store the cycle once, then any number of shifts is just an index lookup.
+    global _lfsr_orbit, _lfsr_index
+    if _lfsr_orbit is None:
+        period = (1 << LFSR_BITS) - 1
+        orbit = np.empty(period, dtype=np.int64)
+        index = np.zeros(1 << LFSR_BITS, dtype=np.int64)
+        lfsr = 1
+        for i in range(period):
+            orbit[i] = lfsr
+            index[lfsr] = i
+            lfsr = lfsr >> 1 | (((lfsr >> LFSR_TAP0) ^ (lfsr >> LFSR_TAP1)) & 1) << (LFSR_BITS-1)
+        assert lfsr == 1
+        _lfsr_orbit, _lfsr_index = orbit, index
+    return _lfsr_orbit, _lfsr_index
+
+def lfsr_advance(lfsr, shifts):
+    # Returns LFSR state(s) after given number of shifts.
+    # NOTE: hardware shifts in extra 1 when LFSR is equal to 0, see noise.v
+    orbit, index = lfsr_orbit()
+    shifts = np.asarray(shifts, dtype=np.int64)
+    if lfsr == 0:
+        start = index[1 << (LFSR_BITS-1)]
+        return np.where(shifts > 0, orbit[(start + shifts - 1) % len(orbit)], 0)
+    return orbit[(index[lfsr] + shifts) % len(orbit)]
+
+class Counter:
+    # Models tone.v: counter counts UP and flips the output state once it reaches the period.
+    # Also keeps track of the rising edges of the output that are consumed by signal_edge.v
+    # in noise and envelope generators.
+    def __init__(self, lag):
+        self.lag = lag
+        self.reset()
+
+    def reset(self):
+        self.counter = 1
+        self.state = 1
+        self.pending_edge = True    # signal_edge.v is reset to 0, while tone output is reset to 1
+
+    def flips(self, period, steps):
+        # Number of output flips after each of the given number of steps
+        period = max(period, 1)     # period 0 and 1 are equal
+        first = max(period - self.counter, 0) + 1
+        steps = np.asarray(steps, dtype=np.int64)
+        return np.where(steps < first, 0, (steps - first) // period + 1)
+
+    def out(self, period, steps):
+        return self.state ^ (self.flips(period, steps) & 1)
+
+    def edges(self, period, steps):
+        # Number of rising edges processed by signal_edge.v after each of the given number of steps.
+        # Edge is processed with a lag of 1 step, when strobe is enabled every clock cycle
+        steps = np.asarray(steps, dtype=np.int64)
+        delayed = steps - self.lag
+        rises = (self.flips(period, np.maximum(delayed, 0)) + 1 - self.state) // 2
+        return np.where(delayed >= 0, rises + int(self.pending_edge), 0)
+
+    def advance(self, period, steps):
+        if steps <= 0:
+            return
+        period = max(period, 1)
+        flips = int(self.flips(period, steps))
+        if self.lag > 0:
+            new_state = self.state ^ (flips & 1)
+            self.pending_edge = new_state == 1 and flips > int(self.flips(period, steps - 1))
+        else:
+            self.pending_edge = False
+        first = max(period - self.counter, 0) + 1
+        self.counter = self.counter + steps if flips == 0 else 1 + (steps - first) % period
+        self.state ^= flips & 1
+
+class AY8913:
+    # Models tt_um_rejunity_ay8913 with CHANNEL_OUTPUT_BITS = 8 and MASTER_OUTPUT_BITS = 8.
+    #
+    # strobe_every_cycle=True matches the clock configuration used by record.py (no clock divider),
+    # when False the model matches div 8 & div 128 configurations, there signal edges are processed
+    # between the strobes.
+    def __init__(self, clock_rate, sampling_rate=44100, strobe_every_cycle=True):
+        self.clock_rate = clock_rate
+        self.sampling_rate = sampling_rate
+        self.lag = 1 if strobe_every_cycle else 0
+        self.table = attenuation_table(8)
+        self.tones = [Counter(self.lag) for _ in range(3)]
+        self.noise = Counter(self.lag)
+        self.envelope = Counter(self.lag)
+        self.reset()
+
+    def reset(self):
+        self.register = [0] * REGISTERS
+        self.steps = 0
+        self.samples = 0
+        for counter in self.tones + [self.noise, self.envelope]:
+            counter.reset()
+        self.lfsr = 0
+        self.restart_envelope = False
+        self.reset_envelope()
+
+    def reset_envelope(self):
+        self.envelope.reset()
+        self.envelope_counter = 0
+        self.envelope_stop = False
+        self.envelope_invert = not self.envelope_shape()[1]
+
+    def write(self, reg, val):
+        self.register[reg & 15] = val & 255
+        if reg & 15 == 13:
+            self.restart_envelope = True    # envelope is reset on the next strobe, see restart_envelope in RTL
+
+    def tone_period(self, channel):
+        return (self.register[channel*2+1] & 15) << 8 | self.register[channel*2]
+
+    def noise_period(self):
+        return self.register[6] & 31
+
+    def envelope_period(self):
+        return self.register[12] << 8 | self.register[11]
+
+    def envelope_shape(self):
+        # returns hold__, attack__, alternate__ signals from envelope.v
+        shape = self.register[13]
+        continue_, attack, alternate, hold = shape >> 3 & 1, shape >> 2 & 1, shape >> 1 & 1, shape & 1
+        hold_       = hold or not continue_
+        alternate_  = alternate if continue_ else attack
+        return bool(hold_), bool(attack), bool(not alternate_ if hold_ else alternate_)
+
+    def step_of_sample(self, sample):
+        # tone, noise and envelope counters are strobed at master clock / 8
+        return sample * self.clock_rate // (8 * self.sampling_rate)
+
+    def envelope_out(self, edges, advance=False):
+        hold, _, alternate = self.envelope_shape()
+        counter = self.envelope_counter + edges
+        if hold:
+            if self.envelope_stop:
+                counter = np.full_like(edges, self.envelope_counter)
+                invert = np.full_like(edges, int(self.envelope_invert))
+                stop = np.ones_like(edges, dtype=bool)
+            else:
+                stop = counter > 15
+                invert = int(self.envelope_invert) ^ (stop & alternate)
+                counter = np.where(stop, 0, counter)
+        else:
+            invert = int(self.envelope_invert) ^ ((counter >> 4) & int(alternate) & 1)
+            stop = np.where(edges > 0, counter & 15 == 0, self.envelope_stop)
+            counter = counter & 15
+        if advance:
+            self.envelope_counter = int(counter)
+            self.envelope_invert = bool(invert)
+            self.envelope_stop = bool(stop)
+        return np.where(invert, 15 - counter, counter)
+
+    def _advance(self, steps, total, mixing=None):
+        # Computes outputs after each of the given number of `steps` (sorted, relative to the current step)
+        # and then advances the complete state of the chip by `total` steps.
+        # Optional `mixing` holds values of MIXING_REGISTERS for every step, array of shape (4, len(steps)),
+        # otherwise the current values of the registers are used.
+        steps = np.asarray(steps, dtype=np.int64)
+        if mixing is None:
+            mixing = [np.full_like(steps, self.register[reg]) for reg in MIXING_REGISTERS]
+        mixer = mixing[0]
+
+        noise_period = self.noise_period()
+        lfsr = lfsr_advance(self.lfsr, self.noise.edges(noise_period, steps))
+        noise = 1 - (lfsr & 1)
+
+        envelope_steps = steps
+        envelope_total = total
+        if self.restart_envelope and total > 0:
+            self.reset_envelope()           # envelope is busy being reset during the first 'lag' steps
+            envelope_steps = np.maximum(steps - self.lag, 0)
+            envelope_total = max(total - self.lag, 0)
+            self.restart_envelope = False
+        envelope_period = self.envelope_period()
+        envelope = self.envelope_out(self.envelope.edges(envelope_period, envelope_steps))
+
+        volumes = []
+        for channel, tone in enumerate(self.tones):
+            tone_disable = mixer >> channel & 1
+            noise_disable = mixer >> (channel + 3) & 1
+            out = (tone_disable | tone.out(self.tone_period(channel), steps)) & (noise_disable | noise)
+            amplitude = mixing[1 + channel]
+            control = np.where(amplitude & 16, envelope, amplitude & 15)
+            volumes.append(self.table[control] * out)
+
+        # sum all channels, pass the highest 8 bits to the output or prevent wraparound in case of overflow
+        master = volumes[0] + volumes[1] + volumes[2]
+        master = np.where(master >> 9, 255, master >> 1)
+
+        # advance the state
+        self.lfsr = int(lfsr_advance(self.lfsr, self.noise.edges(noise_period, total)))
+        self.envelope_out(self.envelope.edges(envelope_period, envelope_total), advance=True)
+        for channel, tone in enumerate(self.tones):
+            tone.advance(self.tone_period(channel), total)
+        self.noise.advance(noise_period, total)
+        self.envelope.advance(envelope_period, envelope_total)
+        self.steps += total
+
+        noise_channel = np.where((mixer >> 3 & 7) != 7, noise, 0)
+        return np.stack([master] + volumes + [noise_channel, envelope])
+
+    def output(self):
+        # Returns the current outputs, array of len(CHANNELS)
+        return self._advance(np.zeros(1, dtype=np.int64), 0)[:, 0]
+
+    def skip(self, steps):
+        # Advances the state of the chip by the given number of steps without computing the outputs
+        self._advance(np.zeros(0, dtype=np.int64), steps)
+
+    def run(self, steps):
+        # Returns the outputs after each step, array of shape (len(CHANNELS), steps)
+        return self._advance(np.arange(1, steps + 1), steps)
+
+    def render(self, samples, mixing=None):
+        # Returns the outputs sampled at the sampling rate, array of shape (len(CHANNELS), samples)
+        # Optional `mixing` holds values of MIXING_REGISTERS for every sample, array of shape (4, samples)
+        positions = self.step_of_sample(np.arange(self.samples + 1, self.samples + samples + 1, dtype=np.int64))
+        positions -= self.step_of_sample(self.samples)
+        self.samples += samples
+        return self._advance(positions, int(positions[-1]) if samples > 0 else 0, mixing)
+
+def render_commands(commands, clock_rate, sampling_rate=44100, max_time=-1):
+    # Plays [addr, data] / [-1, wait] list produced by load_vgm() and returns
+    # signed 16-bit PCM for every channel, in the same format as play_and_record_wav()
+    chip = AY8913(clock_rate, sampling_rate)
+    max_samples = int(max_time * sampling_rate) if max_time > 0 else -1
+    chunks = []
+    # Waits are gathered until a write modifies the tone, noise or envelope counters,
+    # together with the values of MIXING_REGISTERS during each wait
+    waits, mixings = [], []
+    rendered = 0
+    def flush():
+        if waits:
+            mixing = np.repeat(np.array(mixings, dtype=np.int64).T, waits, axis=1)
+            chunks.append(chip.render(sum(waits), mixing))
+            waits.clear()
+            mixings.clear()
+    for command in commands:
+        if command[0] >= 0:
+            reg, val = command[0] & 15, command[1] & 255
+            if reg not in MIXING_REGISTERS and (reg == ENVELOPE_SHAPE_REGISTER or chip.register[reg] != val):
+                flush()
+            chip.write(reg, val)
+        else:
+            wait = command[1]
+            if max_samples >= 0:
+                wait = min(wait, max_samples - rendered)
+            if wait > 0:
+                waits.append(wait)
+                mixings.append([chip.register[reg] for reg in MIXING_REGISTERS])
+                rendered += wait
+            if max_samples >= 0 and rendered >= max_samples:
+                break
+    flush()
+    outputs = np.concatenate(chunks, axis=1) if chunks else np.zeros((len(CHANNELS), 0), dtype=np.int64)
+    return [to_pcm(out, bits) for out, bits in zip(outputs, CHANNEL_BITS)]
+
+if __name__ == "__main__":
+    import os
+    import sys
+    import time
+    from scipy.io.wavfile import write
+    from record import load_vgm
+
+    vgm_filename = sys.argv[1]
+    max_time = float(sys.argv[2]) if len(sys.argv) > 2 else -1
+
+    start = time.time()
+    music, length_in_seconds, clock_rate, sampling_rate = load_vgm(vgm_filename)
+    samples = render_commands(music, clock_rate, sampling_rate, max_time)
+    elapsed = time.time() - start
+
+    wave_file = [f"../output/{os.path.basename(vgm_filename)}.model.{ch}.wav" for ch in CHANNELS]
+    for filename, data in zip(wave_file, samples):
+        write(filename, sampling_rate, data)
+    print(vgm_filename, "->", wave_file)
+    print(f"Rendered {len(samples[0]) / sampling_rate:.2f} sec in {elapsed:.2f} sec")
@@ -0,0 +1,131 @@
+# Renders many tunes in parallel with record.py
+#
+# The design is compiled once, then every tune is simulated by a separate process
+# in its own working directory under batch/ (samples, traces, logs and results.xml do not clash).
+#
+# How to run this script from command line:
+#
+# python batch.py                                   # all tunes from ../music
+# python batch.py --max-time 15 --jobs 4 --sim verilator
+# python batch.py ../music/Turrican_01Welcome.atari_st.vgz ../music/WoD_06TheLethalSwamp.atari_st.vgz:5
+# python batch.py --pack ../music/corpus.vgmpack              # all tunes from a pack, see vgmpack.py
+#
+# Per tune MAX_TIME can be appended to the filename after a colon.
+#
+
+import argparse
+import glob
+import os
+import subprocess
+import sys
+import time
+import wave
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def sim_build_dir(sim):
+    return os.path.join(TEST_DIR, "sim_build", "rtl_verilator" if sim == "verilator" else "rtl")
+
+def sim_build_target(sim):
+    return os.path.join(sim_build_dir(sim), "Vtop" if sim == "verilator" else "sim.vvp")
+
+def compile_design(sim):
+    subprocess.run(["make", "-s", f"SIM={sim}", "MODULE=record", sim_build_target(sim)], cwd=TEST_DIR, check=True)
+
+def wave_length(filename):
+    with wave.open(filename, "rb") as f:
+        return f.getnframes() / f.getframerate()
+
+def render(vgm_filename, max_time, sim, batch_dir, output_dir, extra_env=None):
+    name = os.path.basename(vgm_filename)
+    work_dir = os.path.join(batch_dir, name)
+    os.makedirs(work_dir, exist_ok=True)
+
+    env = dict(os.environ)
+    env.update({
+        "PWD": TEST_DIR,                # Makefile locates ../src and tb.v relative to $(PWD)
+        "PYTHONPATH": os.pathsep.join([TEST_DIR, env.get("PYTHONPATH", "")]),
+        "OUTPUT": output_dir,
+    })
+    env.update(extra_env or {})
+    command = ["make", "-f", os.path.join(TEST_DIR, "Makefile"),
+               f"SIM={sim}", f"SIM_BUILD={sim_build_dir(sim)}",
+               "MODULE=record", f"VGM={vgm_filename}", f"MAX_TIME={max_time}"]
+
+    start = time.time()
+    with open(os.path.join(work_dir, "log.txt"), "w") as log:
+        result = subprocess.run(command, cwd=work_dir, env=env, stdout=log, stderr=subprocess.STDOUT)
+    wall_time = time.time() - start
+
+    channel = env.get("CHANNELS", "master").split(",")[0].strip()   # any of the recorded channels has the same length
+    tune_name = name.removesuffix(".npy").removesuffix(".timeline")     # register timelines render as their source
+    master = os.path.join(output_dir, f"{tune_name.rstrip('.vgm')}.{channel}.wav")
+    audio_time = wave_length(master) if result.returncode == 0 and os.path.exists(master) else 0
+    return {
+        "tune": name,
+        "ok": result.returncode == 0 and audio_time > 0,
+        "wall_time": wall_time,
+        "audio_time": audio_time,
+        "realtime_factor": audio_time / wall_time if wall_time > 0 else 0,
+        "log": os.path.join(work_dir, "log.txt"),
+    }
+
+def parse_tune(arg, default_max_time, packed=False):
+    filename, _, max_time = arg.partition(":")
+    return filename if packed else os.path.abspath(filename), int(max_time) if max_time else default_max_time
+
+def main():
+    parser = argparse.ArgumentParser(description="Render tunes in parallel with record.py")
+    parser.add_argument("tunes", nargs="*", help="VGM files, optionally with per tune MAX_TIME: tune.vgz:15")
+    parser.add_argument("--max-time", type=int, default=-1, help="seconds to record for every tune, -1 records the whole tune")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(), help="number of simulations to run in parallel")
+    parser.add_argument("--sim", default=os.environ.get("SIM", "icarus"))
+    parser.add_argument("--batch-dir", default=os.path.join(TEST_DIR, "batch"))
+    parser.add_argument("--output", default=os.path.join(TEST_DIR, "..", "output"))
+    parser.add_argument("--pack", help="render tunes from a pack built by vgmpack.py, tunes are given by name")
+    args = parser.parse_args()
+
+    extra_env = {}
+    if args.pack:
+        from vgmpack import Pack
+        extra_env["PACK"] = os.path.abspath(args.pack)
+        with Pack(args.pack) as pack:
+            tunes = args.tunes or pack.names()
+    else:
+        tunes = args.tunes or sorted(sum([glob.glob(os.path.join(TEST_DIR, "..", "music", pattern))
+                                          for pattern in ["*.vg[mz]", "*.ym", "*.psg"]], []))
+    tunes = [parse_tune(tune, args.max_time, packed=bool(args.pack)) for tune in tunes]
+    output_dir = os.path.abspath(args.output)
+    os.makedirs(output_dir, exist_ok=True)
+
+    print(f"Compiling design for {args.sim} ...")
+    compile_design(args.sim)
+
+    start = time.time()
+    results = []
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        jobs = [pool.submit(render, vgm, max_time, args.sim, args.batch_dir, output_dir, extra_env) for vgm, max_time in tunes]
+        for job in as_completed(jobs):
+            result = job.result()
+            results.append(result)
+            status = "ok  " if result["ok"] else "FAIL"
+            print(f"[{len(results)}/{len(jobs)}] {status} {result['tune']:48s} "
+                  f"{result['wall_time']:7.1f}s wall {result['audio_time']:7.1f}s audio  "
+                  f"x{result['realtime_factor']:.3f} real time" + ("" if result["ok"] else f"  see {result['log']}"))
+    wall_time = time.time() - start
+
+    audio_time = sum(r["audio_time"] for r in results)
+    cpu_time = sum(r["wall_time"] for r in results)
+    print()
+    print(f"{'tune':48s} {'wall':>8s} {'audio':>8s} {'x real time':>12s}")
+    for r in sorted(results, key=lambda r: r["tune"]):
+        print(f"{r['tune']:48s} {r['wall_time']:7.1f}s {r['audio_time']:7.1f}s {r['realtime_factor']:12.3f}")
+    print(f"{'total':48s} {cpu_time:7.1f}s {audio_time:7.1f}s {audio_time / cpu_time if cpu_time > 0 else 0:12.3f}")
+    print(f"Rendered {len(results)} tunes on {args.jobs} jobs in {wall_time:.1f}s, "
+          f"x{audio_time / wall_time if wall_time > 0 else 0:.3f} real time overall")
+
+    return 0 if all(r["ok"] for r in results) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
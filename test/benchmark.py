@@ -0,0 +1,126 @@
+# Benchmarks record.py on fixed slices of the bundled tunes
+#
+# Every tune is rendered for the same number of seconds, one simulation at a time (so timings are not
+# disturbed by other simulations). Wall time, simulated time, samples, Python wakeups, register writes and
+# real time factor are collected from record.py (see STATS) into a JSON report.
+# Reports can be compared between commits to catch regressions in the harness or in the RTL.
+#
+# How to run this script from command line:
+#
+# python benchmark.py                                   # writes benchmark.json
+# python benchmark.py --max-time 10 --sim verilator --report verilator.json
+# python benchmark.py --compare benchmark.json --report new.json
+#
+
+import argparse
+import glob
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+from batch import TEST_DIR, compile_design, render
+
+METRICS = ["wall_time", "sim_time_ns", "samples", "wakeups", "register_writes", "realtime_factor"]
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=TEST_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+def benchmark(tunes, max_time, sim, batch_dir, output_dir):
+    results = []
+    for n, vgm in enumerate(tunes):
+        name = os.path.basename(vgm)
+        stats_file = os.path.join(batch_dir, name, "stats.json")
+        if os.path.exists(stats_file):
+            os.remove(stats_file)
+        result = render(vgm, max_time, sim, batch_dir, output_dir, extra_env={"STATS": stats_file, "RENDER_CACHE": "off"})
+        stats = {"vgm": name, "ok": False, "process_wall_time": result["wall_time"]}
+        if result["ok"] and os.path.exists(stats_file):
+            with open(stats_file) as f:
+                stats.update(json.load(f))
+            stats["ok"] = True
+        results.append(stats)
+        print(f"[{n+1}/{len(tunes)}] " + (f"{name:48s} {stats['wall_time']:7.2f}s wall {stats['audio_time']:6.2f}s audio "
+              f"x{stats['realtime_factor']:.3f} real time {stats['wakeups']:8d} wakeups" if stats["ok"] else
+              f"{name:48s} FAIL see {result['log']}"))
+    return results
+
+def totals(results):
+    ok = [r for r in results if r["ok"]]
+    total = {key: sum(r[key] for r in ok) for key in ["wall_time", "audio_time", "sim_time_ns", "samples", "wakeups", "register_writes"]}
+    total["realtime_factor"] = total["audio_time"] / total["wall_time"] if total["wall_time"] > 0 else 0
+    return total
+
+def compare(report, baseline):
+    # Prints relative change of every metric against the baseline report
+    old = {r["vgm"]: r for r in baseline["tunes"] if r["ok"]}
+    print()
+    print(f"Compared to {baseline['revision'] or 'baseline'} ({baseline['sim']}):")
+    print(f"{'tune':48s}" + "".join(f"{metric:>18s}" for metric in METRICS))
+    rows = [(r["vgm"], r, old.get(r["vgm"])) for r in report["tunes"] if r["ok"]]
+    rows.append(("total", report["total"], baseline["total"]))
+    for name, new, prev in rows:
+        if prev is None:
+            continue
+        cells = []
+        for metric in METRICS:
+            if prev[metric]:
+                cells.append(f"{100 * (new[metric] - prev[metric]) / prev[metric]:+17.1f}%")
+            else:
+                cells.append(f"{'-':>18s}")
+        print(f"{name:48s}" + "".join(cells))
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark record.py on fixed slices of the bundled tunes")
+    parser.add_argument("tunes", nargs="*", help="VGM files, all tunes from ../music by default")
+    parser.add_argument("--max-time", type=int, default=5, help="seconds to record from every tune")
+    parser.add_argument("--sim", default=os.environ.get("SIM", "icarus"))
+    parser.add_argument("--batch-dir", default=os.path.join(TEST_DIR, "batch"))
+    parser.add_argument("--output", default=os.path.join(TEST_DIR, "..", "output"))
+    parser.add_argument("--report", default=os.path.join(TEST_DIR, "benchmark.json"))
+    parser.add_argument("--compare", help="previous report to compare against")
+    args = parser.parse_args()
+
+    tunes = [os.path.abspath(tune) for tune in args.tunes] or sorted(glob.glob(os.path.join(TEST_DIR, "..", "music", "*.vg[mz]")))
+    output_dir = os.path.abspath(args.output)
+    os.makedirs(output_dir, exist_ok=True)
+
+    print(f"Compiling design for {args.sim} ...")
+    compile_design(args.sim)
+
+    start = time.time()
+    results = benchmark(tunes, args.max_time, args.sim, args.batch_dir, output_dir)
+    report = {
+        "revision": git_revision(),
+        "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "sim": args.sim,
+        "capture": os.environ.get("CAPTURE", "strobe"),
+        "max_time": args.max_time,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "benchmark_wall_time": time.time() - start,
+        "total": totals(results),
+        "tunes": results,
+    }
+    with open(args.report, "w") as f:
+        json.dump(report, f, indent=2)
+
+    total = report["total"]
+    print(f"Recorded {total['audio_time']:.1f}s of audio in {total['wall_time']:.1f}s, "
+          f"x{total['realtime_factor']:.3f} real time, {total['wakeups']} Python wakeups")
+    print(f"Report written to {args.report}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(report, json.load(f))
+
+    return 0 if all(r["ok"] for r in results) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
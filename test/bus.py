@@ -0,0 +1,64 @@
+# AY-3-819x bus driver shared by the cocotb tests
+#
+# BDIR  BC1
+#   0    0    Inactive
+#   0    1    Read from Register Array  (NOT IMPLEMENTED!)
+#   1    0    Write to Register Array
+#   1    1    Latch Register Address
+
+from cocotb.triggers import RisingEdge
+
+REGISTERS = 16
+ENVELOPE_SHAPE_REGISTER = 13
+
+BUS_INACTIVE = 0b00
+BUS_READ     = 0b01   # NOT IMPLEMENTED by the chip
+BUS_WRITE    = 0b10
+BUS_LATCH    = 0b11
+
+class RegisterWriter:
+    # Writes a whole batch of registers (for example all the writes of a VGM frame) from a single coroutine.
+    # Every write takes just 2 clock edges: Latch Register Address, then Write to Register Array.
+    # Writes that would not change the value of the register are elided, except writes to the envelope
+    # shape register R13 which restart the envelope.
+    #
+    # `uio_in_upper` holds the rest of the uio_in pins, for example clock divider selection in uio_in[3:2].
+    def __init__(self, dut, uio_in_upper=0b000000_00, elide=True):
+        self.dut = dut
+        self.uio_in_upper = uio_in_upper
+        self.elide = elide
+        self.edge = RisingEdge(dut.clk)
+        self.reset()
+
+    def reset(self):
+        self.shadow = [0] * REGISTERS   # register array is cleared by reset
+        self.written = 0
+        self.elided = 0
+
+    def pending(self, writes):
+        writes_to_do = []
+        for reg, val in writes:
+            reg &= 15
+            if self.elide and reg != ENVELOPE_SHAPE_REGISTER and self.shadow[reg] == val:
+                self.elided += 1
+                continue
+            self.shadow[reg] = val
+            writes_to_do.append((reg, val))
+        return writes_to_do
+
+    async def write(self, writes):
+        # returns number of elided writes in this batch
+        elided = self.elided
+        dut = self.dut
+        for reg, val in self.pending(writes):
+            dut.uio_in.value = self.uio_in_upper | BUS_LATCH
+            dut.ui_in.value  = reg
+            await self.edge
+            dut.uio_in.value = self.uio_in_upper | BUS_WRITE
+            dut.ui_in.value  = val
+            await self.edge
+            self.written += 1
+        # Inactivate: disable writes and trigger envelope restart, if last write was to Envelope register
+        dut.uio_in.value = self.uio_in_upper | BUS_INACTIVE
+        dut.ui_in.value  = 0
+        return self.elided - elided
@@ -0,0 +1,123 @@
+# Constrained-random fuzzing of the bus decode and the register array of tt_um_rejunity_ay8913
+#
+# Random Latch / Write / Inactive / Read bus cycles are replayed by the bus player in tb.v in chunks,
+# Python wakes up only once per chunk. Latches carry mismatched upper address bits (DA7..DA4) from time to time,
+# unused uio_in pins and clock divider selection are random as well.
+# After every chunk the register array, latched register, active flag and restart_envelope of the RTL
+# are compared against a shadow model of the bus decode.
+
+import os
+import numpy as np
+import cocotb
+from cocotb.triggers import Edge, ReadOnly, NextTimeStep
+
+from bus import REGISTERS, ENVELOPE_SHAPE_REGISTER, BUS_INACTIVE, BUS_READ, BUS_WRITE, BUS_LATCH
+
+FUZZ_SEED = 1
+try:
+    FUZZ_SEED = int(os.environ.get("FUZZ_SEED", FUZZ_SEED))
+except:
+    pass
+
+FUZZ_CYCLES = 50_000
+try:
+    FUZZ_CYCLES = int(os.environ.get("FUZZ_CYCLES", FUZZ_CYCLES))
+except:
+    pass
+
+CHUNK_CYCLES = 4096     # must fit into bus_stimulus memory in tb.v
+
+class ShadowBus:
+    # Mirrors the bus decode of tt_um_rejunity_ay8913.v, one call of cycle() per clock edge
+    def __init__(self, upper_address_mask=0b0000):
+        self.upper_address_mask = upper_address_mask
+        self.reset()
+
+    def reset(self):
+        self.register = [0] * REGISTERS
+        self.latched_register = 0
+        self.active = False
+        self.restart_envelope = False
+        self.restarts = 0               # number of edges restart_envelope was asserted on, see bus_restarts in tb.v
+
+    def cycle(self, bus, data):
+        cs = data >> 4 == self.upper_address_mask
+        write = bus == BUS_WRITE and self.active
+        if self.restart_envelope:
+            self.restarts += 1
+        self.restart_envelope = write and self.latched_register == ENVELOPE_SHAPE_REGISTER
+        if bus == BUS_LATCH:
+            self.active = cs
+            if cs:
+                self.latched_register = data & 15
+        elif write:
+            self.register[self.latched_register] = data
+
+def random_bus_cycles(rng, count, mismatch_probability=0.25):
+    # Returns uio_in and ui_in values for `count` bus cycles
+    bus = rng.choice([BUS_INACTIVE, BUS_READ, BUS_WRITE, BUS_LATCH], size=count, p=[0.2, 0.05, 0.4, 0.35])
+    data = rng.integers(0, 256, size=count)
+    matching = rng.random(count) >= mismatch_probability
+    data = np.where((bus == BUS_LATCH) & matching, data & 15, data)
+    uio_in = rng.integers(0, 64, size=count) << 2 | bus
+    return uio_in, data
+
+class BusFuzzer:
+    def __init__(self, dut, seed=FUZZ_SEED):
+        self.dut = dut
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+        self.shadow = ShadowBus()
+        self.filename = cocotb.plusargs.get("BUS", "bus.hex")
+        self.cycles = 0
+        self.chunks = 0
+
+    def check(self, restarts):
+        internal = self.dut.tt_um_rejunity_ay8913_uut
+        shadow = self.shadow
+        got = {
+            "register": [int(internal.register[i].value) for i in range(REGISTERS)],
+            "latched_register": int(internal.latched_register.value),
+            "active": bool(internal.active.value),
+            "restart_envelope": bool(internal.restart_envelope.value),
+            "restarts": restarts,
+        }
+        expected = {
+            "register": shadow.register,
+            "latched_register": shadow.latched_register,
+            "active": shadow.active,
+            "restart_envelope": shadow.restart_envelope,
+            "restarts": shadow.restarts,
+        }
+        for name in expected:
+            assert got[name] == expected[name], \
+                f"{name} mismatch after chunk {self.chunks} ({self.cycles} bus cycles, FUZZ_SEED={self.seed}): " \
+                f"expected {expected[name]}, got {got[name]}"
+
+    async def run(self, cycles):
+        # Issues `cycles` random bus cycles, chip must be out of reset with all registers cleared
+        dut = self.dut
+        self.shadow.reset()
+        restarts_before = int(dut.bus_restarts.value)
+        bus_start = int(dut.bus_start.value)
+        while self.cycles < cycles:
+            count = min(CHUNK_CYCLES, cycles - self.cycles)
+            uio_in, ui_in = random_bus_cycles(self.rng, count)
+            np.savetxt(self.filename, uio_in << 8 | ui_in, fmt="%04x")
+
+            dut.bus_count.value = count
+            bus_start ^= 1
+            dut.bus_start.value = bus_start
+
+            for bus, data in zip((uio_in & 3).tolist(), ui_in.tolist()):
+                self.shadow.cycle(bus, data)
+            self.cycles += count
+            self.chunks += 1
+
+            await Edge(dut.bus_done)
+            await ReadOnly()                    # let the last edge of the chunk settle
+            self.check(int(dut.bus_restarts.value) - restarts_before)
+            await NextTimeStep()
+
+        dut.uio_in.value = BUS_INACTIVE
+        dut.ui_in.value = 0
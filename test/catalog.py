@@ -0,0 +1,189 @@
+# SQLite catalog of a VGM/VGZ corpus built from headers and GD3 tags only (see vgmparse.scan)
+#
+# Files are scanned by a pool of processes. The catalog is updated incrementally: files with unchanged
+# size and modification time are skipped, changed files are rescanned only if their contents changed,
+# rows of deleted files are removed.
+#
+# How to run this script from command line:
+#
+# python catalog.py ../music                          # builds or updates catalog.sqlite, rows of deleted files are dropped
+# python catalog.py ../music --no-gd3                 # faster, headers only (no titles)
+# python catalog.py --list "ay8910_clock > 0 AND seconds < 120"
+# python catalog.py --list "title LIKE '%Theme%'" --order seconds
+#
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import vgmparse
+
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+
+SAMPLING_RATE = 44100   # sampling rate is hardcoded in VGM
+
+GD3_COLUMNS = {
+    # column: GD3 tag
+    "title": "title_eng",
+    "game": "game_eng",
+    "system": "console_eng",
+    "author": "artist_eng",
+    "date": "date",
+    "creator": "vgm_creator",
+    "notes": "notes",
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tunes (
+    path            TEXT PRIMARY KEY,
+    size            INTEGER,
+    mtime           REAL,
+    sha1            TEXT,
+    error           TEXT,
+    version         INTEGER,
+    total_samples   INTEGER,
+    seconds         REAL,
+    loop_offset     INTEGER,
+    loop_samples    INTEGER,
+    rate            INTEGER,
+    ay8910_clock    INTEGER,
+    chips           TEXT,       -- JSON {"<chip>_clock": clock} of all the chips with a non zero clock
+    title           TEXT,
+    game            TEXT,
+    system          TEXT,
+    author          TEXT,
+    date            TEXT,
+    creator         TEXT,
+    notes           TEXT
+);
+CREATE INDEX IF NOT EXISTS tunes_ay8910_clock ON tunes (ay8910_clock);
+CREATE INDEX IF NOT EXISTS tunes_seconds ON tunes (seconds);
+"""
+
+COLUMNS = ["path", "size", "mtime", "sha1", "error", "version", "total_samples", "seconds", "loop_offset",
+           "loop_samples", "rate", "ay8910_clock", "chips"] + list(GD3_COLUMNS)
+
+def file_sha1(filename):
+    hasher = hashlib.sha1()
+    with open(filename, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+def scan_file(path, gd3=True, sha1=None):
+    # Returns a catalog row of a single file, runs in the worker processes
+    stat = os.stat(path)
+    row = {"path": path, "size": stat.st_size, "mtime": stat.st_mtime, "sha1": sha1 or file_sha1(path)}
+    try:
+        metadata, gd3_data = vgmparse.scan(path, gd3=gd3)
+    except Exception as e:
+        row["error"] = f"{type(e).__name__}: {e}"
+        return row
+    chips = {key: value & 0x3FFFFFFF for key, value in metadata.items()     # top bits are chip flags
+             if key.endswith("_clock") and isinstance(value, int) and value & 0x3FFFFFFF}
+    row.update({
+        "version": metadata["version"],
+        "total_samples": metadata["total_samples"],
+        "seconds": metadata["total_samples"] / SAMPLING_RATE,
+        "loop_offset": metadata.get("loop_offset", 0),
+        "loop_samples": metadata.get("loop_samples", 0),
+        "rate": metadata.get("rate", 0),
+        "ay8910_clock": chips.get("ay8910_clock", 0),
+        "chips": json.dumps(chips, sort_keys=True),
+    })
+    for column, tag in GD3_COLUMNS.items():
+        if tag in gd3_data:
+            row[column] = gd3_data[tag].decode("utf-16-le", errors="replace")
+    return row
+
+def _scan(job):
+    return scan_file(*job)
+
+def open_catalog(filename):
+    db = sqlite3.connect(filename)
+    db.row_factory = sqlite3.Row
+    db.executescript(SCHEMA)
+    return db
+
+def update(db, paths, gd3=True, jobs=None, chunksize=16):
+    # Scans new and changed files and drops deleted ones, returns (scanned, unchanged, removed)
+    known = {row["path"]: (row["size"], row["mtime"], row["sha1"])
+             for row in db.execute("SELECT path, size, mtime, sha1 FROM tunes")}
+    todo, unchanged = [], 0
+    for path in paths:
+        stat = os.stat(path)
+        size, mtime, sha1 = known.get(path, (None, None, None))
+        if size == stat.st_size and mtime == stat.st_mtime:
+            unchanged += 1
+            continue
+        if size == stat.st_size and sha1 == file_sha1(path):
+            db.execute("UPDATE tunes SET mtime = ? WHERE path = ?", (stat.st_mtime, path))   # touched only
+            unchanged += 1
+            continue
+        todo.append((path, gd3, None))
+
+    rows = []
+    if len(todo) > chunksize:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            rows = list(pool.map(_scan, todo, chunksize=chunksize))
+    else:
+        rows = [_scan(job) for job in todo]     # not worth starting the processes
+    db.executemany(f"INSERT OR REPLACE INTO tunes ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})",
+                   [[row.get(column) for column in COLUMNS] for row in rows])
+
+    removed = [path for path in known if not os.path.exists(path)]
+    db.executemany("DELETE FROM tunes WHERE path = ?", [(path,) for path in removed])
+    db.commit()
+    return len(rows), unchanged, len(removed)
+
+def find_tunes(directories):
+    paths = []
+    for directory in directories:
+        if os.path.isfile(directory):
+            paths.append(os.path.abspath(directory))
+            continue
+        for pattern in ["*.vgm", "*.vgz"]:
+            paths += glob.glob(os.path.join(os.path.abspath(directory), "**", pattern), recursive=True)
+    return sorted(set(paths))
+
+def select(db, where="", order="path", limit=-1):
+    query = "SELECT * FROM tunes" + (f" WHERE {where}" if where else "") + f" ORDER BY {order} LIMIT {limit}"
+    return db.execute(query).fetchall()
+
+def main():
+    parser = argparse.ArgumentParser(description="Catalog of VGM/VGZ tunes built from headers and GD3 tags")
+    parser.add_argument("directories", nargs="*", help="directories (scanned recursively) or files to catalog")
+    parser.add_argument("--db", default=os.path.join(TEST_DIR, "catalog.sqlite"))
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(), help="number of scanning processes")
+    parser.add_argument("--no-gd3", action="store_true", help="read headers only, GD3 tags are left empty")
+    parser.add_argument("--list", metavar="WHERE", nargs="?", const="", help="list tunes matching an SQL condition")
+    parser.add_argument("--order", default="path", help="SQL ORDER BY of the listed tunes")
+    parser.add_argument("--limit", type=int, default=-1)
+    args = parser.parse_args()
+
+    db = open_catalog(args.db)
+    if args.directories:
+        start = time.time()
+        paths = find_tunes(args.directories)
+        scanned, unchanged, removed = update(db, paths, gd3=not args.no_gd3, jobs=args.jobs)
+        print(f"Cataloged {len(paths)} tunes in {time.time() - start:.2f}s: {scanned} scanned, {unchanged} unchanged, "
+              f"{removed} removed, see {args.db}")
+
+    if args.list is not None:
+        rows = select(db, args.list, args.order, args.limit)
+        for row in rows:
+            status = f"ERROR {row['error']}" if row["error"] else \
+                     f"{row['seconds']:7.1f}s AY {row['ay8910_clock'] or '-':>8} {row['title'] or ''} / {row['game'] or ''}"
+            print(f"{os.path.relpath(row['path']):60s} {status}")
+        print(f"{len(rows)} tunes")
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+# Differential testing of the RTL against the reference model from aymodel.py
+#
+# The same random sequence of register writes is played on the RTL and on the model.
+# Chip outputs are captured by the strobe sampler in tb.v on every clock cycle (chip configuration
+# without clock divider, every cycle is a strobe) and compared against the model in bulk, once per frame.
+# Failing sequences are shrunk to a minimal reproducer.
+#
+# A sequence consists of frames, every frame is a list of register writes followed by a wait in clock cycles.
+
+import os
+import numpy as np
+from cocotb.triggers import ClockCycles, Edge
+
+from bus import RegisterWriter, REGISTERS, BUS_INACTIVE
+from aymodel import AY8913, CHANNELS
+from probe import SampleFile
+
+UIO_NO_CLOCK_DIVIDER = 0b000001_00
+
+DIFF_SEED = 1
+try:
+    DIFF_SEED = int(os.environ.get("DIFF_SEED", DIFF_SEED))
+except:
+    pass
+
+DIFF_FRAMES = 200
+try:
+    DIFF_FRAMES = int(os.environ.get("DIFF_FRAMES", DIFF_FRAMES))
+except:
+    pass
+
+def random_register_value(rng, reg):
+    # short periods are favoured, so that counters wrap around many times during a frame
+    if reg in (1, 3, 5, 12):            # coarse tune periods
+        return rng.choice([0, 0, 0, 1, rng.randrange(256)])
+    if reg in (0, 2, 4, 11):            # fine tune periods
+        return rng.choice([rng.randrange(16), rng.randrange(256)])
+    return rng.randrange(256)
+
+def random_frames(rng, count, max_writes=4, max_wait=1024):
+    frames = []
+    for _ in range(count):
+        writes = []
+        for _ in range(rng.randint(0, max_writes)):
+            reg = rng.randrange(REGISTERS)
+            writes.append((reg, random_register_value(rng, reg)))
+        frames.append((writes, rng.randint(1, max_wait)))
+    return frames
+
+def schedule(frames):
+    # Returns clock edges at which the registers are written, the last captured line of every frame
+    # and the total number of captured lines. Line `n` holds the outputs after `n` clock edges since reset.
+    writes, frame_ends, edge = [], [], -1
+    for frame_writes, wait in frames:
+        for reg, val in frame_writes:
+            edge += 2                   # Latch Register Address, then Write to Register Array
+            writes.append((edge, reg, val))
+        edge += wait
+        frame_ends.append(edge)
+    return writes, frame_ends, edge + 1
+
+def expected_outputs(frames):
+    # Returns the outputs of the model for every captured line, array of shape (lines, len(CHANNELS))
+    writes, _, lines = schedule(frames)
+    chip = AY8913(clock_rate=8 * 44100)
+    chunks = [chip.output()[:, None]]
+    for edge, reg, val in writes:
+        chunks.append(chip.run(edge - chip.steps))
+        chip.skip(1)                    # counters still see the old register value on the Write edge
+        chip.write(reg, val)
+        chunks.append(chip.output()[:, None])
+    chunks.append(chip.run(lines - 1 - chip.steps))
+    return np.concatenate(chunks, axis=1).T
+
+class Player:
+    # Plays sequences on the RTL and compares the captured outputs against the model
+    def __init__(self, dut):
+        self.dut = dut
+        self.registers = RegisterWriter(dut, uio_in_upper=UIO_NO_CLOCK_DIVIDER, elide=False)
+        self.sample_file = SampleFile(len(CHANNELS))
+        self.lines = 0
+        self.plays = 0
+
+    def read_lines(self):
+        return self.sample_file.read()
+
+    async def capture(self, until):
+        self.dut.sample_until.value = until
+        await Edge(self.dut.sample_done)
+
+    async def stop(self):
+        # flushes and drops lines left by the previous play, then stops the sampler
+        dut = self.dut
+        if int(dut.sample_strobes.value):
+            await self.capture(int(dut.sample_cycles.value) + 2)
+            dut.sample_strobes.value = 0
+            self.read_lines()
+        self.sample_file.close()
+
+    async def reset(self):
+        dut = self.dut
+        await self.stop()
+        dut.ui_in.value = 0
+        dut.uio_in.value = UIO_NO_CLOCK_DIVIDER | BUS_INACTIVE
+        dut.rst_n.value = 0
+        await ClockCycles(dut.clk, 10)
+        dut.rst_n.value = 1
+        dut.sample_cycles.value = 0
+        dut.sample_strobes.value = 1    # line 0 is written on the first clock edge after reset
+        self.registers.reset()
+
+    async def play(self, frames):
+        # Returns (line, expected, got) of the first mismatch or None
+        expected = expected_outputs(frames)
+        _, frame_ends, _ = schedule(frames)
+        await self.reset()
+        self.plays += 1
+
+        captured = 0
+        for (writes, wait), end in zip(frames, frame_ends):
+            await self.registers.write(writes)
+            await self.capture(end + 1)
+            got = self.read_lines()
+            assert captured + len(got) == end + 1, f"expected {end + 1 - captured} lines, captured {len(got)}"
+            want = expected[captured:captured + len(got)]
+            mismatch = np.flatnonzero((got != want).any(axis=1))
+            if len(mismatch) > 0:
+                line = captured + int(mismatch[0])
+                return line, expected[line], got[mismatch[0]]
+            captured += len(got)
+            self.lines += len(got)
+        return None
+
+    def failing_frame(self, frames, line):
+        _, frame_ends, _ = schedule(frames)
+        return next(i for i, end in enumerate(frame_ends) if line <= end)
+
+    async def shrink(self, frames, max_plays=256):
+        # Greedy delta debugging: drops chunks of frames, then single writes, then shortens waits,
+        # as long as the sequence keeps failing. Returns the shrunk sequence and its mismatch.
+        plays = 0
+        mismatch = await self.play(frames)
+        assert mismatch is not None
+        frames = frames[:self.failing_frame(frames, mismatch[0]) + 1]
+
+        async def fails(candidate):
+            nonlocal plays, mismatch
+            if not candidate or plays >= max_plays:
+                return False
+            plays += 1
+            result = await self.play(candidate)
+            if result is not None:
+                mismatch = result
+                return True
+            return False
+
+        chunk = max(len(frames) // 2, 1)
+        while chunk >= 1:
+            i = 0
+            while i < len(frames):
+                candidate = frames[:i] + frames[i + chunk:]
+                if await fails(candidate):
+                    frames = candidate
+                else:
+                    i += chunk
+            chunk //= 2
+
+        for i in range(len(frames)):
+            j = 0
+            while j < len(frames[i][0]):
+                writes, wait = frames[i]
+                candidate = frames[:i] + [(writes[:j] + writes[j + 1:], wait)] + frames[i + 1:]
+                if await fails(candidate):
+                    frames = candidate
+                else:
+                    j += 1
+
+        for i in range(len(frames)):
+            while frames[i][1] > 1:
+                writes, wait = frames[i]
+                candidate = frames[:i] + [(writes, wait // 2)] + frames[i + 1:]
+                if not await fails(candidate):
+                    break
+                frames = candidate
+
+        return frames, mismatch
+
+def describe(frames, mismatch):
+    line, expected, got = mismatch
+    lines = [f"mismatch on line {line} (clock edges since reset), channels: {CHANNELS}",
+             f"  expected: {list(expected)}",
+             f"  got:      {list(got)}",
+             "reproducer, (register, value) writes followed by a wait in cycles:"]
+    lines += [f"  {writes} wait {wait}" for writes, wait in frames]
+    return "\n".join(lines)
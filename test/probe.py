@@ -0,0 +1,108 @@
+# Cached simulator handles of tt_um_rejunity_ay8913 outputs and internal state
+#
+# Walking `dut.tt_um_rejunity_ay8913_uut.<name>.<name>` attribute chains resolves the handles through
+# the simulator on every access. Probe and ChipState resolve all the handles once and then just read values.
+# SampleFile reads the outputs captured in bulk by the sampler in tb.v.
+
+import numpy as np
+import cocotb
+
+from aymodel import CHANNELS, CHANNEL_BITS
+
+class Probe:
+    # Reads the selected output channels (see CHANNELS in aymodel.py) in one batch
+    def __init__(self, dut, channels=CHANNELS):
+        internal = dut.tt_um_rejunity_ay8913_uut
+        handles = {
+            "master":   lambda: dut.uo_out,
+            "channelA": lambda: internal.volume_A,
+            "channelB": lambda: internal.volume_B,
+            "channelC": lambda: internal.volume_C,
+            "noise":    lambda: dut.sample_noise,    # noise gated by the mixer, see tb.v
+            "envelope": lambda: internal.envelope,
+        }
+        self.channels = list(channels)
+        self.handles = [handles[channel]() for channel in self.channels]   # only the selected channels are resolved
+        self.bits = [CHANNEL_BITS[CHANNELS.index(channel)] for channel in self.channels]
+        self.resolutions = len(self.handles) + 1
+
+    def read(self):
+        return [int(handle.value) for handle in self.handles]
+
+    def read_pcm(self):
+        # Signed 16-bit PCM, same as to_pcm() in aymodel.py for every channel
+        return [(int(handle.value) << (16 - bits)) - 32767 for handle, bits in zip(self.handles, self.bits)]
+
+class SampleFile:
+    # Lines of outputs written by the sampler in tb.v into +SAMPLES=<filename> ("samples.txt" by default).
+    # The testbench rewinds the file after every batch, every read takes the whole file and truncates it,
+    # so the file never grows beyond one batch.
+    def __init__(self, columns):
+        self.columns = columns
+        self.filename = cocotb.plusargs.get("SAMPLES", "samples.txt")
+        self.file = None
+
+    def read(self):
+        # Returns the lines of the last batch, array of shape (lines, columns)
+        if self.file is None:
+            self.file = open(self.filename, "r+b")
+        self.file.seek(0)
+        data = self.file.read()
+        self.file.truncate(0)
+        if not data.strip():
+            return np.zeros((0, self.columns), dtype=np.int64)
+        return np.loadtxt(data.splitlines(), dtype=np.int64, ndmin=2).reshape(-1, self.columns)
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+class ChipState:
+    # Formats the internal state of the chip for VERBOSE logs
+    def __init__(self, dut):
+        internal = dut.tt_um_rejunity_ay8913_uut
+        self.ui_in = dut.ui_in
+        self.uo_out = dut.uo_out
+        self.latched_register = internal.latched_register
+        self.active = internal.active
+        self.latch = internal.latch
+        self.write = internal.write
+        self.tones = [(tone.period, tone.counter, tone.out) for tone in
+                      [internal.tone_A_generator, internal.tone_B_generator, internal.tone_C_generator]]
+        noise = internal.noise_generator
+        self.noise = (noise.tone.period, noise.tone.counter, noise.tone.out, noise.lfsr, noise.out)
+        envelope = internal.envelope_generator
+        self.envelope_tone = (envelope.tone.period, envelope.tone.counter)
+        self.envelope_shape = internal.register[13]
+        self.envelope_flags = (envelope.attack__, envelope.alternate__, envelope.hold__,
+                               internal.restart_envelope, envelope.stop)
+        self.envelope = (envelope.envelope_counter, envelope.invert_output, envelope.out)
+
+    def fields(self):
+        fields = [self.ui_in.value, ">||" + '{:2d}'.format(int(self.latched_register.value)),
+                  ("a" if self.active == 1 else ".") +
+                  ("L" if self.latch  == 1 else ".") +
+                  ("W" if self.write  == 1 else ".") + "!"]
+        for period, counter, out in self.tones:
+            fields += ['{:4d}'.format(int(period.value)), '{:4d}'.format(int(counter.value)),
+                       "|#|" if out == 1 else "|-|"]
+        period, counter, out, lfsr, noise = self.noise
+        fields += ['{:2d}'.format(int(period.value)), '{:2d}'.format(int(counter.value)),
+                   ">" if out == 1 else " ", lfsr.value, "|#|" if noise == 1 else "|-|"]
+        period, counter = self.envelope_tone
+        attack, alternate, hold, restart, stop = self.envelope_flags
+        envelope_counter, invert, out = self.envelope
+        fields += ['{:5d}'.format(int(period.value)), '{:5d}'.format(int(counter.value)),
+                   str(self.envelope_shape.value)[4:8],
+                   ("A" if attack    == 1 else ".") +
+                   ("L" if alternate == 1 else ".") +
+                   ("H" if hold      == 1 else "."),
+                   (">" if restart   == 1 else "0"),
+                   ("S" if stop      == 1 else "."),
+                   '{:1X}'.format(int(envelope_counter.value)),
+                   "~" if invert == 1 else " ",
+                   '{:1X}'.format(int(out)),
+                   ">>",
+                   '{:3d}'.format(int(self.uo_out.value))]
+        return fields
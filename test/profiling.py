@@ -0,0 +1,71 @@
+# Opt-in instrumentation of the record.py hot path
+#
+# Stages are timed with `with profile.stage("name"):` blocks (they can enclose awaits, then the time
+# spent in the simulator is accounted to the stage), events are counted with `profile.count("name")`.
+# When disabled, stage() returns a shared no-op context manager and count() returns immediately.
+
+import time
+from contextlib import nullcontext
+
+class _Stage:
+    def __init__(self):
+        self.seconds = 0.0
+        self.calls = 0
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *args):
+        self.seconds += time.perf_counter() - self.start
+        self.calls += 1
+
+class Profile:
+    def __init__(self, enabled=True, pstats_filename=""):
+        self.enabled = enabled
+        self.pstats_filename = pstats_filename
+        self.stages = {}
+        self.counters = {}
+        self.profiler = None
+        self.start = time.perf_counter()
+        self._disabled = nullcontext()
+
+    def stage(self, name):
+        if not self.enabled:
+            return self._disabled
+        stage = self.stages.get(name)
+        if stage is None:
+            stage = self.stages[name] = _Stage()
+        return stage
+
+    def count(self, name, n=1):
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def start_cprofile(self):
+        if self.pstats_filename:
+            import cProfile
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+
+    def stop_cprofile(self):
+        if self.profiler is not None:
+            self.profiler.disable()
+            self.profiler.dump_stats(self.pstats_filename)
+            self.profiler = None
+
+    def report(self):
+        total = time.perf_counter() - self.start
+        lines = [f"{'stage':24s} {'seconds':>10s} {'share':>7s} {'calls':>10s} {'us/call':>9s}"]
+        for name, stage in sorted(self.stages.items(), key=lambda item: -item[1].seconds):
+            lines.append(f"{name:24s} {stage.seconds:10.3f} {100 * stage.seconds / total:6.1f}% {stage.calls:10d} "
+                         f"{1e6 * stage.seconds / max(stage.calls, 1):9.1f}")
+        staged = sum(stage.seconds for stage in self.stages.values())
+        lines.append(f"{'(other)':24s} {total - staged:10.3f} {100 * (total - staged) / total:6.1f}%")
+        lines.append(f"{'total':24s} {total:10.3f}")
+        for name, value in self.counters.items():
+            lines.append(f"{name:24s} {value:10d}")
+        if self.pstats_filename:
+            lines.append(f"cProfile stats written to {self.pstats_filename}, see: python -m pstats {self.pstats_filename}")
+        return "\n".join(lines)
@@ -1,15 +1,42 @@
 # How to run this script from command line:
 #
 # make MODULE=record VGM=../music/MISSION76496.bbc50hz.vgm MAX_TIME=10
+# make MODULE=record VGM=../music/Arcanoid_01Story.vgz.timeline.npy     # register timeline, see timeline.py
+# make MODULE=record VGM=tune.ym                                        # YM and PSG register dumps, see regdump.py
+# make MODULE=record PACK=../music/corpus.vgmpack VGM=Arcanoid_01Story.vgz # tune from a packed corpus, see vgmpack.py
+#
+# LOOP=n plays the tune n times, jumping back to the loop offset of the VGM file (or to the start, if no loop is set)
+# STATS=stats.json writes wall time, simulated time, samples, Python wakeups and register writes into a JSON file
+# PROFILE=1 times every stage of the recording loop and prints the breakdown at the end,
+# PROFILE_PSTATS=record.pstats additionally runs cProfile and dumps the stats into the given file
+# CHANNELS=master records only the selected channels (comma separated), all of them by default:
+#   master, channelA, channelB, channelC, noise, envelope
+# OUTPUT_RATE=48000 sets the sampling rate of the recorded WAV files, 44100 by default (only with CAPTURE=strobe)
+# RENDER_CACHE=dir keeps finished renders in a cache (../output/.cache by default, RENDER_CACHE=off disables it),
+# the simulation is skipped if the VGM file, RTL and render options match a cached render, see rendercache.py
+# RENDER_CACHE_SIZE=1024 limits the cache size in MB, least recently used renders are evicted
 #
 
 import cocotb
 from cocotb.clock import Clock
-from cocotb.triggers import RisingEdge, FallingEdge, Timer, ClockCycles
+from cocotb.triggers import RisingEdge, FallingEdge, Timer, ClockCycles, Edge
 
+import contextlib
 import os
+import json
+import time
+from fractions import Fraction
 import numpy as np
-from scipy.io.wavfile import write
+from wavwriter import WaveWriter
+from resample import Resampler
+from bus import RegisterWriter
+from aymodel import CHANNELS, CHANNEL_BITS, to_pcm
+from profiling import Profile
+from probe import Probe, ChipState, SampleFile
+from rendercache import RenderCache, render_key
+from timeline import Timeline, info_filename
+from vgmpack import Pack
+import regdump
 
 # https://github.com/cdodd/vgmparse
 # sudo pip install -e git+https://github.com/cdodd/vgmparse.git#egg=vgmparse
@@ -18,6 +45,8 @@ import vgmparse
 VGM_FILENAME = "../music/MISSION76496.bbc50hz.vgm"
 VGM_FILENAME = os.environ.get("VGM", VGM_FILENAME)
 VGM_FILENAME = os.environ.get("VGM_FILENAME", VGM_FILENAME)
+OUTPUT_DIR = os.environ.get("OUTPUT", "../output")
+PACK = os.environ.get("PACK", "")
 
 VERBOSE=False
 try:
@@ -26,7 +55,7 @@ try:
         VERBOSE = VERBOSE.lower()
     if VERBOSE <= 0 or VERBOSE == "no" or VERBOSE == "false":
         VERBOSE = False
-    elif VERBOSE >= 1 or VERBOSE == "yes" VERBOSE == "true":
+    elif VERBOSE >= 1 or VERBOSE == "yes" or VERBOSE == "true":
         VERBOSE = True
 except:
     pass
@@ -43,69 +72,80 @@ try:
 except:
     pass
 
+OUTPUT_RATE = 44100
+try:
+    OUTPUT_RATE = int(os.environ.get("OUTPUT_RATE", OUTPUT_RATE))
+except:
+    pass
+
+# CAPTURE=strobe - outputs are written by the testbench on every clock cycle, Python wakes up once per VGM wait
+#                  and resamples them to OUTPUT_RATE, timing follows VGM waits exactly
+# CAPTURE=bulk   - outputs are sampled by the testbench and written into a file, Python wakes up once per VGM wait
+# CAPTURE=python - Python wakes up and reads outputs for every sample
+CAPTURE = os.environ.get("CAPTURE", "strobe").lower()
+
+STATS = os.environ.get("STATS", "")
+
+RECORD_CHANNELS = [channel.strip() for channel in os.environ.get("CHANNELS", ",".join(CHANNELS)).split(",") if channel.strip()]
+
+RENDER_CACHE = os.environ.get("RENDER_CACHE", os.path.join(OUTPUT_DIR, ".cache"))
+if RENDER_CACHE.lower() in ["", "0", "no", "off", "false"]:
+    RENDER_CACHE = ""
+
+RENDER_CACHE_SIZE = 1024
+try:
+    RENDER_CACHE_SIZE = int(os.environ.get("RENDER_CACHE_SIZE", RENDER_CACHE_SIZE))
+except:
+    pass
+
+PROFILE_PSTATS = os.environ.get("PROFILE_PSTATS", "")
+PROFILE = bool(PROFILE_PSTATS)
+try:
+    PROFILE = PROFILE or int(os.environ.get("PROFILE", 0)) > 0
+except:
+    pass
+
+_chip_state = None
 def print_chip_state(dut):
     if not VERBOSE:
         return
 
+    global _chip_state
     try:
-        internal = dut.tt_um_rejunity_ay8913_uut
-        print(
-            dut.ui_in.value, ">||"
-            '{:2d}'.format(int(internal.latched_register.value)), 
-            ("a" if internal.active   == 1 else ".") +
-            ("L" if internal.latch    == 1 else ".") +
-            ("W" if internal.write    == 1 else ".") + "!",
-            '{:4d}'.format(int(internal.tone_A_generator.period.value)),
-            '{:4d}'.format(int(internal.tone_A_generator.counter.value)),
-                        "|#|" if internal.tone_A_generator.out == 1 else "|-|", # "|",
-            '{:4d}'.format(int(internal.tone_B_generator.period.value)),
-            '{:4d}'.format(int(internal.tone_B_generator.counter.value)),
-                        "|#|" if internal.tone_B_generator.out == 1 else "|-|", # "|",
-            '{:4d}'.format(int(internal.tone_C_generator.period.value)),
-            '{:4d}'.format(int(internal.tone_C_generator.counter.value)),
-                        "|#|" if internal.tone_C_generator.out == 1 else "|-|",  #"!",
-            '{:2d}'.format(int(internal.noise_generator.tone.period.value)),
-            '{:2d}'.format(int(internal.noise_generator.tone.counter.value)),
-                        ">" if internal.noise_generator.tone.out == 1 else " ",
-            internal.noise_generator.lfsr.value,
-                        "|#|" if internal.noise_generator.out == 1 else "|-|", # "|",
-            '{:5d}'.format(int(internal.envelope_generator.tone.period.value)),
-            '{:5d}'.format(int(internal.envelope_generator.tone.counter.value)),
-            str(internal.register[13].value)[4:8],
-                        ("A" if internal.envelope_generator.attack__    == 1 else ".") +
-                        ("L" if internal.envelope_generator.alternate__ == 1 else ".") +
-                        ("H" if internal.envelope_generator.hold__      == 1 else "."),
-                        (">" if internal.restart_envelope               == 1 else "0"),
-                        ("S" if internal.envelope_generator.stop        == 1 else "."),
-            '{:1X}'.format(int(internal.envelope_generator.envelope_counter.value)),
-                        "~" if internal.envelope_generator.invert_output == 1 else " ",
-            '{:1X}'.format(int(internal.envelope_generator.out)),
-                        ">>",
-            '{:3d}'.format(int(dut.uo_out.value)))
-                        # "@" if dut.uo_out[0].value == 1 else ".")
-            # '{:3d}'.format(int(dut.uo_out.value >> 1)),
-                        # "@" if dut.uo_out[0].value == 1 else ".")
+        if _chip_state is None:
+            _chip_state = ChipState(dut)         # handles are resolved just once
+        print(*_chip_state.fields())
     except:
         print(dut.uio_in.value, dut.ui_in.value, ">", dut.uo_out.value)
 
-# TODO: def load_ym(filename, verbose=False):
+def load_ym(filename, loops=1, verbose=False):
+    # YM (Atari ST) and PSG (ZX Spectrum) register dumps are read into register timeline frames, see regdump.py.
+    # Returns the same commands as load_vgm(): [register, value] writes and [-1, samples] waits.
+    frames, info = regdump.load(filename)
+    if verbose:
+        print({key: value for key, value in info.items() if key != "source"})
+    timeline = Timeline(frames, info)
+    seconds = timeline.total_samples(loops) / timeline.sampling_rate
+    return timeline.commands(loops), seconds, timeline.clock_rate, timeline.sampling_rate
+
+
+# see https://vgmrips.net/wiki/VGM_Specification#Commands for command descriptions
+CHIP_NAME = 'AY-3-8910'
+CLOCK_METADATA = 'ay8910_clock'
+CMD_AY8910 = 0xA0
+CMD_WAIT_PERIOD = 0x61
+CMD_WAIT_60 = 0x62
+CMD_WAIT_50 = 0x63
+CMD_WAIT_0_15 = 0x70
+CMD_EOF = 0x66
 
 def load_vgm(filename, verbose=False):
-    # see https://vgmrips.net/wiki/VGM_Specification#Commands for command descriptions
-    CHIP_NAME = 'AY-3-8910'
-    CLOCK_METADATA = 'ay8910_clock'
-    CMD_AY8910 = 0xA0
-    CMD_WAIT_PERIOD = 0x61
-    CMD_WAIT_60 = 0x62
-    CMD_WAIT_50 = 0x63
-    CMD_WAIT_0_15 = 0x70
-    CMD_EOF = 0x66
-    WAIT_PERIOD_60 = 735 # samples to wait at 60Hz with 44100 sampling rate
-    WAIT_PERIOD_50 = 882 # samples to wait at 50Hz with 44100 sampling rate
-
-    f = open(filename, mode="rb")
-    data = f.read()
-    f.close()
+    if isinstance(filename, memoryview):
+        data = filename             # tune from a pack, see vgmpack.py
+    else:
+        f = open(filename, mode="rb")
+        data = f.read()
+        f.close()
     vgm_data = vgmparse.Parser(data)
     print(vgm_data.metadata)
 
@@ -113,124 +153,272 @@ def load_vgm(filename, verbose=False):
     sampling_rate = 44100 # sampling rate is hardcoded in VGM
     seconds = vgm_data.metadata['total_samples'] / sampling_rate
 
-    ay_commands = []
-    for item in vgm_data.command_list:
-        cmd = int.from_bytes(item['command'], 'little')
-        if cmd == CMD_AY8910:
-            addr = item['data'][0]
-            data = item['data'][1]
-            ay_commands.append([addr, data])
-        elif cmd == CMD_WAIT_60:
-            ay_commands.append([-1, WAIT_PERIOD_60])
-        elif cmd == CMD_WAIT_50:
-            ay_commands.append([-1, WAIT_PERIOD_50])
-        elif CMD_WAIT_0_15 <= cmd and cmd <= CMD_WAIT_0_15 + 15:
-            ay_commands.append([-1, cmd - CMD_WAIT_0_15 + 1])
-        elif cmd == CMD_WAIT_PERIOD:
-            wait = int.from_bytes(item['data'], 'little') if item['data'] != None else 0
-            ay_commands.append([-1, wait])
-        elif cmd == CMD_EOF:
-            break
-        else:
-            raise AssertionError(f"Unsupported command 0x{cmd:02x} by {CHIP_NAME}")
-    total_wait = sum([0 if c[0] >= 0 else c[1] for c in ay_commands])
+    commands = vgm_data.commands
+    command = commands['command']
+    eof = np.flatnonzero(command == CMD_EOF)
+    if len(eof) > 0:
+        commands = commands[:eof[0]]
+        command = commands['command']
+
+    is_write = command == CMD_AY8910
+    is_wait = (command == CMD_WAIT_PERIOD) | (command == CMD_WAIT_60) | (command == CMD_WAIT_50) | \
+              ((CMD_WAIT_0_15 <= command) & (command <= CMD_WAIT_0_15 + 15))
+    unsupported = np.flatnonzero(~(is_write | is_wait))
+    if len(unsupported) > 0:
+        cmd = command[unsupported[0]]
+        raise AssertionError(f"Unsupported command 0x{cmd:02x} by {CHIP_NAME}")
+
+    # register writes become [addr, data], waits become [-1, samples]
+    ay_commands = np.stack([np.where(is_write, commands['aa'].astype(np.int64), -1),
+                            np.where(is_write, commands['dd'], commands['wait'])], axis=1).tolist()
+    total_wait = int(commands['wait'][is_wait].sum())
     assert abs(total_wait - vgm_data.metadata['total_samples']) <= sampling_rate // 2
 
     return ay_commands, seconds, clock_rate, sampling_rate
 
+def stream_vgm(filename, loops=1, verbose=False):
+    # Same as load_vgm(), but commands are decoded lazily while they are played.
+    # Looped tunes jump back to the loop offset instead of duplicating the command list.
+    vgm_data = vgmparse.Stream(filename)
+    print(vgm_data.metadata)
+
+    clock_rate = vgm_data.metadata[CLOCK_METADATA]
+    sampling_rate = 44100 # sampling rate is hardcoded in VGM
+    seconds = vgm_data.total_samples(loops) / sampling_rate
+
+    def ay_commands():
+        with vgm_data:
+            for cmd, addr, data, wait in vgm_data.commands(loops):
+                if cmd == CMD_AY8910:
+                    yield [addr, data]
+                elif cmd == CMD_WAIT_PERIOD or cmd == CMD_WAIT_60 or cmd == CMD_WAIT_50 or \
+                     CMD_WAIT_0_15 <= cmd and cmd <= CMD_WAIT_0_15 + 15:
+                    yield [-1, wait]
+                elif cmd == CMD_EOF:
+                    break
+                else:
+                    raise AssertionError(f"Unsupported command 0x{cmd:02x} by {CHIP_NAME}")
+
+    return ay_commands(), seconds, clock_rate, sampling_rate
+
+def stream_timeline(filename, loops=1):
+    # Same as stream_vgm(), but commands are read from a memory-mapped register timeline, no parsing involved
+    timeline = Timeline.load(filename)
+    seconds = timeline.total_samples(loops) / timeline.sampling_rate
+    return timeline.commands(loops), seconds, timeline.clock_rate, timeline.sampling_rate
+
 @cocotb.test()
 async def play_and_record_wav(dut):
+    with Pack(PACK) if PACK else contextlib.nullcontext() as pack:
+        await record_wav(dut, pack)
+
+async def record_wav(dut, pack=None):
     max_time = MAX_TIME
     vgm_filename = VGM_FILENAME
-
-    music, length_in_seconds, clock_rate, sampling_rate = load_vgm(vgm_filename)
-
-    if LOOP > 0:
-        music = music * LOOP
-        music_raw = music_raw * LOOP
-
-    wave_file = [f"../output/{os.path.basename(vgm_filename).rstrip('.vgm')}.{ch}.wav" for ch in ["master", "channelA", "channelB", "channelC", "noise", "envelope"]]
-    def get_sample(dut, channel):
-            internal = dut.tt_um_rejunity_ay8913_uut
-            if channel == 0:
-                return int(dut.uo_out.value) << (15-8)    # 8-bit signal
-            elif channel == 1:
-                return int(internal.volume_A.value) << (15-8)      # 8-bit signal
-            elif channel == 2:
-                return int(internal.volume_B.value) << (15-8)      # 8-bit signal
-            elif channel == 3:
-                return int(internal.volume_C.value) << (15-8)      # 8-bit signal
-            elif channel == 4:
-                return int(internal.noise.value if \
-                    internal.noise_disable_A.value +
-                    internal.noise_disable_B.value +
-                    internal.noise_disable_C.value < 3 else 0) << (15-1) # 1-bit signal
-            elif channel == 5:
-                return int(internal.envelope.value) << (15-4)      # 4-bit signal
-            else:
-                assert not "unknown channel"
-
+    assert CAPTURE in ["strobe", "bulk", "python"], f"Unknown CAPTURE={CAPTURE}"
+    channels = [channel for channel in CHANNELS if channel in RECORD_CHANNELS]   # keep the order of the sampler columns
+    assert channels and len(channels) == len(RECORD_CHANNELS), f"CHANNELS must be a list of: {', '.join(CHANNELS)}"
+    channel_bits = [CHANNEL_BITS[CHANNELS.index(channel)] for channel in channels]
+
+    vgm_source = vgm_filename
+    if pack is not None:
+        tune_name = os.path.basename(vgm_filename)
+        vgm_source = pack.open(tune_name)           # zero-copy view of the decompressed tune
+        music, length_in_seconds, clock_rate, sampling_rate = stream_vgm(vgm_source, loops=max(LOOP, 1))
+    elif vgm_filename.lower().endswith((".ym", ".psg")):
+        music, length_in_seconds, clock_rate, sampling_rate = load_ym(vgm_filename, loops=max(LOOP, 1), verbose=True)
+        tune_name = os.path.basename(vgm_filename)
+    elif vgm_filename.endswith(".npy"):
+        music, length_in_seconds, clock_rate, sampling_rate = stream_timeline(vgm_filename, loops=max(LOOP, 1))
+        tune_name = os.path.basename(vgm_filename).removesuffix(".npy").removesuffix(".timeline")
+    else:
+        music, length_in_seconds, clock_rate, sampling_rate = stream_vgm(vgm_filename, loops=max(LOOP, 1))
+        tune_name = os.path.basename(vgm_filename)
+
+    wave_file = [f"{OUTPUT_DIR}/{tune_name.rstrip('.vgm')}.{ch}.wav" for ch in channels]
     print(vgm_filename, "->", wave_file)
     print(f"VGM clock: {clock_rate}" )
     print(f"VGM length: {length_in_seconds:.2f} sec" )
     print(f"This script will record {max_time if max_time > 0 else length_in_seconds:.2f} sec" )
-    
-    master_clock = clock_rate // 8 # using chip configuration without clock divider for faster recording
-    nanoseconds_per_cycle = 1e9 // master_clock
+
+    cache = RenderCache(RENDER_CACHE, RENDER_CACHE_SIZE << 20) if RENDER_CACHE else None
+    if cache:
+        options = {
+            "max_time": max_time, "loop": LOOP, "capture": CAPTURE,
+            "output_rate": OUTPUT_RATE if CAPTURE == "strobe" else sampling_rate,
+            "uio_in": 0b000001_00,      # chip configuration without clock divider, see below
+            "channels": channels,
+            "simulator": f"{cocotb.SIM_NAME} {cocotb.SIM_VERSION}",
+        }
+        if vgm_filename.endswith(".npy"):
+            with open(info_filename(vgm_filename)) as f:
+                options["timeline_info"] = json.load(f)     # clock rate and loop frame live in the sidecar
+        cache_key = render_key(vgm_source, options)
+        cached = cache.lookup(cache_key, channels)
+        if cached is not None:
+            music.close()
+            cache.restore(cache_key, dict(zip(channels, wave_file)))
+            dut._log.info(f"Cached render {cache_key[:16]} restored, simulation skipped")
+            if STATS:
+                with open(STATS, "w") as f:
+                    json.dump(dict(cached["stats"], cached=True), f, indent=2)
+            return
+
+    master_clock = Fraction(clock_rate, 8) # using chip configuration without clock divider for faster recording
+    picoseconds_per_cycle = 2 * round(1e12 / master_clock / 2) # Clock needs the half period in whole steps
     nanoseconds_per_sample = 1e9 / sampling_rate
+    output_rate = OUTPUT_RATE if CAPTURE == "strobe" else sampling_rate
 
-    await reset(dut, nanoseconds_per_cycle)
+    profile = Profile(PROFILE, PROFILE_PSTATS)
+    profile.start_cprofile()
+    wall_start = time.time()
+    await reset(dut, picoseconds_per_cycle)
     print_chip_state(dut)
 
-    last_time = 0
-    samples = [[] for ch in wave_file]
+    samples = [WaveWriter(filename, output_rate) for filename in wave_file]
+
+    registers = RegisterWriter(dut, uio_in_upper=0b000001_00) # keep chip configuration without clock divider
+    if CAPTURE == "python":
+        probe = Probe(dut, channels)
+        profile.count("handle resolutions", probe.resolutions)
+    if CAPTURE != "python":
+        dut.sample_channels.value = sum(1 << CHANNELS.index(channel) for channel in channels)
+    if CAPTURE == "bulk":
+        dut.sample_period_ps.value = round(1e12 / sampling_rate)
+    if CAPTURE == "strobe":
+        # chip output is captured at the strobe rate, cycle 0 is the first cycle after reset
+        resampler = Resampler(master_clock, output_rate, channels=len(channels))
+        dut.sample_strobes.value = 1
+    sample_start = 0
+    sample_file = SampleFile(len(channels))
+    read_samples = sample_file.read
+
+    def write_pcm(values):
+        # values: array of shape (len(channels), n)
+        for channel, data in enumerate(samples):
+            with profile.stage("to_pcm"):
+                pcm = to_pcm(values[channel], channel_bits[channel])
+            with profile.stage("wav write"):
+                data.extend(pcm)
+
+    position = 0        # in VGM samples since the start of the tune
+    last_flush = 0
+    waits = 0           # Python wakeups while waiting, register writes wake Python up twice per write
 
     log_frame = []
     log_waited = 0
+    log_elided = 0
     for command in music:
         if command[0] >= 0:
             reg = command[0]
             data = command[1]
-            await set_register(dut, reg, data)
             log_frame.append([reg, data])
         else:
+            if log_frame:
+                written = registers.written
+                with profile.stage("register writes"):
+                    log_elided = await registers.write(log_frame)   # write the whole frame at once
+                profile.count("wakeups", 2 * (registers.written - written))
+                print_chip_state(dut)
+
             samples_to_wait = command[1]
-            for i in range(samples_to_wait):
-                await Timer(nanoseconds_per_sample, units="ns", round_mode="round")
-                for channel, data in enumerate(samples):
-                    sample = get_sample(dut, channel)
-                    assert sample >= 0
-                    assert sample <= 32767
-                    if True:
-                        sample *= 2
-                        sample -= 32767
-                        sample = -32767 if sample < -32767 else sample
-                        sample =  32767 if sample > 32767 else sample
-                    assert np.int16(sample) == sample
-                    data.append(sample)
+            position += samples_to_wait
+            if CAPTURE == "strobe":
+                # absolute cycle is derived from absolute VGM position, so rounding never accumulates;
+                # cycles spent on register writes are captured too and count towards the wait
+                target_cycle = position * clock_rate // (8 * sampling_rate)
+                if target_cycle > int(dut.sample_cycles.value) + 1:
+                    dut.sample_until.value = target_cycle
+                    with profile.stage("wait"):
+                        await Edge(dut.sample_done)         # single wakeup for the whole wait
+                    waits += 1
+                    with profile.stage("read samples"):
+                        values = read_samples()
+                    with profile.stage("resample"):
+                        values = resampler.process(values.T)
+                    write_pcm(values)
+            elif CAPTURE == "bulk":
+                if samples_to_wait > 0:
+                    dut.sample_count.value = samples_to_wait
+                    sample_start ^= 1
+                    dut.sample_start.value = sample_start
+                    with profile.stage("wait"):
+                        await Edge(dut.sample_done)         # single wakeup for the whole wait
+                    waits += 1
+                    with profile.stage("read samples"):
+                        values = read_samples()
+                    assert len(values) == samples_to_wait
+                    write_pcm(values.T)
+            else:
+                for i in range(samples_to_wait):
+                    with profile.stage("wait"):
+                        await Timer(nanoseconds_per_sample, units="ns", round_mode="round")
+                    waits += 1
+                    with profile.stage("read probe"):
+                        pcm = probe.read_pcm()
+                    with profile.stage("wav write"):
+                        for data, sample in zip(samples, pcm):
+                            data.append(sample)
             log_waited += samples_to_wait
 
             cur_time = cocotb.utils.get_sim_time(units="ns")
-            print(f"Recorded {len(samples[0])} samples. Wrote", [f"0x{ad[0]:1x}={ad[1]}" for ad in log_frame], f"and waited {(1000*log_waited)/44100:.2f} ms", "---", f"Time: {cur_time/1e6:5.3f} ms")
+            with profile.stage("log"):
+                print(f"Recorded {len(samples[0])} samples. Wrote", [f"0x{ad[0]:1x}={ad[1]}" for ad in log_frame], f"({log_elided} unchanged elided)", f"and waited {(1000*log_waited)/44100:.2f} ms", "---", f"Time: {cur_time/1e6:5.3f} ms")
             log_frame = []
             log_waited = 0
+            log_elided = 0
 
-            if cur_time > last_time + 1:
-                for ch, data in enumerate(samples):
-                    write(wave_file[ch], sampling_rate, np.int16(data))
-                last_time = cur_time
+            if position >= last_flush + sampling_rate:
+                with profile.stage("wav write"):
+                    for data in samples:
+                        data.flush()            # append new samples and patch WAV header
+                last_flush = position
 
-            if max_time > 0 and max_time * 1e9 <= cur_time:
+            if max_time > 0 and max_time * sampling_rate <= position:
                 break
 
-    for ch, data in enumerate(samples):
-        write(wave_file[ch], sampling_rate, np.int16(data))
+    if CAPTURE == "strobe":
+        with profile.stage("resample"):
+            values = resampler.flush()
+        write_pcm(values)
+    with profile.stage("wav write"):
+        for data in samples:
+            data.close()
+    sample_file.close()
+
+    dut._log.info(f"Register writes: {registers.written}, elided: {registers.elided}")
+
+    stats = {
+        "vgm": os.path.basename(vgm_filename),
+        "capture": CAPTURE,
+        "output_rate": output_rate,
+        "samples": len(samples[0]),
+        "audio_time": len(samples[0]) / output_rate,
+        "sim_time_ns": cocotb.utils.get_sim_time(units="ns"),
+        "wall_time": time.time() - wall_start,
+        "wakeups": waits + 2 * registers.written,
+        "register_writes": registers.written,
+        "elided_writes": registers.elided,
+    }
+    stats["realtime_factor"] = stats["audio_time"] / stats["wall_time"] if stats["wall_time"] > 0 else 0
+    if cache:
+        cache.store(cache_key, dict(zip(channels, wave_file)), {"vgm": vgm_filename, "stats": stats})
+    dut._log.info(f"Recorded {stats['audio_time']:.2f} sec in {stats['wall_time']:.2f} sec, "
+                  f"x{stats['realtime_factor']:.3f} real time, {stats['wakeups']} Python wakeups")
+    if STATS:
+        with open(STATS, "w") as f:
+            json.dump(stats, f, indent=2)
+
+    profile.count("wakeups", waits)
+    profile.stop_cprofile()
+    if PROFILE:
+        dut._log.info("Time spent per stage:\n" + profile.report())
 
     await done(dut)
 
-async def reset(dut, nanoseconds_per_cycle):
+async def reset(dut, picoseconds_per_cycle):
     dut._log.info("start")
-    clock = Clock(dut.clk, nanoseconds_per_cycle, units="ns")
+    clock = Clock(dut.clk, picoseconds_per_cycle, units="ps")
     cocotb.start_soon(clock.start())
 
     dut.ui_in.value = 0 
@@ -244,17 +432,3 @@ async def reset(dut, nanoseconds_per_cycle):
 async def done(dut):
     await ClockCycles(dut.clk, 16)
     dut._log.info("DONE!")
-
-async def set_register(dut, reg, val):
-    dut.uio_in.value =       0b000001_11 # Latch register index
-    dut.ui_in.value  = reg & 15
-    await ClockCycles(dut.clk, 2)
-    print_chip_state(dut)
-    dut.uio_in.value =       0b000001_10 # Write value to register
-    dut.ui_in.value  = val
-    await ClockCycles(dut.clk, 1)
-    print_chip_state(dut)
-    dut.uio_in.value =       0b000001_00 # Inactivate: disable writes and trigger envelope restart, if last write was to Envelope register
-    dut.ui_in.value  = 0
-    await ClockCycles(dut.clk, 1)
-    print_chip_state(dut)
@@ -0,0 +1,358 @@
+# Loaders of AY register dumps: YM files (Atari ST) and PSG files (ZX Spectrum)
+#
+# Dumps are read straight into columnar arrays and converted into register timeline frames
+# (see timeline.py), so they play through the same path as VGM files.
+#
+# YM2!, YM3!, YM3b!  - 14 registers per frame, always interleaved (all frames of R0, then all frames of R1, ...)
+# YM5!, YM6!         - 16 registers per frame, interleaved or not, header with clock, frame rate and loop frame
+#                      Special effects (digidrums, SID voices, ...) stored in the spare bits are ignored.
+# PSG                - stream of register writes, 0xFF ends a frame, 0xFE n waits n*4 frames, 0xFD ends the tune
+#
+# YM files are usually packed into an LHA archive, -lh0- and -lh4- to -lh7- methods are decoded in Python.
+#
+# https://github.com/arnaud-carre/StSound/blob/main/YmLib/YmMusic.cpp
+# https://www.vgmpf.com/Wiki/index.php?title=YM
+# https://github.com/fragglet/lhasa/blob/master/lib/lh_new_decoder.c
+
+import os
+import struct
+from array import array
+import numpy as np
+
+from timeline import TIMELINE_DTYPE, REGISTERS, ENVELOPE_SHAPE, frames_from_commands
+
+SAMPLING_RATE = 44100           # same as VGM, frames are converted into waits in samples
+
+ATARI_ST_CLOCK = 2000000
+ZX_SPECTRUM_CLOCK = 1773400
+FRAME_RATE = 50
+
+# bits of the registers used by the chip, YM5!/YM6! keep special effects in the rest
+REGISTER_MASKS = np.array([0xFF, 0x0F, 0xFF, 0x0F, 0xFF, 0x0F, 0x1F, 0xFF,
+                           0x1F, 0x1F, 0x1F, 0xFF, 0xFF, 0x0F], dtype=np.uint8)
+NO_ENVELOPE_WRITE = 0xFF        # R13 value in YM files for frames that do not restart the envelope
+
+#
+# LHA decoder
+#
+
+LHA_METHODS = {
+    # method: (dictionary bits, number of position codes)
+    b"-lh0-": (0, 0),
+    b"-lh4-": (12, 14),
+    b"-lh5-": (13, 14),
+    b"-lh6-": (15, 16),
+    b"-lh7-": (16, 17),
+}
+
+def is_lha(data):
+    return len(data) > 21 and data[2:4] == b"-l" and data[6:7] == b"-"
+
+class _BitReader:
+    def __init__(self, data):
+        self.data = data
+        self.pos = 0
+        self.bitbuf = 0
+        self.bitcount = 0
+
+    def peek(self, n):
+        while self.bitcount < n:
+            byte = self.data[self.pos] if self.pos < len(self.data) else 0
+            self.pos += 1
+            self.bitbuf = (self.bitbuf << 8) | byte
+            self.bitcount += 8
+        return (self.bitbuf >> (self.bitcount - n)) & ((1 << n) - 1)
+
+    def skip(self, n):
+        self.bitcount -= n
+        self.bitbuf &= (1 << self.bitcount) - 1
+
+    def read(self, n):
+        if n == 0:
+            return 0
+        value = self.peek(n)
+        self.skip(n)
+        return value
+
+class _Huffman:
+    # Canonical Huffman code: codes are assigned in the order of length, then symbol.
+    # Decoded by a single lookup of the longest code length bits.
+    def __init__(self, lengths, symbol=None):
+        if symbol is not None:          # table with a single symbol, it takes no bits
+            self.bits = 0
+            self.table = [(symbol, 0)]
+            return
+        self.bits = max(lengths) if lengths else 0
+        self.table = [(0, 0)] * (1 << self.bits)
+        code = 0
+        for length in range(1, self.bits + 1):
+            for symbol, symbol_length in enumerate(lengths):
+                if symbol_length == length:
+                    span = 1 << (self.bits - length)
+                    start = code << (self.bits - length)
+                    self.table[start:start + span] = [(symbol, length)] * span
+                    code += 1
+            code <<= 1
+
+    def decode(self, bits):
+        symbol, length = self.table[bits.peek(self.bits)] if self.bits else self.table[0]
+        bits.skip(length)
+        return symbol
+
+def _read_pt_len(bits, count, nbit, special):
+    n = bits.read(nbit)
+    if n == 0:
+        return _Huffman(None, symbol=bits.read(nbit))
+    lengths = []
+    while len(lengths) < min(n, count):
+        length = bits.read(3)
+        if length == 7:
+            while bits.read(1):
+                length += 1
+        lengths.append(length)
+        if len(lengths) == special:
+            lengths += [0] * bits.read(2)
+    return _Huffman(lengths + [0] * (count - len(lengths)))
+
+def _read_c_len(bits, pt):
+    NC, CBIT = 510, 9
+    n = bits.read(CBIT)
+    if n == 0:
+        return _Huffman(None, symbol=bits.read(CBIT))
+    lengths = []
+    while len(lengths) < min(n, NC):
+        c = pt.decode(bits)
+        if c == 0:
+            lengths.append(0)
+        elif c == 1:
+            lengths += [0] * (bits.read(4) + 3)
+        elif c == 2:
+            lengths += [0] * (bits.read(CBIT) + 20)
+        else:
+            lengths.append(c - 2)
+    return _Huffman(lengths + [0] * (NC - len(lengths)))
+
+def lha_decode(data, original_size, method=b"-lh5-"):
+    # Decompresses -lhX- data (static Huffman coded LZ77 in blocks)
+    dictionary_bits, np_count = LHA_METHODS[method]
+    if dictionary_bits == 0:
+        return bytes(data[:original_size])
+    pbit = 4 if np_count <= 14 else 5
+    bits = _BitReader(data)
+    out = bytearray()
+    while len(out) < original_size:
+        block_size = bits.read(16)
+        pt = _read_pt_len(bits, 19, 5, 3)
+        c = _read_c_len(bits, pt)
+        p = _read_pt_len(bits, np_count, pbit, -1)
+        for _ in range(block_size):
+            symbol = c.decode(bits)
+            if symbol < 256:
+                out.append(symbol)
+                continue
+            length = symbol - 256 + 3
+            distance = p.decode(bits)
+            if distance > 0:
+                distance = (1 << (distance - 1)) + bits.read(distance - 1)
+            start = len(out) - distance - 1
+            if start < 0:
+                raise ValueError("LHA data refers before the start of the file")
+            if distance + 1 >= length:
+                out += out[start:start + length]
+            else:                       # overlapping copy repeats the last distance + 1 bytes
+                pattern = out[start:]
+                out += (pattern * (length // len(pattern) + 1))[:length]
+            if len(out) >= original_size:
+                break
+    return bytes(out[:original_size])
+
+def lha_extract(data):
+    # Returns (filename, contents) of the first file of an LHA archive, header levels 0, 1 and 2
+    level = data[20]
+    method = bytes(data[2:7])
+    if method not in LHA_METHODS:
+        raise ValueError(f"Unsupported LHA method {method}")
+    compressed_size, original_size = struct.unpack_from("<II", data, 7)
+    if level in (0, 1):
+        header_size = data[0] + 2
+        name = bytes(data[22:22 + data[21]]).decode("latin-1")
+        if level == 1:                  # extended headers are counted into the compressed size
+            next_size = struct.unpack_from("<H", data, header_size - 2)[0]
+            while next_size:
+                header_size += next_size
+                compressed_size -= next_size
+                next_size = struct.unpack_from("<H", data, header_size - 2)[0]
+    elif level == 2:
+        header_size = struct.unpack_from("<H", data, 0)[0]
+        name = ""
+        pos = 24
+        next_size = struct.unpack_from("<H", data, pos)[0]
+        while next_size:
+            if data[pos + 2] == 0x01:   # filename extended header
+                name = bytes(data[pos + 3:pos + next_size]).decode("latin-1")
+            pos += next_size
+            next_size = struct.unpack_from("<H", data, pos)[0]
+    else:
+        raise ValueError(f"Unsupported LHA header level {level}")
+    payload = memoryview(data)[header_size:header_size + compressed_size]
+    return name, lha_decode(payload, original_size, method)
+
+#
+# YM
+#
+
+def _frame_starts(count, frame_rate):
+    # Start of every frame in samples, rounded from the exact position, so that the rounding never accumulates
+    return (np.arange(count + 1, dtype=np.int64) * SAMPLING_RATE + frame_rate // 2) // frame_rate
+
+def frames_from_registers(registers, frame_rate):
+    # Register dump of shape (frames, 14) into timeline frames, registers are written when they change.
+    # R13 = 0xFF in a frame means no write to the Envelope Shape register, the envelope keeps going.
+    count = len(registers)
+    envelope_write = registers[:, ENVELOPE_SHAPE] != NO_ENVELOPE_WRITE
+    registers = registers[:, :REGISTERS] & REGISTER_MASKS
+    raw_envelope = registers[:, ENVELOPE_SHAPE]
+
+    frames = np.zeros(count, dtype=TIMELINE_DTYPE)
+    frames['registers'] = registers
+    # frames without an R13 write keep the shape of the last write
+    carry = np.maximum.accumulate(np.where(envelope_write, np.arange(count), -1))
+    frames['registers'][:, ENVELOPE_SHAPE] = np.where(carry >= 0, raw_envelope[np.maximum(carry, 0)], 0)
+
+    previous = np.vstack([np.zeros((1, REGISTERS), dtype=np.uint8), frames['registers'][:-1]])
+    changed = frames['registers'] != previous
+    changed[:, ENVELOPE_SHAPE] = envelope_write
+    frames['written'] = (changed.astype(np.uint16) << np.arange(REGISTERS, dtype=np.uint16)).sum(axis=1)
+
+    starts = _frame_starts(count, frame_rate)
+    frames['start'] = starts[:-1]
+    frames['wait'] = np.diff(starts)
+    return frames
+
+def _strings(data, pos, count):
+    strings = []
+    for _ in range(count):
+        end = data.index(b"\0", pos)
+        strings.append(bytes(data[pos:end]).decode("latin-1"))
+        pos = end + 1
+    return strings, pos
+
+def parse_ym(data, filename=""):
+    # Returns (frames, info) of an uncompressed YM file
+    magic = bytes(data[:4])
+    info = {"source": os.path.basename(filename), "sampling_rate": SAMPLING_RATE,
+            "clock_rate": ATARI_ST_CLOCK, "frame_rate": FRAME_RATE,
+            "snapshots": True}          # loops restore the full register state, see Timeline.commands()
+    if magic in (b"YM2!", b"YM3!"):
+        register_count, interleaved, loop_frame, pos = 14, True, 0, 4
+        frame_count = (len(data) - pos) // register_count
+    elif magic == b"YM3b":             # YM3! followed by the loop frame
+        register_count, interleaved, pos = 14, True, 4
+        frame_count = (len(data) - pos - 4) // register_count
+        loop_frame = struct.unpack_from("<I", data, len(data) - 4)[0]
+    elif magic in (b"YM5!", b"YM6!"):
+        if bytes(data[4:12]) != b"LeOnArD!":
+            raise ValueError(f"{filename}: invalid {magic.decode()} header")
+        frame_count, attributes, drum_count, clock_rate, frame_rate, loop_frame, extra_size = \
+            struct.unpack_from(">IIHIHIH", data, 12)
+        pos = 34 + extra_size
+        for _ in range(drum_count):     # digidrum samples are not played
+            pos += 4 + struct.unpack_from(">I", data, pos)[0]
+        (name, author, comment), pos = _strings(data, pos, 3)
+        register_count, interleaved = 16, bool(attributes & 1)
+        info.update(clock_rate=clock_rate, frame_rate=frame_rate, title=name, author=author, comment=comment)
+    else:
+        raise ValueError(f"{filename}: unsupported YM format {magic!r}")
+
+    dump = np.frombuffer(data, dtype=np.uint8, count=frame_count * register_count, offset=pos)
+    if interleaved:
+        registers = dump.reshape(register_count, frame_count).T
+    else:
+        registers = dump.reshape(frame_count, register_count)
+    frames = frames_from_registers(registers, info["frame_rate"])
+    info["total_samples"] = int(frames['wait'].sum())
+    info["loop_frame"] = loop_frame if loop_frame < frame_count else 0
+    return frames, info
+
+def load_ym(filename):
+    with open(filename, "rb") as f:
+        data = f.read()
+    if is_lha(data):
+        _, data = lha_extract(data)
+    return parse_ym(data, filename)
+
+#
+# PSG
+#
+
+PSG_END_OF_FRAME = 0xFF
+PSG_WAIT_FRAMES = 0xFE
+PSG_END_OF_MUSIC = 0xFD
+PSG_HEADER_SIZE = 16
+
+def parse_psg(data, filename=""):
+    # Returns (frames, info) of a PSG file. The stream is walked once storing only the offsets of the commands,
+    # operands are gathered by NumPy and turned into frames the same way as VGM commands.
+    if bytes(data[:4]) != b"PSG\x1a":
+        raise ValueError(f"{filename}: not a PSG file")
+    offsets = array('I')
+    append = offsets.append
+    pos, end = PSG_HEADER_SIZE, len(data)
+    while pos < end:
+        command = data[pos]
+        if command == PSG_END_OF_MUSIC:
+            break
+        append(pos)
+        if command == PSG_END_OF_FRAME:
+            pos += 1
+        elif command == PSG_WAIT_FRAMES or command < 16:
+            pos += 2
+        else:
+            raise ValueError(f"{filename}: unsupported PSG command 0x{command:02x} at 0x{pos:x}")
+    offsets = np.frombuffer(offsets, dtype=np.uint32).astype(np.int64)
+    if len(offsets) and offsets[-1] + 1 >= end and data[offsets[-1]] != PSG_END_OF_FRAME:
+        offsets = offsets[:-1]          # truncated command at the end of file
+
+    raw = np.frombuffer(data, dtype=np.uint8)
+    command = raw[offsets]
+    operand = raw.take(offsets + 1, mode='clip')
+    is_write = command < 16
+    frames_waited = np.where(command == PSG_END_OF_FRAME, 1,
+                             np.where(command == PSG_WAIT_FRAMES, 4 * operand.astype(np.int64), 0))
+
+    # frames become VGM like columns: 0xA0 register writes and 0x61 waits (see timeline.frames_from_commands),
+    # wait is the number of frames for now and converted into samples below
+    vgm_command = np.where(is_write, 0xA0, 0x61).astype(np.uint8)
+    registers = np.where(is_write, command & 15, 0).astype(np.uint8)
+    values = np.where(is_write, operand & np.append(REGISTER_MASKS, [0xFF, 0xFF])[registers], 0).astype(np.uint8)
+    frames, _ = frames_from_commands(vgm_command, registers, values, frames_waited)
+
+    frame_number = np.concatenate([[0], np.cumsum(frames['wait'].astype(np.int64))])
+    starts = _frame_starts(int(frame_number[-1]), FRAME_RATE)[frame_number]
+    frames['start'] = starts[:-1]
+    frames['wait'] = np.diff(starts)
+    info = {
+        "source": os.path.basename(filename),
+        "clock_rate": ZX_SPECTRUM_CLOCK,
+        "sampling_rate": SAMPLING_RATE,
+        "frame_rate": FRAME_RATE,
+        "total_samples": int(starts[-1]),
+        "loop_frame": 0,
+        "snapshots": True,
+    }
+    return frames, info
+
+def load_psg(filename):
+    with open(filename, "rb") as f:
+        data = f.read()
+    return parse_psg(data, filename)
+
+def load(filename):
+    # YM or PSG file by its contents
+    with open(filename, "rb") as f:
+        data = f.read()
+    if is_lha(data):
+        _, data = lha_extract(data)
+    if bytes(data[:4]) == b"PSG\x1a":
+        return parse_psg(data, filename)
+    return parse_ym(data, filename)
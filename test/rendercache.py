@@ -0,0 +1,132 @@
+# Content-addressed cache of record.py renders
+#
+# A render is identified by the contents of the VGM file, the contents of the RTL (src/*.v and tb.v)
+# and the render options, including the simulator and the .json sidecar of a register timeline. Renders with the same key produce the same WAV files, so record.py
+# copies the cached files instead of running the simulation.
+#
+# Every entry is a directory named after the key holding one WAV file per channel and meta.json.
+# The modification time of meta.json is the last use of the entry, least recently used entries
+# are evicted once the total size of the cache exceeds the limit.
+
+import glob
+import hashlib
+import json
+import os
+import shutil
+
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(TEST_DIR, "..", "src")
+
+# bump when record.py starts rendering the same inputs differently (resampling, PCM conversion, ...)
+RENDER_FORMAT = 1
+
+def file_hash(filename, hasher=None):
+    # filename can be a buffer holding the file as well, see vgmpack.py
+    hasher = hasher or hashlib.sha256()
+    if isinstance(filename, (bytes, bytearray, memoryview)):
+        hasher.update(filename)
+        return hasher
+    with open(filename, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            hasher.update(chunk)
+    return hasher
+
+_rtl_hash = None
+def rtl_hash():
+    # RTL does not change while the simulation runs, hash it just once
+    global _rtl_hash
+    if _rtl_hash is None:
+        hasher = hashlib.sha256()
+        for filename in sorted(glob.glob(os.path.join(SRC_DIR, "*.v"))) + [os.path.join(TEST_DIR, "tb.v")]:
+            hasher.update(os.path.basename(filename).encode() + b"\0")
+            file_hash(filename, hasher)
+        _rtl_hash = hasher.hexdigest()
+    return _rtl_hash
+
+def render_key(vgm_filename, options):
+    # options: dict of the render options that change the output, must be JSON serializable
+    key = {
+        "format": RENDER_FORMAT,
+        "vgm": file_hash(vgm_filename).hexdigest(),
+        "rtl": rtl_hash(),
+        "options": options,
+    }
+    return hashlib.sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()
+
+class RenderCache:
+    def __init__(self, directory, max_bytes):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def entry_dir(self, key):
+        return os.path.join(self.directory, key)
+
+    def lookup(self, key, channels):
+        # Returns the metadata of the cached render or None, if some of the channels are not cached
+        entry = self.entry_dir(key)
+        try:
+            with open(os.path.join(entry, "meta.json")) as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not all(os.path.exists(os.path.join(entry, f"{channel}.wav")) for channel in channels):
+            return None
+        os.utime(os.path.join(entry, "meta.json"))          # mark as recently used
+        return meta
+
+    def restore(self, key, wave_files):
+        # wave_files: {channel: destination filename}
+        entry = self.entry_dir(key)
+        for channel, filename in wave_files.items():
+            shutil.copyfile(os.path.join(entry, f"{channel}.wav"), filename)
+
+    def store(self, key, wave_files, meta):
+        # Entry is assembled in a temporary directory and renamed, so parallel renders never see partial entries
+        entry = self.entry_dir(key)
+        temp = os.path.join(self.directory, f".{key}.{os.getpid()}")
+        os.makedirs(temp, exist_ok=True)
+        for channel, filename in wave_files.items():
+            shutil.copyfile(filename, os.path.join(temp, f"{channel}.wav"))
+        with open(os.path.join(temp, "meta.json"), "w") as f:
+            json.dump(meta, f, indent=2)
+        if os.path.exists(entry):
+            shutil.rmtree(entry, ignore_errors=True)        # stale entry with fewer channels
+        try:
+            os.rename(temp, entry)
+        except OSError:
+            shutil.rmtree(temp, ignore_errors=True)         # same render was stored by another process
+        self.evict(keep=key)
+
+    def entries(self):
+        # Returns [(last use, size in bytes, key)] of all the entries
+        entries = []
+        for key in os.listdir(self.directory):
+            entry = self.entry_dir(key)
+            if key.startswith(".") or not os.path.isdir(entry):
+                continue
+            try:
+                last_use = os.path.getmtime(os.path.join(entry, "meta.json"))
+                size = sum(os.path.getsize(os.path.join(entry, name)) for name in os.listdir(entry))
+            except OSError:
+                continue                                    # evicted by another process meanwhile
+            entries.append((last_use, size, key))
+        return entries
+
+    def size(self):
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self, keep=None):
+        # Removes least recently used entries until the cache fits into max_bytes, returns the evicted keys
+        entries = sorted(self.entries())
+        total = sum(size for _, size, _ in entries)
+        evicted = []
+        for _, size, key in entries:
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            shutil.rmtree(self.entry_dir(key), ignore_errors=True)
+            total -= size
+            evicted.append(key)
+        return evicted
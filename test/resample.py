@@ -0,0 +1,84 @@
+# Streaming band-limited resampler
+#
+# Converts the chip output captured at its native strobe rate (master clock / 8) into
+# the usual audio rates like 44.1, 48 or 96 kHz.
+#
+# Every output sample is a Kaiser windowed sinc interpolation of the input evaluated at
+# the exact (rational) position of the output sample, so timing never drifts regardless of
+# the length of the recording. Input can be fed in chunks of any size.
+#
+# Output positions repeat their fractional part every step_den output samples, so the kernel of
+# every phase is computed once into a polyphase table (ratios with more than max_phases phases round
+# the phase down to one of max_phases phases). Output is interpolated in blocks to keep memory bounded.
+
+from fractions import Fraction
+import math
+import numpy as np
+
+class Resampler:
+    def __init__(self, input_rate, output_rate, channels=1, zero_crossings=16, rolloff=0.9, beta=8.6,
+                 max_phases=4096, block_size=4096):
+        step = Fraction(input_rate) / Fraction(output_rate)    # input samples per output sample
+        self.step_num = step.numerator
+        self.step_den = step.denominator
+        self.cutoff = 0.5 * rolloff * min(1.0, 1 / float(step))  # in cycles per input sample
+        self.half_width = math.ceil(zero_crossings / (2 * self.cutoff))
+        self.beta = beta
+        self.channels = channels
+        self.block_size = block_size
+
+        self.phases = min(self.step_den, max_phases)
+        self.taps = np.arange(-self.half_width + 1, self.half_width + 1, dtype=np.int64)
+        self.table = self.kernel(self.taps[None, :] - (np.arange(self.phases) / self.phases)[:, None])
+        self.table /= self.table.sum(axis=1, keepdims=True)     # keep DC level exact
+
+        # input before the start of the stream is treated as silence
+        self.history = np.zeros((channels, self.half_width))
+        self.history_start = -self.half_width  # absolute index of the first sample in history
+        self.inputs = 0
+        self.outputs = 0
+
+    def kernel(self, x):
+        t = x / self.half_width
+        window = np.i0(self.beta * np.sqrt(np.clip(1 - t * t, 0, 1))) / np.i0(self.beta)
+        return 2 * self.cutoff * np.sinc(2 * self.cutoff * x) * window
+
+    def interpolate(self, count):
+        out = np.empty((self.channels, count))
+        for block in range(0, count, self.block_size):
+            n = np.arange(self.outputs + block, self.outputs + min(count, block + self.block_size), dtype=np.int64)
+            position = n * self.step_num // self.step_den
+            phase = (n * self.step_num % self.step_den) * self.phases // self.step_den
+
+            index = position[:, None] + (self.taps - self.history_start)[None, :]   # shape: outputs, taps
+            weights = self.table[phase]
+            for channel in range(self.channels):
+                out[channel, block:block + len(n)] = np.einsum('nk,nk->n', self.history[channel][index], weights)
+        self.outputs += count
+        return out
+
+    def process(self, samples):
+        # Feeds input samples of shape (channels, n) and returns all the output samples
+        # that can be computed so far, shape (channels, m)
+        samples = np.asarray(samples, dtype=np.float64).reshape(self.channels, -1)
+        self.history = np.concatenate([self.history, samples], axis=1)
+        self.inputs += samples.shape[1]
+
+        # output sample n needs input up to position(n) + half_width
+        available = self.history_start + self.history.shape[1] - self.half_width
+        count = max(0, (available * self.step_den + self.step_num - 1) // self.step_num - self.outputs) if available > 0 else 0
+        out = self.interpolate(count)
+
+        # drop the input that is not needed anymore
+        next_position = self.outputs * self.step_num // self.step_den
+        drop = next_position - self.half_width + 1 - self.history_start
+        if drop > 0:
+            self.history = self.history[:, drop:]
+            self.history_start += drop
+        return out
+
+    def flush(self):
+        # Returns the remaining output samples, input after the end of the stream is treated as silence
+        total = self.inputs * self.step_den // self.step_num   # output samples covering the whole input
+        self.history = np.concatenate([self.history, np.zeros((self.channels, self.half_width + 1))], axis=1)
+        return self.interpolate(max(0, total - self.outputs))
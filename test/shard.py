@@ -0,0 +1,111 @@
+# Runs the tests from test.py sharded across several simulator processes in parallel
+#
+# The design is compiled once, every shard gets its own copy of the compiled design and its own
+# working directory under shards/, results of all the shards are merged into results.xml.
+#
+# How to run this script from command line:
+#
+# python shard.py                   # as many shards as CPU cores
+# python shard.py --shards 4 --sim verilator
+#
+
+import argparse
+import ast
+import os
+import shutil
+import subprocess
+import sys
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+
+from batch import TEST_DIR, compile_design, sim_build_dir
+
+def list_tests(module):
+    # Names of the @cocotb.test() coroutines in the order they are declared
+    tree = ast.parse(open(os.path.join(TEST_DIR, f"{module}.py")).read())
+    tests = []
+    for node in tree.body:
+        if isinstance(node, ast.AsyncFunctionDef):
+            for decorator in node.decorator_list:
+                if isinstance(decorator, ast.Call) and ast.unparse(decorator.func) == "cocotb.test":
+                    tests.append(node.name)
+    return tests
+
+def run_shard(index, tests, module, sim, shards_dir):
+    work_dir = os.path.join(shards_dir, str(index))
+    sim_build = os.path.join(work_dir, "sim_build")
+    if os.path.exists(sim_build):
+        shutil.rmtree(sim_build)
+    shutil.copytree(sim_build_dir(sim), sim_build)
+
+    env = dict(os.environ)
+    env.update({
+        "PWD": TEST_DIR,                # Makefile locates ../src and tb.v relative to $(PWD)
+        "PYTHONPATH": os.pathsep.join([TEST_DIR, env.get("PYTHONPATH", "")]),
+        "TESTCASE": ",".join(tests),
+        "COCOTB_RESULTS_FILE": os.path.join(work_dir, "results.xml"),
+    })
+    command = ["make", "-f", os.path.join(TEST_DIR, "Makefile"),
+               f"SIM={sim}", f"SIM_BUILD={sim_build}", f"MODULE={module}"]
+
+    start = time.time()
+    with open(os.path.join(work_dir, "log.txt"), "w") as log:
+        result = subprocess.run(command, cwd=work_dir, env=env, stdout=log, stderr=subprocess.STDOUT)
+    return {
+        "shard": index,
+        "tests": tests,
+        "returncode": result.returncode,
+        "wall_time": time.time() - start,
+        "results": env["COCOTB_RESULTS_FILE"],
+        "log": os.path.join(work_dir, "log.txt"),
+    }
+
+def merge_results(results_files, output):
+    # cocotb writes one <testsuite> per run, merged file holds the test suites of all the shards
+    merged = ET.Element("testsuites", name="results")
+    for filename in results_files:
+        if os.path.exists(filename):
+            merged.extend(ET.parse(filename).getroot())
+    ET.ElementTree(merged).write(output, encoding="UTF-8", xml_declaration=True)
+    return merged
+
+def main():
+    parser = argparse.ArgumentParser(description="Run cocotb tests sharded across several simulator processes")
+    parser.add_argument("--shards", type=int, default=os.cpu_count(), help="number of simulator processes")
+    parser.add_argument("--module", default=os.environ.get("MODULE", "test"))
+    parser.add_argument("--sim", default=os.environ.get("SIM", "icarus"))
+    parser.add_argument("--shards-dir", default=os.path.join(TEST_DIR, "shards"))
+    parser.add_argument("--results", default=os.path.join(TEST_DIR, "results.xml"))
+    args = parser.parse_args()
+
+    tests = list_tests(args.module)
+    shards = [tests[i::args.shards] for i in range(min(args.shards, len(tests)))]
+    for index in range(len(shards)):
+        os.makedirs(os.path.join(args.shards_dir, str(index)), exist_ok=True)
+
+    print(f"Compiling design for {args.sim} ...")
+    compile_design(args.sim)
+
+    start = time.time()
+    with ThreadPoolExecutor(max_workers=len(shards)) as pool:   # every shard is a separate make process already
+        runs = list(pool.map(lambda shard: run_shard(shard[0], shard[1], args.module, args.sim, args.shards_dir),
+                             enumerate(shards)))
+    wall_time = time.time() - start
+
+    merged = merge_results([run["results"] for run in runs], args.results)
+    testcases = merged.findall(".//testcase")
+    failures = [testcase.get("name") for testcase in testcases if testcase.find("failure") is not None]
+
+    for run in runs:
+        status = "ok  " if run["returncode"] == 0 else "FAIL"
+        print(f"shard {run['shard']:2d} {status} {run['wall_time']:7.1f}s {len(run['tests']):3d} tests  see {run['log']}")
+    print(f"Ran {len(testcases)} of {len(tests)} tests in {len(shards)} shards in {wall_time:.1f}s, "
+          f"{len(failures)} failed" + (": " + ", ".join(failures) if failures else ""))
+    print(f"Results merged into {args.results}")
+
+    ok = not failures and len(testcases) == len(tests) and all(run["returncode"] == 0 for run in runs)
+    return 0 if ok else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
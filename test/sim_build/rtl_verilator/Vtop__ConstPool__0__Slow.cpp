@@ -0,0 +1,49 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Constant pool
+
+#include "verilated.h"
+
+extern const VlWide<64>/*2047:0*/ Vtop__ConstPool__CONST_h600f46a4_0 = VlWide<64>{{
+        0x2e686578, 0x00627573, 0x00000000, 0x00000000,
+        0x00000000, 0x00000000, 0x00000000, 0x00000000,
+        0x00000000, 0x00000000, 0x00000000, 0x00000000,
+        0x00000000, 0x00000000, 0x00000000, 0x00000000,
+        0x00000000, 0x00000000, 0x00000000, 0x00000000,
+        0x00000000, 0x00000000, 0x00000000, 0x00000000,
+        0x00000000, 0x00000000, 0x00000000, 0x00000000,
+        0x00000000, 0x00000000, 0x00000000, 0x00000000,
+        0x00000000, 0x00000000, 0x00000000, 0x00000000,
+        0x00000000, 0x00000000, 0x00000000, 0x00000000,
+        0x00000000, 0x00000000, 0x00000000, 0x00000000,
+        0x00000000, 0x00000000, 0x00000000, 0x00000000,
+        0x00000000, 0x00000000, 0x00000000, 0x00000000,
+        0x00000000, 0x00000000, 0x00000000, 0x00000000,
+        0x00000000, 0x00000000, 0x00000000, 0x00000000,
+        0x00000000, 0x00000000, 0x00000000, 0x00000000
+}};
+
+extern const VlWide<64>/*2047:0*/ Vtop__ConstPool__CONST_hdf66760e_0 = VlWide<64>{{
+        0x2e747874, 0x706c6573, 0x0073616d, 0x00000000,
+        0x00000000, 0x00000000, 0x00000000, 0x00000000,
+        0x00000000, 0x00000000, 0x00000000, 0x00000000,
+        0x00000000, 0x00000000, 0x00000000, 0x00000000,
+        0x00000000, 0x00000000, 0x00000000, 0x00000000,
+        0x00000000, 0x00000000, 0x00000000, 0x00000000,
+        0x00000000, 0x00000000, 0x00000000, 0x00000000,
+        0x00000000, 0x00000000, 0x00000000, 0x00000000,
+        0x00000000, 0x00000000, 0x00000000, 0x00000000,
+        0x00000000, 0x00000000, 0x00000000, 0x00000000,
+        0x00000000, 0x00000000, 0x00000000, 0x00000000,
+        0x00000000, 0x00000000, 0x00000000, 0x00000000,
+        0x00000000, 0x00000000, 0x00000000, 0x00000000,
+        0x00000000, 0x00000000, 0x00000000, 0x00000000,
+        0x00000000, 0x00000000, 0x00000000, 0x00000000,
+        0x00000000, 0x00000000, 0x00000000, 0x00000000
+}};
+
+extern const VlUnpacked<CData/*7:0*/, 32> Vtop__ConstPool__TABLE_hfa54f15d_0 = {{
+    0U, 0U, 0U, 2U, 0U, 3U, 0U, 4U,
+    0U, 5U, 0U, 8U, 0U, 0x0bU, 0U, 0x10U,
+    0U, 0x16U, 0U, 0x1fU, 0U, 0x2dU, 0U, 0x3fU,
+    0U, 0x5aU, 0U, 0x7fU, 0U, 0xb4U, 0U, 0xffU
+}};
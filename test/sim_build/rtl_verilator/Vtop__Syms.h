@@ -0,0 +1,64 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Symbol table internal header
+//
+// Internal details; most calling programs do not need this header,
+// unless using verilator public meta comments.
+
+#ifndef VERILATED_VTOP__SYMS_H_
+#define VERILATED_VTOP__SYMS_H_  // guard
+
+#include "verilated.h"
+
+// INCLUDE MODEL CLASS
+
+#include "Vtop.h"
+
+// INCLUDE MODULE CLASSES
+#include "Vtop___024root.h"
+
+// DPI TYPES for DPI Export callbacks (Internal use)
+
+// SYMS CLASS (contains all model state)
+class alignas(VL_CACHE_LINE_BYTES) Vtop__Syms final : public VerilatedSyms {
+  public:
+    // INTERNAL STATE
+    Vtop* const __Vm_modelp;
+    VlDeleter __Vm_deleter;
+    bool __Vm_didInit = false;
+
+    // MODULE INSTANCE STATE
+    Vtop___024root                 TOP;
+
+    // SCOPE NAMES
+    VerilatedScope* __Vscopep_tb;
+    VerilatedScope* __Vscopep_tb__tt_um_rejunity_ay8913_uut;
+    VerilatedScope* __Vscopep_tb__tt_um_rejunity_ay8913_uut__attenuation_A;
+    VerilatedScope* __Vscopep_tb__tt_um_rejunity_ay8913_uut__attenuation_B;
+    VerilatedScope* __Vscopep_tb__tt_um_rejunity_ay8913_uut__attenuation_C;
+    VerilatedScope* __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator;
+    VerilatedScope* __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator__signal_edge;
+    VerilatedScope* __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator__tone;
+    VerilatedScope* __Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator;
+    VerilatedScope* __Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator__signal_edge;
+    VerilatedScope* __Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator__tone;
+    VerilatedScope* __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_A;
+    VerilatedScope* __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_B;
+    VerilatedScope* __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_C;
+    VerilatedScope* __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_master;
+    VerilatedScope* __Vscopep_tb__tt_um_rejunity_ay8913_uut__tone_A_generator;
+    VerilatedScope* __Vscopep_tb__tt_um_rejunity_ay8913_uut__tone_B_generator;
+    VerilatedScope* __Vscopep_tb__tt_um_rejunity_ay8913_uut__tone_C_generator;
+    VerilatedScope* __Vscopep_tb__tt_um_rejunity_ay8913_uut__unnamedblk1;
+
+    // SCOPE HIERARCHY
+    VerilatedHierarchy __Vhier;
+
+    // CONSTRUCTORS
+    Vtop__Syms(VerilatedContext* contextp, const char* namep, Vtop* modelp);
+    ~Vtop__Syms();
+
+    // METHODS
+    const char* name() const { return TOP.vlNamep; }
+};
+
+#endif  // guard
@@ -0,0 +1,346 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Symbol table implementation internals
+
+#include "Vtop__pch.h"
+
+Vtop__Syms::Vtop__Syms(VerilatedContext* contextp, const char* namep, Vtop* modelp)
+    : VerilatedSyms{contextp}
+    // Setup internal state of the Syms class
+    , __Vm_modelp{modelp}
+    // Setup top module instance
+    , TOP{this, namep}
+{
+    // Check resources
+    Verilated::stackCheck(796);
+    // Setup sub module instances
+    // Configure time unit / time precision
+    _vm_contextp__->timeunit(-9);
+    _vm_contextp__->timeprecision(-12);
+    // Setup each module's pointers to their submodules
+    // Setup each module's pointer back to symbol table (for public functions)
+    TOP.__Vconfigure(true);
+    // Setup scopes
+    __Vscopep_tb = new VerilatedScope{this, "tb", "tb", "tb", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut = new VerilatedScope{this, "tb.tt_um_rejunity_ay8913_uut", "tt_um_rejunity_ay8913_uut", "tt_um_rejunity_ay8913", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__attenuation_A = new VerilatedScope{this, "tb.tt_um_rejunity_ay8913_uut.attenuation_A", "attenuation_A", "attenuation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__attenuation_B = new VerilatedScope{this, "tb.tt_um_rejunity_ay8913_uut.attenuation_B", "attenuation_B", "attenuation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__attenuation_C = new VerilatedScope{this, "tb.tt_um_rejunity_ay8913_uut.attenuation_C", "attenuation_C", "attenuation", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator = new VerilatedScope{this, "tb.tt_um_rejunity_ay8913_uut.envelope_generator", "envelope_generator", "envelope", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator__signal_edge = new VerilatedScope{this, "tb.tt_um_rejunity_ay8913_uut.envelope_generator.signal_edge", "signal_edge", "signal_edge", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator__tone = new VerilatedScope{this, "tb.tt_um_rejunity_ay8913_uut.envelope_generator.tone", "tone", "tone", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator = new VerilatedScope{this, "tb.tt_um_rejunity_ay8913_uut.noise_generator", "noise_generator", "noise", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator__signal_edge = new VerilatedScope{this, "tb.tt_um_rejunity_ay8913_uut.noise_generator.signal_edge", "signal_edge", "signal_edge", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator__tone = new VerilatedScope{this, "tb.tt_um_rejunity_ay8913_uut.noise_generator.tone", "tone", "tone", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_A = new VerilatedScope{this, "tb.tt_um_rejunity_ay8913_uut.pwm_A", "pwm_A", "pwm", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_B = new VerilatedScope{this, "tb.tt_um_rejunity_ay8913_uut.pwm_B", "pwm_B", "pwm", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_C = new VerilatedScope{this, "tb.tt_um_rejunity_ay8913_uut.pwm_C", "pwm_C", "pwm", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_master = new VerilatedScope{this, "tb.tt_um_rejunity_ay8913_uut.pwm_master", "pwm_master", "pwm", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__tone_A_generator = new VerilatedScope{this, "tb.tt_um_rejunity_ay8913_uut.tone_A_generator", "tone_A_generator", "tone", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__tone_B_generator = new VerilatedScope{this, "tb.tt_um_rejunity_ay8913_uut.tone_B_generator", "tone_B_generator", "tone", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__tone_C_generator = new VerilatedScope{this, "tb.tt_um_rejunity_ay8913_uut.tone_C_generator", "tone_C_generator", "tone", -9, VerilatedScope::SCOPE_MODULE};
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__unnamedblk1 = new VerilatedScope{this, "tb.tt_um_rejunity_ay8913_uut.unnamedblk1", "unnamedblk1", "<null>", -9, VerilatedScope::SCOPE_OTHER};
+    // Set up scope hierarchy
+    __Vhier.add(0, __Vscopep_tb);
+    __Vhier.add(__Vscopep_tb, __Vscopep_tb__tt_um_rejunity_ay8913_uut);
+    __Vhier.add(__Vscopep_tb__tt_um_rejunity_ay8913_uut, __Vscopep_tb__tt_um_rejunity_ay8913_uut__attenuation_A);
+    __Vhier.add(__Vscopep_tb__tt_um_rejunity_ay8913_uut, __Vscopep_tb__tt_um_rejunity_ay8913_uut__attenuation_B);
+    __Vhier.add(__Vscopep_tb__tt_um_rejunity_ay8913_uut, __Vscopep_tb__tt_um_rejunity_ay8913_uut__attenuation_C);
+    __Vhier.add(__Vscopep_tb__tt_um_rejunity_ay8913_uut, __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator);
+    __Vhier.add(__Vscopep_tb__tt_um_rejunity_ay8913_uut, __Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator);
+    __Vhier.add(__Vscopep_tb__tt_um_rejunity_ay8913_uut, __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_A);
+    __Vhier.add(__Vscopep_tb__tt_um_rejunity_ay8913_uut, __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_B);
+    __Vhier.add(__Vscopep_tb__tt_um_rejunity_ay8913_uut, __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_C);
+    __Vhier.add(__Vscopep_tb__tt_um_rejunity_ay8913_uut, __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_master);
+    __Vhier.add(__Vscopep_tb__tt_um_rejunity_ay8913_uut, __Vscopep_tb__tt_um_rejunity_ay8913_uut__tone_A_generator);
+    __Vhier.add(__Vscopep_tb__tt_um_rejunity_ay8913_uut, __Vscopep_tb__tt_um_rejunity_ay8913_uut__tone_B_generator);
+    __Vhier.add(__Vscopep_tb__tt_um_rejunity_ay8913_uut, __Vscopep_tb__tt_um_rejunity_ay8913_uut__tone_C_generator);
+    __Vhier.add(__Vscopep_tb__tt_um_rejunity_ay8913_uut, __Vscopep_tb__tt_um_rejunity_ay8913_uut__unnamedblk1);
+    __Vhier.add(__Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator, __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator__signal_edge);
+    __Vhier.add(__Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator, __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator__tone);
+    __Vhier.add(__Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator, __Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator__signal_edge);
+    __Vhier.add(__Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator, __Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator__tone);
+    // Setup export functions - final: 0
+    // Setup export functions - final: 1
+    // Setup public variables
+    __Vscopep_tb->varInsert("bus_count", &(TOP.tb__DOT__bus_count), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,31,0);
+    __Vscopep_tb->varInsert("bus_done", &(TOP.tb__DOT__bus_done), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb->varInsert("bus_filename", &(TOP.tb__DOT__bus_filename), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,2047,0);
+    __Vscopep_tb->varInsert("bus_index", &(TOP.tb__DOT__bus_index), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_tb->varInsert("bus_restarts", &(TOP.tb__DOT__bus_restarts), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,31,0);
+    __Vscopep_tb->varInsert("bus_start", &(TOP.tb__DOT__bus_start), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb->varInsert("bus_stimulus", &(TOP.tb__DOT__bus_stimulus), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW, 1, 1 ,0,65535 ,15,0);
+    __Vscopep_tb->varInsert("clk", &(TOP.tb__DOT__clk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb->varInsert("ena", &(TOP.tb__DOT__ena), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb->varInsert("rst_n", &(TOP.tb__DOT__rst_n), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb->varInsert("sample_channels", &(TOP.tb__DOT__sample_channels), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,5,0);
+    __Vscopep_tb->varInsert("sample_count", &(TOP.tb__DOT__sample_count), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,31,0);
+    __Vscopep_tb->varInsert("sample_cycles", &(TOP.tb__DOT__sample_cycles), false, VLVT_UINT64, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,63,0);
+    __Vscopep_tb->varInsert("sample_done", &(TOP.tb__DOT__sample_done), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb->varInsert("sample_file", &(TOP.tb__DOT__sample_file), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_tb->varInsert("sample_filename", &(TOP.tb__DOT__sample_filename), false, VLVT_WDATA, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,2047,0);
+    __Vscopep_tb->varInsert("sample_index", &(TOP.tb__DOT__sample_index), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_tb->varInsert("sample_noise", &(TOP.tb__DOT__sample_noise), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb->varInsert("sample_period_ps", &(TOP.tb__DOT__sample_period_ps), false, VLVT_UINT64, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,63,0);
+    __Vscopep_tb->varInsert("sample_rewind", &(TOP.tb__DOT__sample_rewind), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_tb->varInsert("sample_start", &(TOP.tb__DOT__sample_start), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb->varInsert("sample_strobes", &(TOP.tb__DOT__sample_strobes), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb->varInsert("sample_until", &(TOP.tb__DOT__sample_until), false, VLVT_UINT64, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,63,0);
+    __Vscopep_tb->varInsert("ui_in", &(TOP.tb__DOT__ui_in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_tb->varInsert("uio_in", &(TOP.tb__DOT__uio_in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_tb->varInsert("uio_oe", &(TOP.tb__DOT__uio_oe), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_tb->varInsert("uio_out", &(TOP.tb__DOT__uio_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_tb->varInsert("uo_out", &(TOP.tb__DOT__uo_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("CHANNEL_OUTPUT_BITS", const_cast<void*>(static_cast<const void*>(&(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__CHANNEL_OUTPUT_BITS))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("DA7_DA4_UPPER_ADDRESS_MASK", const_cast<void*>(static_cast<const void*>(&(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__DA7_DA4_UPPER_ADDRESS_MASK))), true, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,3,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("MASTER_ACCUMULATOR_BITS", const_cast<void*>(static_cast<const void*>(&(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__MASTER_ACCUMULATOR_BITS))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("MASTER_MAX_OUTPUT_VOLUME", const_cast<void*>(static_cast<const void*>(&(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__MASTER_MAX_OUTPUT_VOLUME))), true, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("MASTER_OUTPUT_BITS", const_cast<void*>(static_cast<const void*>(&(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__MASTER_OUTPUT_BITS))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("REGISTERS", const_cast<void*>(static_cast<const void*>(&(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__REGISTERS))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("_unused", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT___unused), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("active", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__active), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("amplitude_A", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__amplitude_A), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,3,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("amplitude_B", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__amplitude_B), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,3,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("amplitude_C", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__amplitude_C), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,3,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("bc1", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bc1), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("bdir", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bdir), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("bus_inactive", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bus_inactive), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("bus_latch_reg", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bus_latch_reg), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("bus_read", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bus_read), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("bus_write", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bus_write), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("channel_A", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__channel_A), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("channel_B", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__channel_B), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("channel_C", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__channel_C), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("clk", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("clk_counter", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk_counter), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,6,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("clk_master_strobe", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk_master_strobe), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("cs", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__cs), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("data", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__data), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,7,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("ena", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__ena), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("envelope", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,3,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("envelope_A", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_A), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("envelope_B", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_B), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("envelope_C", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_C), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("envelope_alternate", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_alternate), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("envelope_attack", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_attack), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("envelope_continue", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_continue), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("envelope_hold", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_hold), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("envelope_period", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_period), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,15,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("latch", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__latch), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("latched_register", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__latched_register), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,3,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("master", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__master), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,8,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("master_clock_control", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__master_clock_control), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,1,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("master_overflow", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__master_overflow), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("noise", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("noise_disable_A", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_disable_A), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("noise_disable_B", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_disable_B), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("noise_disable_C", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_disable_C), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("noise_period", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_period), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,4,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("register", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 1, 1 ,15,0 ,7,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("reset", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__reset), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("restart_envelope", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__restart_envelope), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("rst_n", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__rst_n), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("tone_A", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("tone_B", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("tone_C", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("tone_disable_A", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_disable_A), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("tone_disable_B", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_disable_B), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("tone_disable_C", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_disable_C), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("tone_period_A", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_period_A), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,11,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("tone_period_B", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_period_B), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,11,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("tone_period_C", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_period_C), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,11,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("ui_in", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__ui_in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("uio_in", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__uio_in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("uio_oe", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__uio_oe), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,7,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("uio_out", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__uio_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,7,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("uo_out", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__uo_out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,7,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("volume_A", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_A), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("volume_B", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_B), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("volume_C", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_C), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut->varInsert("write", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__write), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__attenuation_A->varInsert("CONTROL_BITS", const_cast<void*>(static_cast<const void*>(&(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_A__DOT__CONTROL_BITS))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__attenuation_A->varInsert("MAX_VOLUME", const_cast<void*>(static_cast<const void*>(&(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_A__DOT__MAX_VOLUME))), true, VLVT_REAL, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__attenuation_A->varInsert("VOLUME_BITS", const_cast<void*>(static_cast<const void*>(&(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_A__DOT__VOLUME_BITS))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__attenuation_A->varInsert("control", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_A__DOT__control), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,3,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__attenuation_A->varInsert("in", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_A__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__attenuation_A->varInsert("out", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_A__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__attenuation_B->varInsert("CONTROL_BITS", const_cast<void*>(static_cast<const void*>(&(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_B__DOT__CONTROL_BITS))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__attenuation_B->varInsert("MAX_VOLUME", const_cast<void*>(static_cast<const void*>(&(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_B__DOT__MAX_VOLUME))), true, VLVT_REAL, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__attenuation_B->varInsert("VOLUME_BITS", const_cast<void*>(static_cast<const void*>(&(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_B__DOT__VOLUME_BITS))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__attenuation_B->varInsert("control", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_B__DOT__control), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,3,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__attenuation_B->varInsert("in", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_B__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__attenuation_B->varInsert("out", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_B__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__attenuation_C->varInsert("CONTROL_BITS", const_cast<void*>(static_cast<const void*>(&(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_C__DOT__CONTROL_BITS))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__attenuation_C->varInsert("MAX_VOLUME", const_cast<void*>(static_cast<const void*>(&(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_C__DOT__MAX_VOLUME))), true, VLVT_REAL, VLVD_NODIR|VLVF_PUB_RW|VLVF_DPI_CLAY|VLVF_SIGNED, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__attenuation_C->varInsert("VOLUME_BITS", const_cast<void*>(static_cast<const void*>(&(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_C__DOT__VOLUME_BITS))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__attenuation_C->varInsert("control", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_C__DOT__control), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,3,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__attenuation_C->varInsert("in", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_C__DOT__in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__attenuation_C->varInsert("out", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_C__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator->varInsert("ENVELOPE_BITS", const_cast<void*>(static_cast<const void*>(&(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__ENVELOPE_BITS))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator->varInsert("MAX_VALUE", const_cast<void*>(static_cast<const void*>(&(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__MAX_VALUE))), true, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,3,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator->varInsert("PERIOD_BITS", const_cast<void*>(static_cast<const void*>(&(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__PERIOD_BITS))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator->varInsert("alternate", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__alternate), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator->varInsert("alternate_", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__alternate_), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator->varInsert("alternate__", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__alternate___05F), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator->varInsert("attack", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__attack), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator->varInsert("attack_", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__attack_), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator->varInsert("attack__", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__attack___05F), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator->varInsert("clk", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__clk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator->varInsert("continue_", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__continue_), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator->varInsert("enable", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__enable), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator->varInsert("envelope_counter", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__envelope_counter), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,3,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator->varInsert("hold", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__hold), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator->varInsert("hold_", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__hold_), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator->varInsert("hold__", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__hold___05F), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator->varInsert("invert_output", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__invert_output), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator->varInsert("out", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 1 ,3,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator->varInsert("period", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__period), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,15,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator->varInsert("reset", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__reset), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator->varInsert("stop", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__stop), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator->varInsert("trigger", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__trigger), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator->varInsert("trigger_edge", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__trigger_edge), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator__signal_edge->varInsert("clk", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__clk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator__signal_edge->varInsert("on_edge", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__on_edge), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator__signal_edge->varInsert("on_negedge", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__on_negedge), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator__signal_edge->varInsert("on_posedge", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__on_posedge), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator__signal_edge->varInsert("previous_signal_state_0", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__previous_signal_state_0), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator__signal_edge->varInsert("previous_signal_state_1", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__previous_signal_state_1), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator__signal_edge->varInsert("reset", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__reset), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator__signal_edge->varInsert("signal", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__signal), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator__tone->varInsert("PERIOD_BITS", const_cast<void*>(static_cast<const void*>(&(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__PERIOD_BITS))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator__tone->varInsert("clk", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__clk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator__tone->varInsert("counter", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__counter), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,15,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator__tone->varInsert("enable", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__enable), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator__tone->varInsert("out", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator__tone->varInsert("period", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__period), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,15,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator__tone->varInsert("reset", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__reset), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator__tone->varInsert("state", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__state), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator->varInsert("LFSR_BITS", const_cast<void*>(static_cast<const void*>(&(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__LFSR_BITS))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator->varInsert("LFSR_TAP0", const_cast<void*>(static_cast<const void*>(&(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__LFSR_TAP0))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator->varInsert("LFSR_TAP1", const_cast<void*>(static_cast<const void*>(&(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__LFSR_TAP1))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator->varInsert("PERIOD_BITS", const_cast<void*>(static_cast<const void*>(&(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__PERIOD_BITS))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator->varInsert("clk", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__clk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator->varInsert("enable", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__enable), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator->varInsert("is_lfsr_zero", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__is_lfsr_zero), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator->varInsert("lfsr", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__lfsr), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,16,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator->varInsert("lfsr_shift_in", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__lfsr_shift_in), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator->varInsert("out", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator->varInsert("period", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__period), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,4,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator->varInsert("reset", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__reset), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator->varInsert("trigger", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__trigger), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator->varInsert("trigger_edge", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__trigger_edge), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator__signal_edge->varInsert("clk", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__clk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator__signal_edge->varInsert("on_edge", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__on_edge), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator__signal_edge->varInsert("on_negedge", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__on_negedge), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator__signal_edge->varInsert("on_posedge", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__on_posedge), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator__signal_edge->varInsert("previous_signal_state_0", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__previous_signal_state_0), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator__signal_edge->varInsert("previous_signal_state_1", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__previous_signal_state_1), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator__signal_edge->varInsert("reset", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__reset), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator__signal_edge->varInsert("signal", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__signal), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator__tone->varInsert("PERIOD_BITS", const_cast<void*>(static_cast<const void*>(&(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__PERIOD_BITS))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator__tone->varInsert("clk", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__clk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator__tone->varInsert("counter", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__counter), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,4,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator__tone->varInsert("enable", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__enable), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator__tone->varInsert("out", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator__tone->varInsert("period", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__period), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,4,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator__tone->varInsert("reset", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__reset), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator__tone->varInsert("state", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__state), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_A->varInsert("ACCUMULATOR_BITS", const_cast<void*>(static_cast<const void*>(&(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__ACCUMULATOR_BITS))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_A->varInsert("VALUE_BITS", const_cast<void*>(static_cast<const void*>(&(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__VALUE_BITS))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_A->varInsert("accumulator", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__accumulator), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,8,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_A->varInsert("clk", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__clk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_A->varInsert("out", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_A->varInsert("reset", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__reset), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_A->varInsert("value", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__value), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_B->varInsert("ACCUMULATOR_BITS", const_cast<void*>(static_cast<const void*>(&(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__ACCUMULATOR_BITS))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_B->varInsert("VALUE_BITS", const_cast<void*>(static_cast<const void*>(&(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__VALUE_BITS))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_B->varInsert("accumulator", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__accumulator), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,8,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_B->varInsert("clk", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__clk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_B->varInsert("out", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_B->varInsert("reset", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__reset), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_B->varInsert("value", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__value), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_C->varInsert("ACCUMULATOR_BITS", const_cast<void*>(static_cast<const void*>(&(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__ACCUMULATOR_BITS))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_C->varInsert("VALUE_BITS", const_cast<void*>(static_cast<const void*>(&(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__VALUE_BITS))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_C->varInsert("accumulator", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__accumulator), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,8,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_C->varInsert("clk", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__clk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_C->varInsert("out", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_C->varInsert("reset", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__reset), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_C->varInsert("value", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__value), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,7,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_master->varInsert("ACCUMULATOR_BITS", const_cast<void*>(static_cast<const void*>(&(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__ACCUMULATOR_BITS))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_master->varInsert("VALUE_BITS", const_cast<void*>(static_cast<const void*>(&(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__VALUE_BITS))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_master->varInsert("accumulator", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__accumulator), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,9,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_master->varInsert("clk", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__clk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_master->varInsert("out", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_master->varInsert("reset", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__reset), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_master->varInsert("value", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__value), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,8,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__tone_A_generator->varInsert("PERIOD_BITS", const_cast<void*>(static_cast<const void*>(&(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__PERIOD_BITS))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__tone_A_generator->varInsert("clk", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__clk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__tone_A_generator->varInsert("counter", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__counter), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,11,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__tone_A_generator->varInsert("enable", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__enable), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__tone_A_generator->varInsert("out", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__tone_A_generator->varInsert("period", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__period), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,11,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__tone_A_generator->varInsert("reset", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__reset), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__tone_A_generator->varInsert("state", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__state), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__tone_B_generator->varInsert("PERIOD_BITS", const_cast<void*>(static_cast<const void*>(&(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__PERIOD_BITS))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__tone_B_generator->varInsert("clk", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__clk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__tone_B_generator->varInsert("counter", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__counter), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,11,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__tone_B_generator->varInsert("enable", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__enable), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__tone_B_generator->varInsert("out", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__tone_B_generator->varInsert("period", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__period), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,11,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__tone_B_generator->varInsert("reset", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__reset), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__tone_B_generator->varInsert("state", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__state), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__tone_C_generator->varInsert("PERIOD_BITS", const_cast<void*>(static_cast<const void*>(&(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__PERIOD_BITS))), true, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__tone_C_generator->varInsert("clk", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__clk), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__tone_C_generator->varInsert("counter", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__counter), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,11,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__tone_C_generator->varInsert("enable", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__enable), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__tone_C_generator->varInsert("out", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__out), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW|VLVF_CONTINUOUSLY, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__tone_C_generator->varInsert("period", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__period), false, VLVT_UINT16, VLVD_NODIR|VLVF_PUB_RW, 0, 1 ,11,0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__tone_C_generator->varInsert("reset", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__reset), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__tone_C_generator->varInsert("state", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__state), false, VLVT_UINT8, VLVD_NODIR|VLVF_PUB_RW, 0, 0);
+    __Vscopep_tb__tt_um_rejunity_ay8913_uut__unnamedblk1->varInsert("i", &(TOP.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__unnamedblk1__DOT__i), false, VLVT_UINT32, VLVD_NODIR|VLVF_PUB_RW|VLVF_SIGNED, 0, 1 ,31,0);
+}
+
+Vtop__Syms::~Vtop__Syms() {
+    // Tear down scope hierarchy
+    __Vhier.remove(0, __Vscopep_tb);
+    __Vhier.remove(__Vscopep_tb, __Vscopep_tb__tt_um_rejunity_ay8913_uut);
+    __Vhier.remove(__Vscopep_tb__tt_um_rejunity_ay8913_uut, __Vscopep_tb__tt_um_rejunity_ay8913_uut__attenuation_A);
+    __Vhier.remove(__Vscopep_tb__tt_um_rejunity_ay8913_uut, __Vscopep_tb__tt_um_rejunity_ay8913_uut__attenuation_B);
+    __Vhier.remove(__Vscopep_tb__tt_um_rejunity_ay8913_uut, __Vscopep_tb__tt_um_rejunity_ay8913_uut__attenuation_C);
+    __Vhier.remove(__Vscopep_tb__tt_um_rejunity_ay8913_uut, __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator);
+    __Vhier.remove(__Vscopep_tb__tt_um_rejunity_ay8913_uut, __Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator);
+    __Vhier.remove(__Vscopep_tb__tt_um_rejunity_ay8913_uut, __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_A);
+    __Vhier.remove(__Vscopep_tb__tt_um_rejunity_ay8913_uut, __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_B);
+    __Vhier.remove(__Vscopep_tb__tt_um_rejunity_ay8913_uut, __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_C);
+    __Vhier.remove(__Vscopep_tb__tt_um_rejunity_ay8913_uut, __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_master);
+    __Vhier.remove(__Vscopep_tb__tt_um_rejunity_ay8913_uut, __Vscopep_tb__tt_um_rejunity_ay8913_uut__tone_A_generator);
+    __Vhier.remove(__Vscopep_tb__tt_um_rejunity_ay8913_uut, __Vscopep_tb__tt_um_rejunity_ay8913_uut__tone_B_generator);
+    __Vhier.remove(__Vscopep_tb__tt_um_rejunity_ay8913_uut, __Vscopep_tb__tt_um_rejunity_ay8913_uut__tone_C_generator);
+    __Vhier.remove(__Vscopep_tb__tt_um_rejunity_ay8913_uut, __Vscopep_tb__tt_um_rejunity_ay8913_uut__unnamedblk1);
+    __Vhier.remove(__Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator, __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator__signal_edge);
+    __Vhier.remove(__Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator, __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator__tone);
+    __Vhier.remove(__Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator, __Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator__signal_edge);
+    __Vhier.remove(__Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator, __Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator__tone);
+    // Clear keys from hierarchy map after values have been removed
+    __Vhier.clear();
+    // Tear down scopes
+    VL_DO_CLEAR(delete __Vscopep_tb, __Vscopep_tb = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_tb__tt_um_rejunity_ay8913_uut, __Vscopep_tb__tt_um_rejunity_ay8913_uut = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_tb__tt_um_rejunity_ay8913_uut__attenuation_A, __Vscopep_tb__tt_um_rejunity_ay8913_uut__attenuation_A = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_tb__tt_um_rejunity_ay8913_uut__attenuation_B, __Vscopep_tb__tt_um_rejunity_ay8913_uut__attenuation_B = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_tb__tt_um_rejunity_ay8913_uut__attenuation_C, __Vscopep_tb__tt_um_rejunity_ay8913_uut__attenuation_C = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator, __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator__signal_edge, __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator__signal_edge = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator__tone, __Vscopep_tb__tt_um_rejunity_ay8913_uut__envelope_generator__tone = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator, __Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator__signal_edge, __Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator__signal_edge = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator__tone, __Vscopep_tb__tt_um_rejunity_ay8913_uut__noise_generator__tone = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_A, __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_A = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_B, __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_B = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_C, __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_C = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_master, __Vscopep_tb__tt_um_rejunity_ay8913_uut__pwm_master = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_tb__tt_um_rejunity_ay8913_uut__tone_A_generator, __Vscopep_tb__tt_um_rejunity_ay8913_uut__tone_A_generator = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_tb__tt_um_rejunity_ay8913_uut__tone_B_generator, __Vscopep_tb__tt_um_rejunity_ay8913_uut__tone_B_generator = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_tb__tt_um_rejunity_ay8913_uut__tone_C_generator, __Vscopep_tb__tt_um_rejunity_ay8913_uut__tone_C_generator = nullptr);
+    VL_DO_CLEAR(delete __Vscopep_tb__tt_um_rejunity_ay8913_uut__unnamedblk1, __Vscopep_tb__tt_um_rejunity_ay8913_uut__unnamedblk1 = nullptr);
+    // Tear down sub module instances
+}
@@ -0,0 +1,350 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design internal header
+// See Vtop.h for the primary calling header
+
+#ifndef VERILATED_VTOP___024ROOT_H_
+#define VERILATED_VTOP___024ROOT_H_  // guard
+
+#include "verilated.h"
+#include "verilated_timing.h"
+
+
+class Vtop__Syms;
+
+class alignas(VL_CACHE_LINE_BYTES) Vtop___024root final {
+  public:
+
+    // DESIGN SPECIFIC STATE
+    // Anonymous structures to workaround compiler member-count bugs
+    struct {
+        CData/*7:0*/ tb__DOT__ui_in;
+        CData/*7:0*/ tb__DOT__uo_out;
+        CData/*7:0*/ tb__DOT__uio_in;
+        CData/*7:0*/ tb__DOT__uio_out;
+        CData/*7:0*/ tb__DOT__uio_oe;
+        CData/*0:0*/ tb__DOT__clk;
+        CData/*0:0*/ tb__DOT__rst_n;
+        CData/*0:0*/ tb__DOT__ena;
+        CData/*0:0*/ tb__DOT__bus_start;
+        CData/*0:0*/ tb__DOT__bus_done;
+        CData/*0:0*/ tb__DOT__sample_start;
+        CData/*0:0*/ tb__DOT__sample_done;
+        CData/*0:0*/ tb__DOT__sample_strobes;
+        CData/*5:0*/ tb__DOT__sample_channels;
+        CData/*0:0*/ tb__DOT__sample_noise;
+        CData/*7:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__ui_in;
+        CData/*7:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__uo_out;
+        CData/*7:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__uio_in;
+        CData/*7:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__uio_out;
+        CData/*7:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__uio_oe;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__ena;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__rst_n;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__reset;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT___unused;
+        CData/*1:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__master_clock_control;
+        CData/*7:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__data;
+        CData/*6:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk_counter;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk_master_strobe;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bdir;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bc1;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bus_inactive;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bus_read;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bus_write;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bus_latch_reg;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__cs;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__latch;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__write;
+        CData/*3:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__latched_register;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__active;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__restart_envelope;
+        CData/*4:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_period;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_disable_A;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_disable_B;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_disable_C;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_disable_A;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_disable_B;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_disable_C;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_A;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_B;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_C;
+        CData/*3:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__amplitude_A;
+        CData/*3:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__amplitude_B;
+        CData/*3:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__amplitude_C;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_continue;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_attack;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_alternate;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_hold;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise;
+        CData/*3:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__channel_A;
+    };
+    struct {
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__channel_B;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__channel_C;
+        CData/*7:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_A;
+        CData/*7:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_B;
+        CData/*7:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_C;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__master_overflow;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__clk;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__enable;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__reset;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__out;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__state;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__clk;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__enable;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__reset;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__out;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__state;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__clk;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__enable;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__reset;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__out;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__state;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__clk;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__enable;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__reset;
+        CData/*4:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__period;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__out;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__trigger;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__trigger_edge;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__is_lfsr_zero;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__lfsr_shift_in;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__clk;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__enable;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__reset;
+        CData/*4:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__period;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__out;
+        CData/*4:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__counter;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__state;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__clk;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__reset;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__signal;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__on_posedge;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__on_negedge;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__on_edge;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__previous_signal_state_0;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__previous_signal_state_1;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__clk;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__enable;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__reset;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__hold;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__alternate;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__attack;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__continue_;
+        CData/*3:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__out;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__hold_;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__alternate_;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__attack_;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__hold___05F;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__alternate___05F;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__attack___05F;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__trigger;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__trigger_edge;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__invert_output;
+        CData/*3:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__envelope_counter;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__stop;
+    };
+    struct {
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__clk;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__enable;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__reset;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__out;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__state;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__clk;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__reset;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__signal;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__on_posedge;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__on_negedge;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__on_edge;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__previous_signal_state_0;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__previous_signal_state_1;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_A__DOT__in;
+        CData/*3:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_A__DOT__control;
+        CData/*7:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_A__DOT__out;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_B__DOT__in;
+        CData/*3:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_B__DOT__control;
+        CData/*7:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_B__DOT__out;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_C__DOT__in;
+        CData/*3:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_C__DOT__control;
+        CData/*7:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_C__DOT__out;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__clk;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__reset;
+        CData/*7:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__value;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__out;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__clk;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__reset;
+        CData/*7:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__value;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__out;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__clk;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__reset;
+        CData/*7:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__value;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__out;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__clk;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__reset;
+        CData/*0:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__out;
+        CData/*0:0*/ __Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__active;
+        CData/*6:0*/ __Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk_counter;
+        CData/*3:0*/ __Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__latched_register;
+        CData/*0:0*/ __Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__restart_envelope;
+        CData/*0:0*/ __Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__state;
+        CData/*0:0*/ __Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__state;
+        CData/*0:0*/ __Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__state;
+        CData/*4:0*/ __Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__counter;
+        CData/*0:0*/ __Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__state;
+        CData/*0:0*/ __Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__previous_signal_state_0;
+        CData/*0:0*/ __Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__previous_signal_state_1;
+        CData/*3:0*/ __Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__envelope_counter;
+        CData/*0:0*/ __Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__stop;
+        CData/*0:0*/ __Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__invert_output;
+        CData/*0:0*/ __Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__state;
+        CData/*0:0*/ __Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__previous_signal_state_0;
+        CData/*0:0*/ __Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__previous_signal_state_1;
+        CData/*7:0*/ __VdlyVal__tb__DOT__uio_in__v0;
+        CData/*0:0*/ __VdlySet__tb__DOT__uio_in__v0;
+        CData/*7:0*/ __VdlyVal__tb__DOT__ui_in__v0;
+        CData/*0:0*/ __VdlySet__tb__DOT__ui_in__v0;
+        CData/*0:0*/ __VstlFirstIteration;
+        CData/*0:0*/ __VstlPhaseResult;
+        CData/*0:0*/ __VicoFirstIteration;
+        CData/*0:0*/ __VicoPhaseResult;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__tb__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk__0;
+    };
+    struct {
+        CData/*0:0*/ __Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__clk__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__tb__DOT__bus_start__0;
+        CData/*0:0*/ __Vtrigprevexpr___TOP__tb__DOT__sample_start__0;
+        CData/*0:0*/ __VactPhaseResult;
+        CData/*0:0*/ __VinactPhaseResult;
+        CData/*0:0*/ __VnbaPhaseResult;
+        SData/*11:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_period_A;
+        SData/*11:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_period_B;
+        SData/*11:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_period_C;
+        SData/*15:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_period;
+        SData/*8:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__master;
+        SData/*11:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__period;
+        SData/*11:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__counter;
+        SData/*11:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__period;
+        SData/*11:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__counter;
+        SData/*11:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__period;
+        SData/*11:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__counter;
+        SData/*15:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__period;
+        SData/*15:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__period;
+        SData/*15:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__counter;
+        SData/*8:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__accumulator;
+        SData/*8:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__accumulator;
+        SData/*8:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__accumulator;
+        SData/*8:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__value;
+        SData/*9:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__accumulator;
+        SData/*11:0*/ __Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__counter;
+        SData/*11:0*/ __Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__counter;
+        SData/*11:0*/ __Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__counter;
+        SData/*15:0*/ __Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__counter;
+        SData/*8:0*/ __Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__accumulator;
+        SData/*8:0*/ __Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__accumulator;
+        SData/*8:0*/ __Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__accumulator;
+        SData/*9:0*/ __Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__accumulator;
+        IData/*31:0*/ tb__DOT____VlemExpr_0;
+        IData/*31:0*/ tb__DOT__bus_count;
+        IData/*31:0*/ tb__DOT__bus_index;
+        VlWide<64>/*2047:0*/ tb__DOT__bus_filename;
+        IData/*31:0*/ tb__DOT__bus_restarts;
+        IData/*31:0*/ tb__DOT__sample_count;
+        IData/*31:0*/ tb__DOT__sample_file;
+        IData/*31:0*/ tb__DOT__sample_index;
+        IData/*31:0*/ tb__DOT__sample_rewind;
+        VlWide<64>/*2047:0*/ tb__DOT__sample_filename;
+        IData/*31:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__unnamedblk1__DOT__i;
+        IData/*16:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__lfsr;
+        IData/*31:0*/ __Vdly__tb__DOT__bus_restarts;
+        IData/*16:0*/ __Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__lfsr;
+        IData/*31:0*/ __VactIterCount;
+        IData/*31:0*/ __VinactIterCount;
+        IData/*31:0*/ __Vi;
+        QData/*63:0*/ tb__DOT__sample_period_ps;
+        QData/*63:0*/ tb__DOT__sample_cycles;
+    };
+    struct {
+        QData/*63:0*/ tb__DOT__sample_until;
+        VlUnpacked<SData/*15:0*/, 65536> tb__DOT__bus_stimulus;
+        VlUnpacked<CData/*7:0*/, 16> tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register;
+        VlUnpacked<QData/*63:0*/, 1> __VstlTriggered;
+        VlUnpacked<QData/*63:0*/, 1> __VicoTriggered;
+        VlUnpacked<QData/*63:0*/, 3> __VactTriggered;
+        VlUnpacked<QData/*63:0*/, 2> __VactTriggeredAcc;
+        VlUnpacked<QData/*63:0*/, 2> __VnbaTriggered;
+    };
+    VlNBACommitQueue<VlUnpacked<CData/*7:0*/, 16>, false, CData/*7:0*/, 1> __VdlyCommitQueuetb__DOT__tt_um_rejunity_ay8913_uut__DOT__register;
+    VlTriggerScheduler __VtrigSched_h4398dd10__0;
+    VlTriggerScheduler __VtrigSched_h190497a8__0;
+    VlDelayScheduler __VdlySched;
+    VlTriggerScheduler __VtrigSched_hbc41835d__0;
+
+    // INTERNAL VARIABLES
+    Vtop__Syms* vlSymsp;
+    const char* vlNamep;
+
+    // PARAMETERS
+    static constexpr CData/*3:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__DA7_DA4_UPPER_ADDRESS_MASK = 0U;
+    static constexpr CData/*7:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__MASTER_MAX_OUTPUT_VOLUME = 0xffU;
+    static constexpr CData/*3:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__MAX_VALUE = 0x0fU;
+    static constexpr IData/*31:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__CHANNEL_OUTPUT_BITS = 8U;
+    static constexpr IData/*31:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__MASTER_OUTPUT_BITS = 8U;
+    static constexpr IData/*31:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__REGISTERS = 0x00000010U;
+    static constexpr IData/*31:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__MASTER_ACCUMULATOR_BITS = 9U;
+    static constexpr IData/*31:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__PERIOD_BITS = 0x0000000cU;
+    static constexpr IData/*31:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__PERIOD_BITS = 0x0000000cU;
+    static constexpr IData/*31:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__PERIOD_BITS = 0x0000000cU;
+    static constexpr IData/*31:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__LFSR_BITS = 0x00000011U;
+    static constexpr IData/*31:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__LFSR_TAP0 = 0U;
+    static constexpr IData/*31:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__LFSR_TAP1 = 3U;
+    static constexpr IData/*31:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__PERIOD_BITS = 5U;
+    static constexpr IData/*31:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__PERIOD_BITS = 5U;
+    static constexpr IData/*31:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__PERIOD_BITS = 0x00000010U;
+    static constexpr IData/*31:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__ENVELOPE_BITS = 4U;
+    static constexpr IData/*31:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__PERIOD_BITS = 0x00000010U;
+    static constexpr IData/*31:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_A__DOT__CONTROL_BITS = 4U;
+    static constexpr IData/*31:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_A__DOT__VOLUME_BITS = 8U;
+    static constexpr IData/*31:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_B__DOT__CONTROL_BITS = 4U;
+    static constexpr IData/*31:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_B__DOT__VOLUME_BITS = 8U;
+    static constexpr IData/*31:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_C__DOT__CONTROL_BITS = 4U;
+    static constexpr IData/*31:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_C__DOT__VOLUME_BITS = 8U;
+    static constexpr IData/*31:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__VALUE_BITS = 8U;
+    static constexpr IData/*31:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__ACCUMULATOR_BITS = 9U;
+    static constexpr IData/*31:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__VALUE_BITS = 8U;
+    static constexpr IData/*31:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__ACCUMULATOR_BITS = 9U;
+    static constexpr IData/*31:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__VALUE_BITS = 8U;
+    static constexpr IData/*31:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__ACCUMULATOR_BITS = 9U;
+    static constexpr IData/*31:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__VALUE_BITS = 9U;
+    static constexpr IData/*31:0*/ tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__ACCUMULATOR_BITS = 0x0000000aU;
+    static constexpr double tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_A__DOT__MAX_VOLUME = 255.0;
+    static constexpr double tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_B__DOT__MAX_VOLUME = 255.0;
+    static constexpr double tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_C__DOT__MAX_VOLUME = 255.0;
+
+    // CONSTRUCTORS
+    Vtop___024root(Vtop__Syms* symsp, const char* namep);
+    ~Vtop___024root();
+    VL_UNCOPYABLE(Vtop___024root);
+
+    // INTERNAL METHODS
+    void __Vconfigure(bool first);
+};
+
+
+#endif  // guard
@@ -0,0 +1,2872 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design implementation internals
+// See Vtop.h for the primary calling header
+
+#include "Vtop__pch.h"
+
+VlCoroutine Vtop___024root___eval_initial__TOP__Vtiming__0(Vtop___024root* vlSelf);
+VlCoroutine Vtop___024root___eval_initial__TOP__Vtiming__1(Vtop___024root* vlSelf);
+
+void Vtop___024root___eval_initial(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_initial\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.tb__DOT__uio_oe = 0xf0U;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__uio_oe = 0xf0U;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT___unused = 0U;
+    Vtop___024root___eval_initial__TOP__Vtiming__0(vlSelf);
+    Vtop___024root___eval_initial__TOP__Vtiming__1(vlSelf);
+}
+
+void Vtop___024root____VbeforeTrig_h190497a8__0(Vtop___024root* vlSelf, const char* __VeventDescription);
+extern const VlWide<64>/*2047:0*/ Vtop__ConstPool__CONST_h600f46a4_0;
+void Vtop___024root____VbeforeTrig_h4398dd10__0(Vtop___024root* vlSelf, const char* __VeventDescription);
+
+VlCoroutine Vtop___024root___eval_initial__TOP__Vtiming__0(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_initial__TOP__Vtiming__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    while (VL_LIKELY(!vlSymsp->_vm_contextp__->gotFinish())) {
+        Vtop___024root____VbeforeTrig_h190497a8__0(vlSelf, 
+                                                   "@( tb.bus_start)");
+        co_await vlSelfRef.__VtrigSched_h190497a8__0.trigger(0U, 
+                                                             nullptr, 
+                                                             "@( tb.bus_start)", 
+                                                             "/root/package/test/tb.v", 
+                                                             98);
+        if (VL_UNLIKELY(((0U < vlSelfRef.tb__DOT__bus_count)))) {
+            vlSelfRef.tb__DOT____VlemExpr_0 = VL_VALUEPLUSARGS_INW(2048, "BUS=%s"s, 
+                                                                   vlSelfRef.tb__DOT__bus_filename);
+            if ((! vlSelfRef.tb__DOT____VlemExpr_0)) {
+                VL_ASSIGN_W(2048, vlSelfRef.tb__DOT__bus_filename, Vtop__ConstPool__CONST_h600f46a4_0);
+            }
+            VL_READMEM_N(true, 16, 65536, 0, VL_CVT_PACK_STR_NW(64, vlSelfRef.tb__DOT__bus_filename)
+                         ,  &(vlSelfRef.tb__DOT__bus_stimulus)
+                         , 0U, (vlSelfRef.tb__DOT__bus_count 
+                                - (IData)(1U)));
+            vlSelfRef.tb__DOT__bus_index = 0U;
+            while ((vlSelfRef.tb__DOT__bus_index < vlSelfRef.tb__DOT__bus_count)) {
+                vlSelfRef.__VdlyVal__tb__DOT__uio_in__v0 
+                    = (0x000000ffU & (vlSelfRef.tb__DOT__bus_stimulus
+                                      [(0x0000ffffU 
+                                        & vlSelfRef.tb__DOT__bus_index)] 
+                                      >> 8U));
+                vlSelfRef.__VdlySet__tb__DOT__uio_in__v0 = 1U;
+                vlSelfRef.__VdlyVal__tb__DOT__ui_in__v0 
+                    = (0x000000ffU & vlSelfRef.tb__DOT__bus_stimulus
+                       [(0x0000ffffU & vlSelfRef.tb__DOT__bus_index)]);
+                vlSelfRef.__VdlySet__tb__DOT__ui_in__v0 = 1U;
+                Vtop___024root____VbeforeTrig_h4398dd10__0(vlSelf, 
+                                                           "@(posedge tb.clk)");
+                co_await vlSelfRef.__VtrigSched_h4398dd10__0.trigger(0U, 
+                                                                     nullptr, 
+                                                                     "@(posedge tb.clk)", 
+                                                                     "/root/package/test/tb.v", 
+                                                                     105);
+                vlSelfRef.tb__DOT__bus_index = ((IData)(1U) 
+                                                + vlSelfRef.tb__DOT__bus_index);
+            }
+            vlSelfRef.tb__DOT__bus_done = (1U & (~ (IData)(vlSelfRef.tb__DOT__bus_done)));
+        }
+    }
+    co_return;
+}
+
+void Vtop___024root____VbeforeTrig_hbc41835d__0(Vtop___024root* vlSelf, const char* __VeventDescription);
+extern const VlWide<64>/*2047:0*/ Vtop__ConstPool__CONST_hdf66760e_0;
+
+VlCoroutine Vtop___024root___eval_initial__TOP__Vtiming__1(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_initial__TOP__Vtiming__1\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    IData/*31:0*/ __Vtask_tb__DOT__sample_open__0____VlefExpr_0;
+    __Vtask_tb__DOT__sample_open__0____VlefExpr_0 = 0;
+    // Body
+    while (VL_LIKELY(!vlSymsp->_vm_contextp__->gotFinish())) {
+        Vtop___024root____VbeforeTrig_hbc41835d__0(vlSelf, 
+                                                   "@( tb.sample_start)");
+        co_await vlSelfRef.__VtrigSched_hbc41835d__0.trigger(0U, 
+                                                             nullptr, 
+                                                             "@( tb.sample_start)", 
+                                                             "/root/package/test/tb.v", 
+                                                             187);
+        if (VL_UNLIKELY(((0U < vlSelfRef.tb__DOT__sample_count)))) {
+            if (VL_UNLIKELY(((0U == vlSelfRef.tb__DOT__sample_file)))) {
+                __Vtask_tb__DOT__sample_open__0____VlefExpr_0 
+                    = VL_VALUEPLUSARGS_INW(2048, "SAMPLES=%s"s, 
+                                           vlSelfRef.tb__DOT__sample_filename);
+                if ((! __Vtask_tb__DOT__sample_open__0____VlefExpr_0)) {
+                    VL_ASSIGN_W(2048, vlSelfRef.tb__DOT__sample_filename, Vtop__ConstPool__CONST_hdf66760e_0);
+                }
+                vlSelfRef.tb__DOT__sample_file = VL_FOPEN_NN(
+                                                             VL_CVT_PACK_STR_NW(64, vlSelfRef.tb__DOT__sample_filename)
+                                                             , "w"s);
+                ;
+            }
+            vlSelfRef.tb__DOT__sample_index = 0U;
+            while ((vlSelfRef.tb__DOT__sample_index 
+                    < vlSelfRef.tb__DOT__sample_count)) {
+                co_await vlSelfRef.__VdlySched.delay(
+                                                     VL_RTOIROUND_Q_D(
+                                                                      (1.00000000000000000e+03 
+                                                                       * 
+                                                                       (VL_ITOR_D_Q(64, vlSelfRef.tb__DOT__sample_period_ps) 
+                                                                        / 1.00000000000000000e+03))), 
+                                                     nullptr, 
+                                                     "/root/package/test/tb.v", 
+                                                     191);
+                if (VL_UNLIKELY(((0x3fU == (IData)(vlSelfRef.tb__DOT__sample_channels))))) {
+                    VL_FWRITEF_NX(vlSelfRef.tb__DOT__sample_file,"%0d %0d %0d %0d %0d %0d\n",6
+                                  , '#',8,vlSelfRef.tb__DOT__uo_out
+                                  , '#',8,(IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_A)
+                                  , '#',8,vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_B
+                                  , '#',8,(IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_C)
+                                  , '#',1,vlSelfRef.tb__DOT__sample_noise
+                                  , '#',4,(IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope));
+                } else if ((1U == (IData)(vlSelfRef.tb__DOT__sample_channels))) {
+                    VL_FWRITEF_NX(vlSelfRef.tb__DOT__sample_file,"%0d\n",1
+                                  , '#',8,vlSelfRef.tb__DOT__uo_out);
+                } else {
+                    if (VL_UNLIKELY(((1U & (IData)(vlSelfRef.tb__DOT__sample_channels))))) {
+                        VL_FWRITEF_NX(vlSelfRef.tb__DOT__sample_file,"%0d ",1
+                                      , '#',8,vlSelfRef.tb__DOT__uo_out);
+                    }
+                    if (VL_UNLIKELY(((2U & (IData)(vlSelfRef.tb__DOT__sample_channels))))) {
+                        VL_FWRITEF_NX(vlSelfRef.tb__DOT__sample_file,"%0d ",1
+                                      , '#',8,vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_A);
+                    }
+                    if (VL_UNLIKELY(((4U & (IData)(vlSelfRef.tb__DOT__sample_channels))))) {
+                        VL_FWRITEF_NX(vlSelfRef.tb__DOT__sample_file,"%0d ",1
+                                      , '#',8,vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_B);
+                    }
+                    if (VL_UNLIKELY(((8U & (IData)(vlSelfRef.tb__DOT__sample_channels))))) {
+                        VL_FWRITEF_NX(vlSelfRef.tb__DOT__sample_file,"%0d ",1
+                                      , '#',8,vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_C);
+                    }
+                    if (VL_UNLIKELY(((0x00000010U & (IData)(vlSelfRef.tb__DOT__sample_channels))))) {
+                        VL_FWRITEF_NX(vlSelfRef.tb__DOT__sample_file,"%0d ",1
+                                      , '#',1,vlSelfRef.tb__DOT__sample_noise);
+                    }
+                    if (VL_UNLIKELY(((0x00000020U & (IData)(vlSelfRef.tb__DOT__sample_channels))))) {
+                        VL_FWRITEF_NX(vlSelfRef.tb__DOT__sample_file,"%0d ",1
+                                      , '#',4,vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope);
+                    }
+                    VL_FWRITEF_NX(vlSelfRef.tb__DOT__sample_file,"\n",0);
+                }
+                vlSelfRef.tb__DOT__sample_index = ((IData)(1U) 
+                                                   + vlSelfRef.tb__DOT__sample_index);
+            }
+            VL_FFLUSH_I(vlSelfRef.tb__DOT__sample_file);
+            vlSelfRef.tb__DOT__sample_rewind = (VL_FSEEK_I(vlSelfRef.tb__DOT__sample_file, 0U, 0U) == -1 ? -1 : 0);
+            vlSelfRef.tb__DOT__sample_done = (1U & 
+                                              (~ (IData)(vlSelfRef.tb__DOT__sample_done)));
+        }
+    }
+    co_return;
+}
+
+void Vtop___024root___eval_triggers_vec__ico(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_triggers_vec__ico\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__VicoTriggered[0U] = ((0xfffffffffffffffeULL 
+                                      & vlSelfRef.__VicoTriggered[0U]) 
+                                     | (IData)((IData)(vlSelfRef.__VicoFirstIteration)));
+}
+
+bool Vtop___024root___trigger_anySet__ico(const VlUnpacked<QData/*63:0*/, 1> &in) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___trigger_anySet__ico\n"); );
+    // Locals
+    IData/*31:0*/ n;
+    // Body
+    n = 0U;
+    do {
+        if (in[n]) {
+            return (1U);
+        }
+        n = ((IData)(1U) + n);
+    } while ((1U > n));
+    return (0U);
+}
+
+extern const VlUnpacked<CData/*7:0*/, 32> Vtop__ConstPool__TABLE_hfa54f15d_0;
+
+void Vtop___024root___ico_sequent__TOP__0(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___ico_sequent__TOP__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*4:0*/ __Vtableidx1;
+    __Vtableidx1 = 0;
+    CData/*4:0*/ __Vtableidx2;
+    __Vtableidx2 = 0;
+    CData/*4:0*/ __Vtableidx3;
+    __Vtableidx3 = 0;
+    // Body
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__ena 
+        = vlSelfRef.tb__DOT__ena;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_period_A 
+        = ((0x00000f00U & (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[1U] 
+                           << 8U)) | vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[0U]);
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_period_B 
+        = ((0x00000f00U & (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[3U] 
+                           << 8U)) | vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[2U]);
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_period_C 
+        = ((0x00000f00U & (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[5U] 
+                           << 8U)) | vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[4U]);
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__is_lfsr_zero 
+        = (0U == vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__lfsr);
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_period 
+        = (0x0000001fU & vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[6U]);
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_period 
+        = (((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[12U]) 
+            << 8U) | vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[11U]);
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__out 
+        = (1U & ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__accumulator) 
+                 >> 8U));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__out 
+        = (1U & ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__accumulator) 
+                 >> 8U));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__out 
+        = (1U & ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__accumulator) 
+                 >> 8U));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__out 
+        = (1U & ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__accumulator) 
+                 >> 9U));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__ui_in 
+        = vlSelfRef.tb__DOT__ui_in;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_alternate 
+        = (1U & (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[13U] 
+                 >> 1U));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_hold 
+        = (1U & vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[13U]);
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_attack 
+        = (1U & (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[13U] 
+                 >> 2U));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_continue 
+        = (1U & (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[13U] 
+                 >> 3U));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__out 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__state;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__out 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__state;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk 
+        = vlSelfRef.tb__DOT__clk;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__rst_n 
+        = vlSelfRef.tb__DOT__rst_n;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_A 
+        = (1U & (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[8U] 
+                 >> 4U));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__amplitude_A 
+        = (0x0000000fU & vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[8U]);
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_B 
+        = (1U & (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[9U] 
+                 >> 4U));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__amplitude_B 
+        = (0x0000000fU & vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[9U]);
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_C 
+        = (1U & (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[10U] 
+                 >> 4U));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__amplitude_C 
+        = (0x0000000fU & vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[10U]);
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_disable_C 
+        = (1U & (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[7U] 
+                 >> 2U));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_disable_B 
+        = (1U & (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[7U] 
+                 >> 1U));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_disable_A 
+        = (1U & vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[7U]);
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__out 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__state;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__out 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__state;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__out 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__state;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_disable_C 
+        = (1U & (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[7U] 
+                 >> 5U));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_disable_B 
+        = (1U & (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[7U] 
+                 >> 4U));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_disable_A 
+        = (1U & (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[7U] 
+                 >> 3U));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__uio_in 
+        = vlSelfRef.tb__DOT__uio_in;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__out 
+        = (0x0000000fU & ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__invert_output)
+                           ? ((IData)(0x0fU) - (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__envelope_counter))
+                           : (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__envelope_counter)));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__out 
+        = (1U & (~ vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__lfsr));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__period 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_period_A;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__period 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_period_B;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__period 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_period_C;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__lfsr_shift_in 
+        = (1U & ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__is_lfsr_zero) 
+                 | (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__lfsr 
+                    ^ (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__lfsr 
+                       >> 3U))));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__period 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_period;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__period 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_period;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__uio_out 
+        = ((((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__out) 
+             << 7U) | ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__out) 
+                       << 6U)) | (((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__out) 
+                                   << 5U) | ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__out) 
+                                             << 4U)));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__data 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__ui_in;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__alternate 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_alternate;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__hold 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_hold;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__attack 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_attack;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__continue_ 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_continue;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__trigger 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__out;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__trigger 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__out;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__clk 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__clk 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__clk 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__clk 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__clk 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__clk 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__clk 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__clk 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__clk 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__reset 
+        = (1U & (~ (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__rst_n)));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__out;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__out;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__out;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bdir 
+        = (1U & ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__uio_in) 
+                 >> 1U));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bc1 
+        = (1U & (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__uio_in));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__master_clock_control 
+        = (3U & ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__uio_in) 
+                 >> 2U));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__out;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__out;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__period 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__period;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__period 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__period;
+    vlSelfRef.tb__DOT__uio_out = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__uio_out;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__cs 
+        = (0U == (0x0000000fU & ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__data) 
+                                 >> 4U)));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__attack_ 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__attack;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__alternate_ 
+        = ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__continue_)
+            ? (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__alternate)
+            : (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__attack));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__hold_ 
+        = (1U & ((~ (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__continue_)) 
+                 | (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__hold)));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__signal 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__trigger;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__signal 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__trigger;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__clk 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__clk;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__clk 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__clk;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__clk 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__clk;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__clk 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__clk;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__reset 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__reset;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__reset 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__reset;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__reset 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__reset;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__reset 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__reset;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__reset 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__reset;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__reset 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__reset;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__reset 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__reset;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__reset 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__reset;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__reset 
+        = ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__restart_envelope) 
+           | (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__reset));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bus_inactive 
+        = (1U & ((~ (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bdir)) 
+                 & (~ (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bc1))));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bus_read 
+        = ((~ (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bdir)) 
+           & (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bc1));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bus_write 
+        = ((~ (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bc1)) 
+           & (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bdir));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bus_latch_reg 
+        = ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bdir) 
+           & (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bc1));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk_master_strobe 
+        = ((1U == (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__master_clock_control)) 
+           | ((2U == (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__master_clock_control))
+               ? (0U == (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk_counter))
+               : (0U == (7U & (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk_counter)))));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_A__DOT__control 
+        = ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_A)
+            ? (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope)
+            : (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__amplitude_A));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_B__DOT__control 
+        = ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_B)
+            ? (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope)
+            : (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__amplitude_B));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_C__DOT__control 
+        = ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_C)
+            ? (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope)
+            : (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__amplitude_C));
+    vlSelfRef.tb__DOT__sample_noise = ((~ ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_disable_A) 
+                                           & ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_disable_B) 
+                                              & (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_disable_C)))) 
+                                       & (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__channel_A 
+        = (((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_disable_A) 
+            | (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A)) 
+           & ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_disable_A) 
+              | (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise)));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__channel_B 
+        = (((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_disable_B) 
+            | (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B)) 
+           & ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_disable_B) 
+              | (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise)));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__channel_C 
+        = (((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_disable_C) 
+            | (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C)) 
+           & ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_disable_C) 
+              | (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise)));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__attack___05F 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__attack_;
+    if (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__hold_) {
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__hold___05F = 1U;
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__alternate___05F 
+            = (1U & (~ (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__alternate_)));
+    } else {
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__hold___05F = 0U;
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__alternate___05F 
+            = (1U & (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__alternate_));
+    }
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__on_negedge 
+        = (1U & (~ ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__signal) 
+                    | ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__signal) 
+                       == (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__previous_signal_state_1)))));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__on_posedge 
+        = ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__signal) 
+           & ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__signal) 
+              != (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__previous_signal_state_0)));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__on_negedge 
+        = (1U & (~ ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__signal) 
+                    | ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__signal) 
+                       == (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__previous_signal_state_1)))));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__on_posedge 
+        = ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__signal) 
+           & ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__signal) 
+              != (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__previous_signal_state_0)));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__reset 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__reset;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__reset 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__reset;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__reset 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__reset;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__reset 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__reset;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__write 
+        = ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bus_write) 
+           & (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__active));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__latch 
+        = ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bus_latch_reg) 
+           & (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__cs));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__enable 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk_master_strobe;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__enable 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk_master_strobe;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__enable 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk_master_strobe;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__enable 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk_master_strobe;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__enable 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk_master_strobe;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_A__DOT__in 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__channel_A;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_B__DOT__in 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__channel_B;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_C__DOT__in 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__channel_C;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__trigger_edge 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__on_posedge;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__on_edge 
+        = ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__on_posedge) 
+           | (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__on_negedge));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__trigger_edge 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__on_posedge;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__on_edge 
+        = ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__on_posedge) 
+           | (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__on_negedge));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__enable 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__enable;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__enable 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__enable;
+    __Vtableidx1 = (((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_A__DOT__control) 
+                     << 1U) | (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_A__DOT__in));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_A__DOT__out 
+        = Vtop__ConstPool__TABLE_hfa54f15d_0[__Vtableidx1];
+    __Vtableidx2 = (((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_B__DOT__control) 
+                     << 1U) | (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_B__DOT__in));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_B__DOT__out 
+        = Vtop__ConstPool__TABLE_hfa54f15d_0[__Vtableidx2];
+    __Vtableidx3 = (((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_C__DOT__control) 
+                     << 1U) | (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_C__DOT__in));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_C__DOT__out 
+        = Vtop__ConstPool__TABLE_hfa54f15d_0[__Vtableidx3];
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_A 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_A__DOT__out;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_B 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_B__DOT__out;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_C 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_C__DOT__out;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__value 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_A;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__value 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_B;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__value 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_C;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__master_overflow 
+        = (1U & (((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_A) 
+                  + ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_C) 
+                     + (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_B))) 
+                 >> 9U));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__master 
+        = (0x000001ffU & ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_A) 
+                          + ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_B) 
+                             + (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_C))));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__value 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__master;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__uo_out 
+        = (0x000000ffU & (((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__master) 
+                           >> 1U) | (- (IData)((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__master_overflow)))));
+    vlSelfRef.tb__DOT__uo_out = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__uo_out;
+}
+
+void Vtop___024root___eval_ico(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_ico\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if ((1ULL & vlSelfRef.__VicoTriggered[0U])) {
+        Vtop___024root___ico_sequent__TOP__0(vlSelf);
+    }
+}
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__ico(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag);
+#endif  // VL_DEBUG
+
+bool Vtop___024root___eval_phase__ico(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_phase__ico\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*0:0*/ __VicoExecute;
+    // Body
+    Vtop___024root___eval_triggers_vec__ico(vlSelf);
+#ifdef VL_DEBUG
+    if (VL_UNLIKELY(vlSymsp->_vm_contextp__->debug())) {
+        Vtop___024root___dump_triggers__ico(vlSelfRef.__VicoTriggered, "ico"s);
+    }
+#endif
+    __VicoExecute = Vtop___024root___trigger_anySet__ico(vlSelfRef.__VicoTriggered);
+    if (__VicoExecute) {
+        Vtop___024root___eval_ico(vlSelf);
+    }
+    return (__VicoExecute);
+}
+
+void Vtop___024root___eval_triggers_ext__act(Vtop___024root* vlSelf, const VlUnpacked<QData/*63:0*/, 2> &latched) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_triggers_ext__act\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    IData/*31:0*/ __VactTrigPreLoopCounter;
+    // Body
+    __VactTrigPreLoopCounter = 0U;
+    do {
+        vlSelfRef.__VactTriggered[((IData)(2U) + __VactTrigPreLoopCounter)] 
+            = (vlSelfRef.__VactTriggered[__VactTrigPreLoopCounter] 
+               & (~ latched[__VactTrigPreLoopCounter]));
+        __VactTrigPreLoopCounter = ((IData)(1U) + __VactTrigPreLoopCounter);
+    } while ((1U > __VactTrigPreLoopCounter));
+}
+
+void Vtop___024root___eval_triggers_vec__act(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_triggers_vec__act\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__VactTriggered[0U] = (QData)((IData)(
+                                                    (((((((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__clk) 
+                                                          & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__clk__0))) 
+                                                         << 6U) 
+                                                        | ((((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__clk) 
+                                                             & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__clk__0))) 
+                                                            << 5U) 
+                                                           | (((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__clk) 
+                                                               & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__clk__0))) 
+                                                              << 4U))) 
+                                                       | (((((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__clk) 
+                                                             & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__clk__0))) 
+                                                            << 3U) 
+                                                           | (((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__clk) 
+                                                               & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__clk__0))) 
+                                                              << 2U)) 
+                                                          | ((((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__clk) 
+                                                               & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__clk__0))) 
+                                                              << 1U) 
+                                                             | ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__clk) 
+                                                                & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__clk__0)))))) 
+                                                      << 8U) 
+                                                     | (((((((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__clk) 
+                                                             & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__clk__0))) 
+                                                            << 3U) 
+                                                           | (((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__clk) 
+                                                               & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__clk__0))) 
+                                                              << 2U)) 
+                                                          | ((((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__clk) 
+                                                               & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__clk__0))) 
+                                                              << 1U) 
+                                                             | ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__clk) 
+                                                                & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__clk__0))))) 
+                                                         << 4U) 
+                                                        | (((((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__clk) 
+                                                              & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__clk__0))) 
+                                                             << 3U) 
+                                                            | (((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__clk) 
+                                                                & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__clk__0))) 
+                                                               << 2U)) 
+                                                           | ((((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk) 
+                                                                & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk__0))) 
+                                                               << 1U) 
+                                                              | ((IData)(vlSelfRef.tb__DOT__clk) 
+                                                                 & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__clk__0)))))))));
+    vlSelfRef.__VactTriggered[1U] = (QData)((IData)(
+                                                    ((vlSelfRef.__VdlySched.awaitingCurrentTime() 
+                                                      << 2U) 
+                                                     | ((((IData)(vlSelfRef.tb__DOT__sample_start) 
+                                                          != (IData)(vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__sample_start__0)) 
+                                                         << 1U) 
+                                                        | ((IData)(vlSelfRef.tb__DOT__bus_start) 
+                                                           != (IData)(vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__bus_start__0))))));
+    vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__clk__0 
+        = vlSelfRef.tb__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk__0 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__clk__0 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__clk__0 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__clk__0 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__clk__0 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__clk__0 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__clk__0 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__clk__0 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__clk__0 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__clk__0 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__clk__0 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__clk__0 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__clk__0 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__clk__0 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__bus_start__0 
+        = vlSelfRef.tb__DOT__bus_start;
+    vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__sample_start__0 
+        = vlSelfRef.tb__DOT__sample_start;
+}
+
+bool Vtop___024root___trigger_anySet__act(const VlUnpacked<QData/*63:0*/, 2> &in) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___trigger_anySet__act\n"); );
+    // Locals
+    IData/*31:0*/ n;
+    // Body
+    n = 0U;
+    do {
+        if (in[n]) {
+            return (1U);
+        }
+        n = ((IData)(1U) + n);
+    } while ((2U > n));
+    return (0U);
+}
+
+void Vtop___024root___act_sequent__TOP__0(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___act_sequent__TOP__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__accumulator 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__accumulator;
+}
+
+void Vtop___024root___act_sequent__TOP__1(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___act_sequent__TOP__1\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__accumulator 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__accumulator;
+}
+
+void Vtop___024root___act_sequent__TOP__2(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___act_sequent__TOP__2\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__accumulator 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__accumulator;
+}
+
+void Vtop___024root___act_sequent__TOP__3(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___act_sequent__TOP__3\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__accumulator 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__accumulator;
+}
+
+void Vtop___024root___act_sequent__TOP__4(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___act_sequent__TOP__4\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__counter 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__counter;
+    vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__state 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__state;
+}
+
+void Vtop___024root___act_sequent__TOP__5(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___act_sequent__TOP__5\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__counter 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__counter;
+    vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__state 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__state;
+}
+
+void Vtop___024root___act_sequent__TOP__6(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___act_sequent__TOP__6\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__counter 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__counter;
+    vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__state 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__state;
+}
+
+void Vtop___024root___act_sequent__TOP__7(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___act_sequent__TOP__7\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__counter 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__counter;
+    vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__state 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__state;
+}
+
+void Vtop___024root___act_sequent__TOP__8(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___act_sequent__TOP__8\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__counter 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__counter;
+    vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__state 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__state;
+}
+
+void Vtop___024root___act_sequent__TOP__9(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___act_sequent__TOP__9\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__lfsr 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__lfsr;
+}
+
+void Vtop___024root___act_sequent__TOP__10(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___act_sequent__TOP__10\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__envelope_counter 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__envelope_counter;
+    vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__stop 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__stop;
+    vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__invert_output 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__invert_output;
+}
+
+void Vtop___024root___act_sequent__TOP__11(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___act_sequent__TOP__11\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk_counter 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk_counter;
+    vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__active 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__active;
+}
+
+void Vtop___024root___act_sequent__TOP__12(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___act_sequent__TOP__12\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__Vdly__tb__DOT__bus_restarts = vlSelfRef.tb__DOT__bus_restarts;
+}
+
+void Vtop___024root___act_sequent__TOP__13(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___act_sequent__TOP__13\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__previous_signal_state_0 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__previous_signal_state_0;
+    vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__previous_signal_state_1 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__previous_signal_state_1;
+}
+
+void Vtop___024root___act_sequent__TOP__14(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___act_sequent__TOP__14\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__previous_signal_state_0 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__previous_signal_state_0;
+    vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__previous_signal_state_1 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__previous_signal_state_1;
+}
+
+void Vtop___024root___act_sequent__TOP__15(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___act_sequent__TOP__15\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    IData/*31:0*/ __Vtask_tb__DOT__sample_open__3____VlefExpr_0;
+    __Vtask_tb__DOT__sample_open__3____VlefExpr_0 = 0;
+    // Body
+    if (vlSelfRef.tb__DOT__sample_strobes) {
+        if (VL_UNLIKELY(((0U == vlSelfRef.tb__DOT__sample_file)))) {
+            __Vtask_tb__DOT__sample_open__3____VlefExpr_0 
+                = VL_VALUEPLUSARGS_INW(2048, "SAMPLES=%s"s, 
+                                       vlSelfRef.tb__DOT__sample_filename);
+            if ((! __Vtask_tb__DOT__sample_open__3____VlefExpr_0)) {
+                VL_ASSIGN_W(2048, vlSelfRef.tb__DOT__sample_filename, Vtop__ConstPool__CONST_hdf66760e_0);
+            }
+            vlSelfRef.tb__DOT__sample_file = VL_FOPEN_NN(
+                                                         VL_CVT_PACK_STR_NW(64, vlSelfRef.tb__DOT__sample_filename)
+                                                         , "w"s);
+            ;
+        }
+        if (VL_UNLIKELY(((0x3fU == (IData)(vlSelfRef.tb__DOT__sample_channels))))) {
+            VL_FWRITEF_NX(vlSelfRef.tb__DOT__sample_file,"%0d %0d %0d %0d %0d %0d\n",6
+                          , '#',8,vlSelfRef.tb__DOT__uo_out
+                          , '#',8,(IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_A)
+                          , '#',8,vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_B
+                          , '#',8,(IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_C)
+                          , '#',1,vlSelfRef.tb__DOT__sample_noise
+                          , '#',4,(IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope));
+        } else if ((1U == (IData)(vlSelfRef.tb__DOT__sample_channels))) {
+            VL_FWRITEF_NX(vlSelfRef.tb__DOT__sample_file,"%0d\n",1
+                          , '#',8,vlSelfRef.tb__DOT__uo_out);
+        } else {
+            if (VL_UNLIKELY(((1U & (IData)(vlSelfRef.tb__DOT__sample_channels))))) {
+                VL_FWRITEF_NX(vlSelfRef.tb__DOT__sample_file,"%0d ",1
+                              , '#',8,vlSelfRef.tb__DOT__uo_out);
+            }
+            if (VL_UNLIKELY(((2U & (IData)(vlSelfRef.tb__DOT__sample_channels))))) {
+                VL_FWRITEF_NX(vlSelfRef.tb__DOT__sample_file,"%0d ",1
+                              , '#',8,vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_A);
+            }
+            if (VL_UNLIKELY(((4U & (IData)(vlSelfRef.tb__DOT__sample_channels))))) {
+                VL_FWRITEF_NX(vlSelfRef.tb__DOT__sample_file,"%0d ",1
+                              , '#',8,vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_B);
+            }
+            if (VL_UNLIKELY(((8U & (IData)(vlSelfRef.tb__DOT__sample_channels))))) {
+                VL_FWRITEF_NX(vlSelfRef.tb__DOT__sample_file,"%0d ",1
+                              , '#',8,vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_C);
+            }
+            if (VL_UNLIKELY(((0x00000010U & (IData)(vlSelfRef.tb__DOT__sample_channels))))) {
+                VL_FWRITEF_NX(vlSelfRef.tb__DOT__sample_file,"%0d ",1
+                              , '#',1,vlSelfRef.tb__DOT__sample_noise);
+            }
+            if (VL_UNLIKELY(((0x00000020U & (IData)(vlSelfRef.tb__DOT__sample_channels))))) {
+                VL_FWRITEF_NX(vlSelfRef.tb__DOT__sample_file,"%0d ",1
+                              , '#',4,vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope);
+            }
+            VL_FWRITEF_NX(vlSelfRef.tb__DOT__sample_file,"\n",0);
+        }
+        vlSelfRef.tb__DOT__sample_cycles = (1ULL + vlSelfRef.tb__DOT__sample_cycles);
+        if (VL_UNLIKELY(((vlSelfRef.tb__DOT__sample_cycles 
+                          == vlSelfRef.tb__DOT__sample_until)))) {
+            VL_FFLUSH_I(vlSelfRef.tb__DOT__sample_file);
+            vlSelfRef.tb__DOT__sample_done = (1U & 
+                                              (~ (IData)(vlSelfRef.tb__DOT__sample_done)));
+            vlSelfRef.tb__DOT__sample_rewind = (VL_FSEEK_I(vlSelfRef.tb__DOT__sample_file, 0U, 0U) == -1 ? -1 : 0);
+        }
+    }
+    if (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__restart_envelope) {
+        vlSelfRef.__Vdly__tb__DOT__bus_restarts = ((IData)(1U) 
+                                                   + vlSelfRef.tb__DOT__bus_restarts);
+    }
+}
+
+void Vtop___024root___act_sequent__TOP__16(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___act_sequent__TOP__16\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__accumulator 
+        = ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__reset)
+            ? 0U : (0x000001ffU & ((0x000000ffU & (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__accumulator)) 
+                                   + (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__value))));
+}
+
+void Vtop___024root___act_sequent__TOP__17(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___act_sequent__TOP__17\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__accumulator 
+        = ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__reset)
+            ? 0U : (0x000001ffU & ((0x000000ffU & (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__accumulator)) 
+                                   + (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__value))));
+}
+
+void Vtop___024root___act_sequent__TOP__18(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___act_sequent__TOP__18\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__accumulator 
+        = ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__reset)
+            ? 0U : (0x000001ffU & ((0x000000ffU & (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__accumulator)) 
+                                   + (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__value))));
+}
+
+void Vtop___024root___act_sequent__TOP__19(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___act_sequent__TOP__19\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__accumulator 
+        = ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__reset)
+            ? 0U : (0x000003ffU & ((0x000001ffU & (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__accumulator)) 
+                                   + (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__value))));
+}
+
+void Vtop___024root___act_sequent__TOP__20(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___act_sequent__TOP__20\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__reset) {
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__counter = 1U;
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__state = 1U;
+    } else if (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__enable) {
+        if (((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__counter) 
+             >= (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__period))) {
+            vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__state 
+                = (1U & (~ (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__state)));
+            vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__counter = 1U;
+        } else {
+            vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__counter 
+                = (0x00000fffU & ((IData)(1U) + (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__counter)));
+        }
+    }
+}
+
+void Vtop___024root___act_sequent__TOP__21(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___act_sequent__TOP__21\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__reset) {
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__counter = 1U;
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__state = 1U;
+    } else if (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__enable) {
+        if (((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__counter) 
+             >= (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__period))) {
+            vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__state 
+                = (1U & (~ (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__state)));
+            vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__counter = 1U;
+        } else {
+            vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__counter 
+                = (0x00000fffU & ((IData)(1U) + (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__counter)));
+        }
+    }
+}
+
+void Vtop___024root___act_sequent__TOP__22(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___act_sequent__TOP__22\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__reset) {
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__counter = 1U;
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__state = 1U;
+    } else if (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__enable) {
+        if (((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__counter) 
+             >= (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__period))) {
+            vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__state 
+                = (1U & (~ (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__state)));
+            vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__counter = 1U;
+        } else {
+            vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__counter 
+                = (0x00000fffU & ((IData)(1U) + (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__counter)));
+        }
+    }
+}
+
+void Vtop___024root___act_sequent__TOP__23(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___act_sequent__TOP__23\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__reset) {
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__counter = 1U;
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__state = 1U;
+    } else if (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__enable) {
+        if (((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__counter) 
+             >= (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__period))) {
+            vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__state 
+                = (1U & (~ (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__state)));
+            vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__counter = 1U;
+        } else {
+            vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__counter 
+                = (0x0000001fU & ((IData)(1U) + (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__counter)));
+        }
+    }
+}
+
+void Vtop___024root___act_sequent__TOP__24(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___act_sequent__TOP__24\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__reset) {
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__counter = 1U;
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__state = 1U;
+    } else if (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__enable) {
+        if (((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__counter) 
+             >= (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__period))) {
+            vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__state 
+                = (1U & (~ (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__state)));
+            vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__counter = 1U;
+        } else {
+            vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__counter 
+                = (0x0000ffffU & ((IData)(1U) + (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__counter)));
+        }
+    }
+}
+
+void Vtop___024root___act_sequent__TOP__25(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___act_sequent__TOP__25\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__reset) {
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__lfsr = 0U;
+    } else if (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__trigger_edge) {
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__lfsr 
+            = (((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__lfsr_shift_in) 
+                << 0x00000010U) | (0x0000ffffU & (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__lfsr 
+                                                  >> 1U)));
+    }
+}
+
+void Vtop___024root___act_sequent__TOP__26(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___act_sequent__TOP__26\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__reset) {
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__envelope_counter = 0U;
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__stop = 0U;
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__invert_output 
+            = (1U & (~ (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__attack___05F)));
+    } else {
+        if (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__trigger_edge) {
+            if ((1U & (~ ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__hold___05F) 
+                          & (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__stop))))) {
+                vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__stop 
+                    = (1U & (((IData)(1U) + (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__envelope_counter)) 
+                             >> 4U));
+                vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__envelope_counter 
+                    = (0x0000000fU & ((IData)(1U) + (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__envelope_counter)));
+            }
+        }
+        if (((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__trigger_edge) 
+             & (0x0fU == (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__envelope_counter)))) {
+            if (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__alternate___05F) {
+                vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__invert_output 
+                    = (1U & (~ (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__invert_output)));
+            }
+        }
+    }
+}
+
+void Vtop___024root___act_sequent__TOP__27(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___act_sequent__TOP__27\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__reset) {
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk_counter = 0U;
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__active = 0U;
+    } else {
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk_counter 
+            = (0x0000007fU & ((IData)(1U) + (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk_counter)));
+        if (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bus_latch_reg) {
+            vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__active 
+                = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__cs;
+        }
+    }
+}
+
+void Vtop___024root___act_sequent__TOP__28(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___act_sequent__TOP__28\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__previous_signal_state_0 
+        = ((1U & (~ (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__reset))) 
+           && (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__signal));
+    vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__previous_signal_state_1 
+        = ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__reset) 
+           || (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__signal));
+}
+
+void Vtop___024root___act_sequent__TOP__29(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___act_sequent__TOP__29\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__previous_signal_state_0 
+        = ((1U & (~ (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__reset))) 
+           && (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__signal));
+    vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__previous_signal_state_1 
+        = ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__reset) 
+           || (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__signal));
+}
+
+void Vtop___024root___act_sequent__TOP__30(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___act_sequent__TOP__30\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__restart_envelope 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__restart_envelope;
+}
+
+void Vtop___024root___act_sequent__TOP__31(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___act_sequent__TOP__31\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*3:0*/ __VdlyDim0__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register__v0;
+    __VdlyDim0__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register__v0 = 0;
+    CData/*7:0*/ __VdlyVal__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register__v1;
+    __VdlyVal__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register__v1 = 0;
+    CData/*3:0*/ __VdlyDim0__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register__v1;
+    __VdlyDim0__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register__v1 = 0;
+    // Body
+    if (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__reset) {
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__unnamedblk1__DOT__i = 0U;
+        while (VL_GTS_III(32, 0x00000010U, vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__unnamedblk1__DOT__i)) {
+            __VdlyDim0__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register__v0 
+                = (0x0000000fU & vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__unnamedblk1__DOT__i);
+            vlSelfRef.__VdlyCommitQueuetb__DOT__tt_um_rejunity_ay8913_uut__DOT__register.enqueue(0U, (IData)(__VdlyDim0__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register__v0));
+            vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__unnamedblk1__DOT__i 
+                = ((IData)(1U) + vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__unnamedblk1__DOT__i);
+        }
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__restart_envelope = 0U;
+    } else {
+        if ((1U & (~ (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__latch)))) {
+            if (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__write) {
+                __VdlyVal__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register__v1 
+                    = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__data;
+                __VdlyDim0__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register__v1 
+                    = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__latched_register;
+                vlSelfRef.__VdlyCommitQueuetb__DOT__tt_um_rejunity_ay8913_uut__DOT__register.enqueue(__VdlyVal__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register__v1, (IData)(__VdlyDim0__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register__v1));
+            }
+        }
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__restart_envelope 
+            = ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__write) 
+               & (0x0dU == (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__latched_register)));
+    }
+}
+
+void Vtop___024root___act_sequent__TOP__32(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___act_sequent__TOP__32\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__latched_register 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__latched_register;
+}
+
+void Vtop___024root___act_sequent__TOP__33(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___act_sequent__TOP__33\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__reset) {
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__latched_register = 0U;
+    } else if (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__latch) {
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__latched_register 
+            = (0x0000000fU & (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__data));
+    }
+}
+
+void Vtop___024root___eval_act(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_act\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    IData/*31:0*/ __Vinline__act_sequent__TOP__15___Vtask_tb__DOT__sample_open__3____VlefExpr_0;
+    __Vinline__act_sequent__TOP__15___Vtask_tb__DOT__sample_open__3____VlefExpr_0 = 0;
+    CData/*3:0*/ __Vinline__act_sequent__TOP__31___VdlyDim0__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register__v0;
+    __Vinline__act_sequent__TOP__31___VdlyDim0__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register__v0 = 0;
+    CData/*7:0*/ __Vinline__act_sequent__TOP__31___VdlyVal__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register__v1;
+    __Vinline__act_sequent__TOP__31___VdlyVal__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register__v1 = 0;
+    CData/*3:0*/ __Vinline__act_sequent__TOP__31___VdlyDim0__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register__v1;
+    __Vinline__act_sequent__TOP__31___VdlyDim0__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register__v1 = 0;
+    // Body
+    if ((0x0000000000000800ULL & vlSelfRef.__VactTriggered[2U])) {
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__accumulator 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__accumulator;
+    }
+    if ((0x0000000000001000ULL & vlSelfRef.__VactTriggered[2U])) {
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__accumulator 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__accumulator;
+    }
+    if ((0x0000000000002000ULL & vlSelfRef.__VactTriggered[2U])) {
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__accumulator 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__accumulator;
+    }
+    if ((0x0000000000004000ULL & vlSelfRef.__VactTriggered[2U])) {
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__accumulator 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__accumulator;
+    }
+    if ((4ULL & vlSelfRef.__VactTriggered[2U])) {
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__counter 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__counter;
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__state 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__state;
+    }
+    if ((8ULL & vlSelfRef.__VactTriggered[2U])) {
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__counter 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__counter;
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__state 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__state;
+    }
+    if ((0x0000000000000010ULL & vlSelfRef.__VactTriggered[2U])) {
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__counter 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__counter;
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__state 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__state;
+    }
+    if ((0x0000000000000040ULL & vlSelfRef.__VactTriggered[2U])) {
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__counter 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__counter;
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__state 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__state;
+    }
+    if ((0x0000000000000200ULL & vlSelfRef.__VactTriggered[2U])) {
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__counter 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__counter;
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__state 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__state;
+    }
+    if ((0x0000000000000020ULL & vlSelfRef.__VactTriggered[2U])) {
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__lfsr 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__lfsr;
+    }
+    if ((0x0000000000000100ULL & vlSelfRef.__VactTriggered[2U])) {
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__envelope_counter 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__envelope_counter;
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__stop 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__stop;
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__invert_output 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__invert_output;
+    }
+    if ((2ULL & vlSelfRef.__VactTriggered[2U])) {
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk_counter 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk_counter;
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__active 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__active;
+    }
+    if ((1ULL & vlSelfRef.__VactTriggered[2U])) {
+        vlSelfRef.__Vdly__tb__DOT__bus_restarts = vlSelfRef.tb__DOT__bus_restarts;
+    }
+    if ((0x0000000000000080ULL & vlSelfRef.__VactTriggered[2U])) {
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__previous_signal_state_0 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__previous_signal_state_0;
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__previous_signal_state_1 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__previous_signal_state_1;
+    }
+    if ((0x0000000000000400ULL & vlSelfRef.__VactTriggered[2U])) {
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__previous_signal_state_0 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__previous_signal_state_0;
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__previous_signal_state_1 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__previous_signal_state_1;
+    }
+    if ((1ULL & vlSelfRef.__VactTriggered[0U])) {
+        if (vlSelfRef.tb__DOT__sample_strobes) {
+            if (VL_UNLIKELY(((0U == vlSelfRef.tb__DOT__sample_file)))) {
+                __Vinline__act_sequent__TOP__15___Vtask_tb__DOT__sample_open__3____VlefExpr_0 
+                    = VL_VALUEPLUSARGS_INW(2048, "SAMPLES=%s"s, 
+                                           vlSelfRef.tb__DOT__sample_filename);
+                if ((! __Vinline__act_sequent__TOP__15___Vtask_tb__DOT__sample_open__3____VlefExpr_0)) {
+                    VL_ASSIGN_W(2048, vlSelfRef.tb__DOT__sample_filename, Vtop__ConstPool__CONST_hdf66760e_0);
+                }
+                vlSelfRef.tb__DOT__sample_file = VL_FOPEN_NN(
+                                                             VL_CVT_PACK_STR_NW(64, vlSelfRef.tb__DOT__sample_filename)
+                                                             , "w"s);
+                ;
+            }
+            if (VL_UNLIKELY(((0x3fU == (IData)(vlSelfRef.tb__DOT__sample_channels))))) {
+                VL_FWRITEF_NX(vlSelfRef.tb__DOT__sample_file,"%0d %0d %0d %0d %0d %0d\n",6
+                              , '#',8,vlSelfRef.tb__DOT__uo_out
+                              , '#',8,(IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_A)
+                              , '#',8,vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_B
+                              , '#',8,(IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_C)
+                              , '#',1,vlSelfRef.tb__DOT__sample_noise
+                              , '#',4,(IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope));
+            } else if ((1U == (IData)(vlSelfRef.tb__DOT__sample_channels))) {
+                VL_FWRITEF_NX(vlSelfRef.tb__DOT__sample_file,"%0d\n",1
+                              , '#',8,vlSelfRef.tb__DOT__uo_out);
+            } else {
+                if (VL_UNLIKELY(((1U & (IData)(vlSelfRef.tb__DOT__sample_channels))))) {
+                    VL_FWRITEF_NX(vlSelfRef.tb__DOT__sample_file,"%0d ",1
+                                  , '#',8,vlSelfRef.tb__DOT__uo_out);
+                }
+                if (VL_UNLIKELY(((2U & (IData)(vlSelfRef.tb__DOT__sample_channels))))) {
+                    VL_FWRITEF_NX(vlSelfRef.tb__DOT__sample_file,"%0d ",1
+                                  , '#',8,vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_A);
+                }
+                if (VL_UNLIKELY(((4U & (IData)(vlSelfRef.tb__DOT__sample_channels))))) {
+                    VL_FWRITEF_NX(vlSelfRef.tb__DOT__sample_file,"%0d ",1
+                                  , '#',8,vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_B);
+                }
+                if (VL_UNLIKELY(((8U & (IData)(vlSelfRef.tb__DOT__sample_channels))))) {
+                    VL_FWRITEF_NX(vlSelfRef.tb__DOT__sample_file,"%0d ",1
+                                  , '#',8,vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_C);
+                }
+                if (VL_UNLIKELY(((0x00000010U & (IData)(vlSelfRef.tb__DOT__sample_channels))))) {
+                    VL_FWRITEF_NX(vlSelfRef.tb__DOT__sample_file,"%0d ",1
+                                  , '#',1,vlSelfRef.tb__DOT__sample_noise);
+                }
+                if (VL_UNLIKELY(((0x00000020U & (IData)(vlSelfRef.tb__DOT__sample_channels))))) {
+                    VL_FWRITEF_NX(vlSelfRef.tb__DOT__sample_file,"%0d ",1
+                                  , '#',4,vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope);
+                }
+                VL_FWRITEF_NX(vlSelfRef.tb__DOT__sample_file,"\n",0);
+            }
+            vlSelfRef.tb__DOT__sample_cycles = (1ULL 
+                                                + vlSelfRef.tb__DOT__sample_cycles);
+            if (VL_UNLIKELY(((vlSelfRef.tb__DOT__sample_cycles 
+                              == vlSelfRef.tb__DOT__sample_until)))) {
+                VL_FFLUSH_I(vlSelfRef.tb__DOT__sample_file);
+                vlSelfRef.tb__DOT__sample_done = (1U 
+                                                  & (~ (IData)(vlSelfRef.tb__DOT__sample_done)));
+                vlSelfRef.tb__DOT__sample_rewind = (VL_FSEEK_I(vlSelfRef.tb__DOT__sample_file, 0U, 0U) == -1 ? -1 : 0);
+            }
+        }
+        if (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__restart_envelope) {
+            vlSelfRef.__Vdly__tb__DOT__bus_restarts 
+                = ((IData)(1U) + vlSelfRef.tb__DOT__bus_restarts);
+        }
+    }
+    if ((0x0000000000000800ULL & vlSelfRef.__VactTriggered[0U])) {
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__accumulator 
+            = ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__reset)
+                ? 0U : (0x000001ffU & ((0x000000ffU 
+                                        & (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__accumulator)) 
+                                       + (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__value))));
+    }
+    if ((0x0000000000001000ULL & vlSelfRef.__VactTriggered[0U])) {
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__accumulator 
+            = ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__reset)
+                ? 0U : (0x000001ffU & ((0x000000ffU 
+                                        & (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__accumulator)) 
+                                       + (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__value))));
+    }
+    if ((0x0000000000002000ULL & vlSelfRef.__VactTriggered[0U])) {
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__accumulator 
+            = ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__reset)
+                ? 0U : (0x000001ffU & ((0x000000ffU 
+                                        & (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__accumulator)) 
+                                       + (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__value))));
+    }
+    if ((0x0000000000004000ULL & vlSelfRef.__VactTriggered[0U])) {
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__accumulator 
+            = ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__reset)
+                ? 0U : (0x000003ffU & ((0x000001ffU 
+                                        & (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__accumulator)) 
+                                       + (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__value))));
+    }
+    if ((4ULL & vlSelfRef.__VactTriggered[0U])) {
+        if (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__reset) {
+            vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__counter = 1U;
+            vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__state = 1U;
+        } else if (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__enable) {
+            if (((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__counter) 
+                 >= (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__period))) {
+                vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__state 
+                    = (1U & (~ (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__state)));
+                vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__counter = 1U;
+            } else {
+                vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__counter 
+                    = (0x00000fffU & ((IData)(1U) + (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__counter)));
+            }
+        }
+    }
+    if ((8ULL & vlSelfRef.__VactTriggered[0U])) {
+        if (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__reset) {
+            vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__counter = 1U;
+            vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__state = 1U;
+        } else if (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__enable) {
+            if (((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__counter) 
+                 >= (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__period))) {
+                vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__state 
+                    = (1U & (~ (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__state)));
+                vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__counter = 1U;
+            } else {
+                vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__counter 
+                    = (0x00000fffU & ((IData)(1U) + (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__counter)));
+            }
+        }
+    }
+    if ((0x0000000000000010ULL & vlSelfRef.__VactTriggered[0U])) {
+        if (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__reset) {
+            vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__counter = 1U;
+            vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__state = 1U;
+        } else if (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__enable) {
+            if (((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__counter) 
+                 >= (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__period))) {
+                vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__state 
+                    = (1U & (~ (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__state)));
+                vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__counter = 1U;
+            } else {
+                vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__counter 
+                    = (0x00000fffU & ((IData)(1U) + (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__counter)));
+            }
+        }
+    }
+    if ((0x0000000000000040ULL & vlSelfRef.__VactTriggered[0U])) {
+        if (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__reset) {
+            vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__counter = 1U;
+            vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__state = 1U;
+        } else if (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__enable) {
+            if (((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__counter) 
+                 >= (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__period))) {
+                vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__state 
+                    = (1U & (~ (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__state)));
+                vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__counter = 1U;
+            } else {
+                vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__counter 
+                    = (0x0000001fU & ((IData)(1U) + (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__counter)));
+            }
+        }
+    }
+    if ((0x0000000000000200ULL & vlSelfRef.__VactTriggered[0U])) {
+        if (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__reset) {
+            vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__counter = 1U;
+            vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__state = 1U;
+        } else if (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__enable) {
+            if (((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__counter) 
+                 >= (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__period))) {
+                vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__state 
+                    = (1U & (~ (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__state)));
+                vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__counter = 1U;
+            } else {
+                vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__counter 
+                    = (0x0000ffffU & ((IData)(1U) + (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__counter)));
+            }
+        }
+    }
+    if ((0x0000000000000020ULL & vlSelfRef.__VactTriggered[0U])) {
+        if (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__reset) {
+            vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__lfsr = 0U;
+        } else if (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__trigger_edge) {
+            vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__lfsr 
+                = (((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__lfsr_shift_in) 
+                    << 0x00000010U) | (0x0000ffffU 
+                                       & (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__lfsr 
+                                          >> 1U)));
+        }
+    }
+    if ((0x0000000000000100ULL & vlSelfRef.__VactTriggered[0U])) {
+        if (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__reset) {
+            vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__envelope_counter = 0U;
+            vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__stop = 0U;
+            vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__invert_output 
+                = (1U & (~ (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__attack___05F)));
+        } else {
+            if (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__trigger_edge) {
+                if ((1U & (~ ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__hold___05F) 
+                              & (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__stop))))) {
+                    vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__stop 
+                        = (1U & (((IData)(1U) + (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__envelope_counter)) 
+                                 >> 4U));
+                    vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__envelope_counter 
+                        = (0x0000000fU & ((IData)(1U) 
+                                          + (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__envelope_counter)));
+                }
+            }
+            if (((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__trigger_edge) 
+                 & (0x0fU == (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__envelope_counter)))) {
+                if (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__alternate___05F) {
+                    vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__invert_output 
+                        = (1U & (~ (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__invert_output)));
+                }
+            }
+        }
+    }
+    if ((2ULL & vlSelfRef.__VactTriggered[0U])) {
+        if (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__reset) {
+            vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk_counter = 0U;
+            vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__active = 0U;
+        } else {
+            vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk_counter 
+                = (0x0000007fU & ((IData)(1U) + (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk_counter)));
+            if (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bus_latch_reg) {
+                vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__active 
+                    = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__cs;
+            }
+        }
+    }
+    if ((0x0000000000000080ULL & vlSelfRef.__VactTriggered[0U])) {
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__previous_signal_state_0 
+            = ((1U & (~ (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__reset))) 
+               && (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__signal));
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__previous_signal_state_1 
+            = ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__reset) 
+               || (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__signal));
+    }
+    if ((0x0000000000000400ULL & vlSelfRef.__VactTriggered[0U])) {
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__previous_signal_state_0 
+            = ((1U & (~ (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__reset))) 
+               && (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__signal));
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__previous_signal_state_1 
+            = ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__reset) 
+               || (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__signal));
+    }
+    if ((2ULL & vlSelfRef.__VactTriggered[2U])) {
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__restart_envelope 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__restart_envelope;
+    }
+    if ((2ULL & vlSelfRef.__VactTriggered[0U])) {
+        if (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__reset) {
+            vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__unnamedblk1__DOT__i = 0U;
+            while (VL_GTS_III(32, 0x00000010U, vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__unnamedblk1__DOT__i)) {
+                __Vinline__act_sequent__TOP__31___VdlyDim0__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register__v0 
+                    = (0x0000000fU & vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__unnamedblk1__DOT__i);
+                vlSelfRef.__VdlyCommitQueuetb__DOT__tt_um_rejunity_ay8913_uut__DOT__register.enqueue(0U, __Vinline__act_sequent__TOP__31___VdlyDim0__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register__v0);
+                vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__unnamedblk1__DOT__i 
+                    = ((IData)(1U) + vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__unnamedblk1__DOT__i);
+            }
+            vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__restart_envelope = 0U;
+        } else {
+            if ((1U & (~ (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__latch)))) {
+                if (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__write) {
+                    __Vinline__act_sequent__TOP__31___VdlyVal__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register__v1 
+                        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__data;
+                    __Vinline__act_sequent__TOP__31___VdlyDim0__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register__v1 
+                        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__latched_register;
+                    vlSelfRef.__VdlyCommitQueuetb__DOT__tt_um_rejunity_ay8913_uut__DOT__register.enqueue(__Vinline__act_sequent__TOP__31___VdlyVal__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register__v1, __Vinline__act_sequent__TOP__31___VdlyDim0__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register__v1);
+                }
+            }
+            vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__restart_envelope 
+                = ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__write) 
+                   & (0x0dU == (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__latched_register)));
+        }
+    }
+    if ((2ULL & vlSelfRef.__VactTriggered[2U])) {
+        vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__latched_register 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__latched_register;
+    }
+    if ((2ULL & vlSelfRef.__VactTriggered[0U])) {
+        if (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__reset) {
+            vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__latched_register = 0U;
+        } else if (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__latch) {
+            vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__latched_register 
+                = (0x0000000fU & (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__data));
+        }
+    }
+}
+
+void Vtop___024root___nba_sequent__TOP__0(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.tb__DOT__bus_restarts = vlSelfRef.__Vdly__tb__DOT__bus_restarts;
+}
+
+void Vtop___024root___nba_sequent__TOP__1(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__1\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__latched_register 
+        = vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__latched_register;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__active 
+        = vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__active;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__restart_envelope 
+        = vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__restart_envelope;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk_counter 
+        = vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk_counter;
+    vlSelfRef.__VdlyCommitQueuetb__DOT__tt_um_rejunity_ay8913_uut__DOT__register.commit(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register);
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__reset 
+        = ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__restart_envelope) 
+           | (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__reset));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_period_A 
+        = ((0x00000f00U & (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[1U] 
+                           << 8U)) | vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[0U]);
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_period_B 
+        = ((0x00000f00U & (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[3U] 
+                           << 8U)) | vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[2U]);
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_period_C 
+        = ((0x00000f00U & (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[5U] 
+                           << 8U)) | vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[4U]);
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_period 
+        = (0x0000001fU & vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[6U]);
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_period 
+        = (((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[12U]) 
+            << 8U) | vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[11U]);
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_alternate 
+        = (1U & (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[13U] 
+                 >> 1U));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_hold 
+        = (1U & vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[13U]);
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_attack 
+        = (1U & (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[13U] 
+                 >> 2U));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_continue 
+        = (1U & (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[13U] 
+                 >> 3U));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_A 
+        = (1U & (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[8U] 
+                 >> 4U));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__amplitude_A 
+        = (0x0000000fU & vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[8U]);
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_B 
+        = (1U & (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[9U] 
+                 >> 4U));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__amplitude_B 
+        = (0x0000000fU & vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[9U]);
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_C 
+        = (1U & (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[10U] 
+                 >> 4U));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__amplitude_C 
+        = (0x0000000fU & vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[10U]);
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_disable_C 
+        = (1U & (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[7U] 
+                 >> 2U));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_disable_B 
+        = (1U & (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[7U] 
+                 >> 1U));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_disable_A 
+        = (1U & vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[7U]);
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_disable_C 
+        = (1U & (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[7U] 
+                 >> 5U));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_disable_B 
+        = (1U & (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[7U] 
+                 >> 4U));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_disable_A 
+        = (1U & (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[7U] 
+                 >> 3U));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__reset 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__reset;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__reset 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__reset;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__period 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_period_A;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__period 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_period_B;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__period 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_period_C;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__period 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_period;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__period 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_period;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__alternate 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_alternate;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__hold 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_hold;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__attack 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_attack;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__continue_ 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_continue;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__period 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__period;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__period 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__period;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__attack_ 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__attack;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__alternate_ 
+        = ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__continue_)
+            ? (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__alternate)
+            : (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__attack));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__hold_ 
+        = (1U & ((~ (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__continue_)) 
+                 | (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__hold)));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__attack___05F 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__attack_;
+    if (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__hold_) {
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__hold___05F = 1U;
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__alternate___05F 
+            = (1U & (~ (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__alternate_)));
+    } else {
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__hold___05F = 0U;
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__alternate___05F 
+            = (1U & (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__alternate_));
+    }
+}
+
+void Vtop___024root___nba_sequent__TOP__2(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__2\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__counter 
+        = vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__counter;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__state 
+        = vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__state;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__out 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__state;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__out;
+}
+
+void Vtop___024root___nba_sequent__TOP__3(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__3\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__counter 
+        = vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__counter;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__state 
+        = vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__state;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__out 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__state;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__out;
+}
+
+void Vtop___024root___nba_sequent__TOP__4(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__4\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__counter 
+        = vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__counter;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__state 
+        = vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__state;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__out 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__state;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__out;
+}
+
+void Vtop___024root___nba_sequent__TOP__5(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__5\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__counter 
+        = vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__counter;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__state 
+        = vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__state;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__out 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__state;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__trigger 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__out;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__signal 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__trigger;
+}
+
+void Vtop___024root___nba_sequent__TOP__6(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__6\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__stop 
+        = vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__stop;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__envelope_counter 
+        = vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__envelope_counter;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__invert_output 
+        = vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__invert_output;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__out 
+        = (0x0000000fU & ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__invert_output)
+                           ? ((IData)(0x0fU) - (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__envelope_counter))
+                           : (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__envelope_counter)));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__out;
+}
+
+void Vtop___024root___nba_sequent__TOP__7(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__7\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__counter 
+        = vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__counter;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__state 
+        = vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__state;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__out 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__state;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__trigger 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__out;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__signal 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__trigger;
+}
+
+void Vtop___024root___nba_sequent__TOP__8(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__8\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__previous_signal_state_1 
+        = vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__previous_signal_state_1;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__previous_signal_state_0 
+        = vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__previous_signal_state_0;
+}
+
+void Vtop___024root___nba_sequent__TOP__9(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__9\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__previous_signal_state_1 
+        = vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__previous_signal_state_1;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__previous_signal_state_0 
+        = vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__previous_signal_state_0;
+}
+
+void Vtop___024root___nba_sequent__TOP__10(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__10\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__accumulator 
+        = vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__accumulator;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__out 
+        = (1U & ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__accumulator) 
+                 >> 8U));
+}
+
+void Vtop___024root___nba_sequent__TOP__11(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__11\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__accumulator 
+        = vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__accumulator;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__out 
+        = (1U & ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__accumulator) 
+                 >> 8U));
+}
+
+void Vtop___024root___nba_sequent__TOP__12(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__12\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__accumulator 
+        = vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__accumulator;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__out 
+        = (1U & ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__accumulator) 
+                 >> 8U));
+}
+
+void Vtop___024root___nba_sequent__TOP__13(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__13\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__accumulator 
+        = vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__accumulator;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__out 
+        = (1U & ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__accumulator) 
+                 >> 9U));
+}
+
+void Vtop___024root___nba_sequent__TOP__14(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__14\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if (vlSelfRef.__VdlySet__tb__DOT__ui_in__v0) {
+        vlSelfRef.__VdlySet__tb__DOT__ui_in__v0 = 0U;
+        vlSelfRef.tb__DOT__ui_in = vlSelfRef.__VdlyVal__tb__DOT__ui_in__v0;
+    }
+    if (vlSelfRef.__VdlySet__tb__DOT__uio_in__v0) {
+        vlSelfRef.__VdlySet__tb__DOT__uio_in__v0 = 0U;
+        vlSelfRef.tb__DOT__uio_in = vlSelfRef.__VdlyVal__tb__DOT__uio_in__v0;
+    }
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__ui_in 
+        = vlSelfRef.tb__DOT__ui_in;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__uio_in 
+        = vlSelfRef.tb__DOT__uio_in;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__data 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__ui_in;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bdir 
+        = (1U & ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__uio_in) 
+                 >> 1U));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bc1 
+        = (1U & (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__uio_in));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__master_clock_control 
+        = (3U & ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__uio_in) 
+                 >> 2U));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__cs 
+        = (0U == (0x0000000fU & ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__data) 
+                                 >> 4U)));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bus_inactive 
+        = (1U & ((~ (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bdir)) 
+                 & (~ (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bc1))));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bus_read 
+        = ((~ (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bdir)) 
+           & (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bc1));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bus_write 
+        = ((~ (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bc1)) 
+           & (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bdir));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bus_latch_reg 
+        = ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bdir) 
+           & (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bc1));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__latch 
+        = ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bus_latch_reg) 
+           & (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__cs));
+}
+
+void Vtop___024root___nba_sequent__TOP__15(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_sequent__TOP__15\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__lfsr 
+        = vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__lfsr;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__is_lfsr_zero 
+        = (0U == vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__lfsr);
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__out 
+        = (1U & (~ vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__lfsr));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__lfsr_shift_in 
+        = (1U & ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__is_lfsr_zero) 
+                 | (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__lfsr 
+                    ^ (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__lfsr 
+                       >> 3U))));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__out;
+}
+
+void Vtop___024root___nba_comb__TOP__0(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_comb__TOP__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_A__DOT__control 
+        = ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_A)
+            ? (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope)
+            : (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__amplitude_A));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_B__DOT__control 
+        = ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_B)
+            ? (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope)
+            : (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__amplitude_B));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_C__DOT__control 
+        = ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_C)
+            ? (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope)
+            : (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__amplitude_C));
+}
+
+void Vtop___024root___nba_comb__TOP__1(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_comb__TOP__1\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__on_negedge 
+        = (1U & (~ ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__signal) 
+                    | ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__signal) 
+                       == (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__previous_signal_state_1)))));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__on_posedge 
+        = ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__signal) 
+           & ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__signal) 
+              != (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__previous_signal_state_0)));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__trigger_edge 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__on_posedge;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__on_edge 
+        = ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__on_posedge) 
+           | (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__on_negedge));
+}
+
+void Vtop___024root___nba_comb__TOP__2(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_comb__TOP__2\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__on_negedge 
+        = (1U & (~ ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__signal) 
+                    | ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__signal) 
+                       == (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__previous_signal_state_1)))));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__on_posedge 
+        = ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__signal) 
+           & ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__signal) 
+              != (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__previous_signal_state_0)));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__trigger_edge 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__on_posedge;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__on_edge 
+        = ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__on_posedge) 
+           | (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__on_negedge));
+}
+
+void Vtop___024root___nba_comb__TOP__3(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_comb__TOP__3\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__uio_out 
+        = ((((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__out) 
+             << 7U) | ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__out) 
+                       << 6U)) | (((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__out) 
+                                   << 5U) | ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__out) 
+                                             << 4U)));
+    vlSelfRef.tb__DOT__uio_out = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__uio_out;
+}
+
+void Vtop___024root___nba_comb__TOP__4(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_comb__TOP__4\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk_master_strobe 
+        = ((1U == (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__master_clock_control)) 
+           | ((2U == (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__master_clock_control))
+               ? (0U == (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk_counter))
+               : (0U == (7U & (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk_counter)))));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__write 
+        = ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bus_write) 
+           & (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__active));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__enable 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk_master_strobe;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__enable 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk_master_strobe;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__enable 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk_master_strobe;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__enable 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk_master_strobe;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__enable 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk_master_strobe;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__enable 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__enable;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__enable 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__enable;
+}
+
+void Vtop___024root___nba_comb__TOP__5(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_comb__TOP__5\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.tb__DOT__sample_noise = ((~ ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_disable_A) 
+                                           & ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_disable_B) 
+                                              & (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_disable_C)))) 
+                                       & (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise));
+}
+
+void Vtop___024root___nba_comb__TOP__6(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_comb__TOP__6\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__channel_A 
+        = (((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_disable_A) 
+            | (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A)) 
+           & ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_disable_A) 
+              | (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise)));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_A__DOT__in 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__channel_A;
+}
+
+void Vtop___024root___nba_comb__TOP__7(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_comb__TOP__7\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__channel_B 
+        = (((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_disable_B) 
+            | (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B)) 
+           & ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_disable_B) 
+              | (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise)));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_B__DOT__in 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__channel_B;
+}
+
+void Vtop___024root___nba_comb__TOP__8(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_comb__TOP__8\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__channel_C 
+        = (((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_disable_C) 
+            | (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C)) 
+           & ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_disable_C) 
+              | (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise)));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_C__DOT__in 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__channel_C;
+}
+
+void Vtop___024root___nba_comb__TOP__9(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_comb__TOP__9\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*4:0*/ __Vtableidx1;
+    __Vtableidx1 = 0;
+    // Body
+    __Vtableidx1 = (((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_A__DOT__control) 
+                     << 1U) | (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_A__DOT__in));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_A__DOT__out 
+        = Vtop__ConstPool__TABLE_hfa54f15d_0[__Vtableidx1];
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_A 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_A__DOT__out;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__value 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_A;
+}
+
+void Vtop___024root___nba_comb__TOP__10(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_comb__TOP__10\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*4:0*/ __Vtableidx2;
+    __Vtableidx2 = 0;
+    // Body
+    __Vtableidx2 = (((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_B__DOT__control) 
+                     << 1U) | (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_B__DOT__in));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_B__DOT__out 
+        = Vtop__ConstPool__TABLE_hfa54f15d_0[__Vtableidx2];
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_B 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_B__DOT__out;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__value 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_B;
+}
+
+void Vtop___024root___nba_comb__TOP__11(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_comb__TOP__11\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*4:0*/ __Vtableidx3;
+    __Vtableidx3 = 0;
+    // Body
+    __Vtableidx3 = (((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_C__DOT__control) 
+                     << 1U) | (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_C__DOT__in));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_C__DOT__out 
+        = Vtop__ConstPool__TABLE_hfa54f15d_0[__Vtableidx3];
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_C 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_C__DOT__out;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__value 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_C;
+}
+
+void Vtop___024root___nba_comb__TOP__12(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___nba_comb__TOP__12\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__master_overflow 
+        = (1U & (((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_A) 
+                  + ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_C) 
+                     + (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_B))) 
+                 >> 9U));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__master 
+        = (0x000001ffU & ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_A) 
+                          + ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_B) 
+                             + (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_C))));
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__value 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__master;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__uo_out 
+        = (0x000000ffU & (((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__master) 
+                           >> 1U) | (- (IData)((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__master_overflow)))));
+    vlSelfRef.tb__DOT__uo_out = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__uo_out;
+}
+
+void Vtop___024root___eval_nba(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_nba\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*4:0*/ __Vinline__nba_comb__TOP__9___Vtableidx1;
+    __Vinline__nba_comb__TOP__9___Vtableidx1 = 0;
+    CData/*4:0*/ __Vinline__nba_comb__TOP__10___Vtableidx2;
+    __Vinline__nba_comb__TOP__10___Vtableidx2 = 0;
+    CData/*4:0*/ __Vinline__nba_comb__TOP__11___Vtableidx3;
+    __Vinline__nba_comb__TOP__11___Vtableidx3 = 0;
+    // Body
+    if ((1ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        vlSelfRef.tb__DOT__bus_restarts = vlSelfRef.__Vdly__tb__DOT__bus_restarts;
+    }
+    if ((2ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        Vtop___024root___nba_sequent__TOP__1(vlSelf);
+    }
+    if ((4ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__counter 
+            = vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__counter;
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__state 
+            = vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__state;
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__out 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__state;
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__out;
+    }
+    if ((8ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__counter 
+            = vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__counter;
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__state 
+            = vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__state;
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__out 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__state;
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__out;
+    }
+    if ((0x0000000000000010ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__counter 
+            = vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__counter;
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__state 
+            = vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__state;
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__out 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__state;
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__out;
+    }
+    if ((0x0000000000000040ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__counter 
+            = vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__counter;
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__state 
+            = vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__state;
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__out 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__state;
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__trigger 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__out;
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__signal 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__trigger;
+    }
+    if ((0x0000000000000100ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__stop 
+            = vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__stop;
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__envelope_counter 
+            = vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__envelope_counter;
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__invert_output 
+            = vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__invert_output;
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__out 
+            = (0x0000000fU & ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__invert_output)
+                               ? ((IData)(0x0fU) - (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__envelope_counter))
+                               : (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__envelope_counter)));
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__out;
+    }
+    if ((0x0000000000000200ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__counter 
+            = vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__counter;
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__state 
+            = vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__state;
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__out 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__state;
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__trigger 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__out;
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__signal 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__trigger;
+    }
+    if ((0x0000000000000080ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__previous_signal_state_1 
+            = vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__previous_signal_state_1;
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__previous_signal_state_0 
+            = vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__previous_signal_state_0;
+    }
+    if ((0x0000000000000400ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__previous_signal_state_1 
+            = vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__previous_signal_state_1;
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__previous_signal_state_0 
+            = vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__previous_signal_state_0;
+    }
+    if ((0x0000000000000800ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__accumulator 
+            = vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__accumulator;
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__out 
+            = (1U & ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__accumulator) 
+                     >> 8U));
+    }
+    if ((0x0000000000001000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__accumulator 
+            = vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__accumulator;
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__out 
+            = (1U & ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__accumulator) 
+                     >> 8U));
+    }
+    if ((0x0000000000002000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__accumulator 
+            = vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__accumulator;
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__out 
+            = (1U & ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__accumulator) 
+                     >> 8U));
+    }
+    if ((0x0000000000004000ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__accumulator 
+            = vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__accumulator;
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__out 
+            = (1U & ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__accumulator) 
+                     >> 9U));
+    }
+    if ((1ULL & (vlSelfRef.__VnbaTriggered[1U] | vlSelfRef.__VnbaTriggered[0U]))) {
+        if (vlSelfRef.__VdlySet__tb__DOT__ui_in__v0) {
+            vlSelfRef.__VdlySet__tb__DOT__ui_in__v0 = 0U;
+            vlSelfRef.tb__DOT__ui_in = vlSelfRef.__VdlyVal__tb__DOT__ui_in__v0;
+        }
+        if (vlSelfRef.__VdlySet__tb__DOT__uio_in__v0) {
+            vlSelfRef.__VdlySet__tb__DOT__uio_in__v0 = 0U;
+            vlSelfRef.tb__DOT__uio_in = vlSelfRef.__VdlyVal__tb__DOT__uio_in__v0;
+        }
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__ui_in 
+            = vlSelfRef.tb__DOT__ui_in;
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__uio_in 
+            = vlSelfRef.tb__DOT__uio_in;
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__data 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__ui_in;
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bdir 
+            = (1U & ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__uio_in) 
+                     >> 1U));
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bc1 
+            = (1U & (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__uio_in));
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__master_clock_control 
+            = (3U & ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__uio_in) 
+                     >> 2U));
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__cs 
+            = (0U == (0x0000000fU & ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__data) 
+                                     >> 4U)));
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bus_inactive 
+            = (1U & ((~ (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bdir)) 
+                     & (~ (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bc1))));
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bus_read 
+            = ((~ (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bdir)) 
+               & (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bc1));
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bus_write 
+            = ((~ (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bc1)) 
+               & (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bdir));
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bus_latch_reg 
+            = ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bdir) 
+               & (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bc1));
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__latch 
+            = ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bus_latch_reg) 
+               & (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__cs));
+    }
+    if ((0x0000000000000020ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__lfsr 
+            = vlSelfRef.__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__lfsr;
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__is_lfsr_zero 
+            = (0U == vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__lfsr);
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__out 
+            = (1U & (~ vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__lfsr));
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__lfsr_shift_in 
+            = (1U & ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__is_lfsr_zero) 
+                     | (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__lfsr 
+                        ^ (vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__lfsr 
+                           >> 3U))));
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__out;
+    }
+    if ((0x0000000000000102ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_A__DOT__control 
+            = ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_A)
+                ? (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope)
+                : (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__amplitude_A));
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_B__DOT__control 
+            = ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_B)
+                ? (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope)
+                : (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__amplitude_B));
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_C__DOT__control 
+            = ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_C)
+                ? (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope)
+                : (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__amplitude_C));
+    }
+    if ((0x00000000000000c0ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__on_negedge 
+            = (1U & (~ ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__signal) 
+                        | ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__signal) 
+                           == (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__previous_signal_state_1)))));
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__on_posedge 
+            = ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__signal) 
+               & ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__signal) 
+                  != (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__previous_signal_state_0)));
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__trigger_edge 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__on_posedge;
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__on_edge 
+            = ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__on_posedge) 
+               | (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__on_negedge));
+    }
+    if ((0x0000000000000600ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__on_negedge 
+            = (1U & (~ ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__signal) 
+                        | ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__signal) 
+                           == (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__previous_signal_state_1)))));
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__on_posedge 
+            = ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__signal) 
+               & ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__signal) 
+                  != (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__previous_signal_state_0)));
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__trigger_edge 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__on_posedge;
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__on_edge 
+            = ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__on_posedge) 
+               | (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__on_negedge));
+    }
+    if ((0x0000000000007800ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__uio_out 
+            = ((((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__out) 
+                 << 7U) | ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__out) 
+                           << 6U)) | (((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__out) 
+                                       << 5U) | ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__out) 
+                                                 << 4U)));
+        vlSelfRef.tb__DOT__uio_out = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__uio_out;
+    }
+    if (((1ULL & vlSelfRef.__VnbaTriggered[1U]) | (3ULL 
+                                                   & vlSelfRef.__VnbaTriggered[0U]))) {
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk_master_strobe 
+            = ((1U == (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__master_clock_control)) 
+               | ((2U == (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__master_clock_control))
+                   ? (0U == (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk_counter))
+                   : (0U == (7U & (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk_counter)))));
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__write 
+            = ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bus_write) 
+               & (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__active));
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__enable 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk_master_strobe;
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__enable 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk_master_strobe;
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__enable 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk_master_strobe;
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__enable 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk_master_strobe;
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__enable 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk_master_strobe;
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__enable 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__enable;
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__enable 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__enable;
+    }
+    if ((0x0000000000000022ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        vlSelfRef.tb__DOT__sample_noise = ((~ ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_disable_A) 
+                                               & ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_disable_B) 
+                                                  & (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_disable_C)))) 
+                                           & (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise));
+    }
+    if ((0x0000000000000026ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__channel_A 
+            = (((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_disable_A) 
+                | (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A)) 
+               & ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_disable_A) 
+                  | (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise)));
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_A__DOT__in 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__channel_A;
+    }
+    if ((0x000000000000002aULL & vlSelfRef.__VnbaTriggered[0U])) {
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__channel_B 
+            = (((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_disable_B) 
+                | (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B)) 
+               & ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_disable_B) 
+                  | (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise)));
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_B__DOT__in 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__channel_B;
+    }
+    if ((0x0000000000000032ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__channel_C 
+            = (((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_disable_C) 
+                | (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C)) 
+               & ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_disable_C) 
+                  | (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise)));
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_C__DOT__in 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__channel_C;
+    }
+    if ((0x0000000000000126ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        __Vinline__nba_comb__TOP__9___Vtableidx1 = 
+            (((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_A__DOT__control) 
+              << 1U) | (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_A__DOT__in));
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_A__DOT__out 
+            = Vtop__ConstPool__TABLE_hfa54f15d_0[__Vinline__nba_comb__TOP__9___Vtableidx1];
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_A 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_A__DOT__out;
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__value 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_A;
+    }
+    if ((0x000000000000012aULL & vlSelfRef.__VnbaTriggered[0U])) {
+        __Vinline__nba_comb__TOP__10___Vtableidx2 = 
+            (((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_B__DOT__control) 
+              << 1U) | (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_B__DOT__in));
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_B__DOT__out 
+            = Vtop__ConstPool__TABLE_hfa54f15d_0[__Vinline__nba_comb__TOP__10___Vtableidx2];
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_B 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_B__DOT__out;
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__value 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_B;
+    }
+    if ((0x0000000000000132ULL & vlSelfRef.__VnbaTriggered[0U])) {
+        __Vinline__nba_comb__TOP__11___Vtableidx3 = 
+            (((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_C__DOT__control) 
+              << 1U) | (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_C__DOT__in));
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_C__DOT__out 
+            = Vtop__ConstPool__TABLE_hfa54f15d_0[__Vinline__nba_comb__TOP__11___Vtableidx3];
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_C 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_C__DOT__out;
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__value 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_C;
+    }
+    if ((0x000000000000013eULL & vlSelfRef.__VnbaTriggered[0U])) {
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__master_overflow 
+            = (1U & (((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_A) 
+                      + ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_C) 
+                         + (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_B))) 
+                     >> 9U));
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__master 
+            = (0x000001ffU & ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_A) 
+                              + ((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_B) 
+                                 + (IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_C))));
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__value 
+            = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__master;
+        vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__uo_out 
+            = (0x000000ffU & (((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__master) 
+                               >> 1U) | (- (IData)((IData)(vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__master_overflow)))));
+        vlSelfRef.tb__DOT__uo_out = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__uo_out;
+    }
+}
+
+void Vtop___024root___timing_ready(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___timing_ready\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if ((1ULL & vlSelfRef.__VactTriggered[1U])) {
+        vlSelfRef.__VtrigSched_h190497a8__0.ready("@( tb.bus_start)");
+    }
+    if ((1ULL & vlSelfRef.__VactTriggered[0U])) {
+        vlSelfRef.__VtrigSched_h4398dd10__0.ready("@(posedge tb.clk)");
+    }
+    if ((2ULL & vlSelfRef.__VactTriggered[1U])) {
+        vlSelfRef.__VtrigSched_hbc41835d__0.ready("@( tb.sample_start)");
+    }
+}
+
+void Vtop___024root___timing_resume(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___timing_resume\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__VtrigSched_h190497a8__0.moveToResumeQueue(
+                                                          "@( tb.bus_start)");
+    vlSelfRef.__VtrigSched_h4398dd10__0.moveToResumeQueue(
+                                                          "@(posedge tb.clk)");
+    vlSelfRef.__VtrigSched_hbc41835d__0.moveToResumeQueue(
+                                                          "@( tb.sample_start)");
+    vlSelfRef.__VtrigSched_h190497a8__0.resume("@( tb.bus_start)");
+    vlSelfRef.__VtrigSched_h4398dd10__0.resume("@(posedge tb.clk)");
+    vlSelfRef.__VtrigSched_hbc41835d__0.resume("@( tb.sample_start)");
+    if ((4ULL & vlSelfRef.__VactTriggered[1U])) {
+        vlSelfRef.__VdlySched.resume();
+    }
+}
+
+void Vtop___024root___trigger_orInto__act_vec_ext(VlUnpacked<QData/*63:0*/, 3> &out, const VlUnpacked<QData/*63:0*/, 2> &in) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___trigger_orInto__act_vec_ext\n"); );
+    // Locals
+    IData/*31:0*/ n;
+    // Body
+    n = 0U;
+    do {
+        out[n] = (out[n] | in[n]);
+        n = ((IData)(1U) + n);
+    } while ((1U >= n));
+}
+
+void Vtop___024root___trigger_orInto__act_ext_vec(VlUnpacked<QData/*63:0*/, 2> &out, const VlUnpacked<QData/*63:0*/, 3> &in) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___trigger_orInto__act_ext_vec\n"); );
+    // Locals
+    IData/*31:0*/ n;
+    // Body
+    n = 0U;
+    do {
+        out[n] = (out[n] | in[n]);
+        n = ((IData)(1U) + n);
+    } while ((1U >= n));
+}
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__act_ext(const VlUnpacked<QData/*63:0*/, 3> &ext, const std::string &tag);
+#endif  // VL_DEBUG
+bool Vtop___024root___trigger_anySet__act_ext(const VlUnpacked<QData/*63:0*/, 3> &in);
+
+bool Vtop___024root___eval_phase__act(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_phase__act\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*0:0*/ __VactExecute;
+    // Body
+    Vtop___024root___eval_triggers_vec__act(vlSelf);
+    Vtop___024root___timing_ready(vlSelf);
+    Vtop___024root___trigger_orInto__act_vec_ext(vlSelfRef.__VactTriggered, vlSelfRef.__VactTriggeredAcc);
+    Vtop___024root___eval_triggers_ext__act(vlSelf, vlSelfRef.__VnbaTriggered);
+#ifdef VL_DEBUG
+    if (VL_UNLIKELY(vlSymsp->_vm_contextp__->debug())) {
+        Vtop___024root___dump_triggers__act_ext(vlSelfRef.__VactTriggered, "act"s);
+    }
+#endif
+    Vtop___024root___trigger_orInto__act_ext_vec(vlSelfRef.__VnbaTriggered, vlSelfRef.__VactTriggered);
+    __VactExecute = Vtop___024root___trigger_anySet__act_ext(vlSelfRef.__VactTriggered);
+    if (__VactExecute) {
+        vlSelfRef.__VactTriggeredAcc.fill(0ULL);
+        Vtop___024root___timing_resume(vlSelf);
+        Vtop___024root___eval_act(vlSelf);
+    }
+    return (__VactExecute);
+}
+
+bool Vtop___024root___trigger_anySet__act_ext(const VlUnpacked<QData/*63:0*/, 3> &in) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___trigger_anySet__act_ext\n"); );
+    // Locals
+    IData/*31:0*/ n;
+    // Body
+    n = 0U;
+    do {
+        if (in[n]) {
+            return (1U);
+        }
+        n = ((IData)(1U) + n);
+    } while ((3U > n));
+    return (0U);
+}
+
+bool Vtop___024root___eval_phase__inact(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_phase__inact\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*0:0*/ __VinactExecute;
+    // Body
+    __VinactExecute = vlSelfRef.__VdlySched.awaitingZeroDelay();
+    if (__VinactExecute) {
+        vlSelfRef.__VdlySched.resumeZeroDelay();
+    }
+    return (__VinactExecute);
+}
+
+void Vtop___024root___trigger_clear__act(VlUnpacked<QData/*63:0*/, 2> &out) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___trigger_clear__act\n"); );
+    // Locals
+    IData/*31:0*/ n;
+    // Body
+    n = 0U;
+    do {
+        out[n] = 0ULL;
+        n = ((IData)(1U) + n);
+    } while ((2U > n));
+}
+
+bool Vtop___024root___eval_phase__nba(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_phase__nba\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*0:0*/ __VnbaExecute;
+    // Body
+    __VnbaExecute = Vtop___024root___trigger_anySet__act(vlSelfRef.__VnbaTriggered);
+    if (__VnbaExecute) {
+        Vtop___024root___eval_nba(vlSelf);
+        Vtop___024root___trigger_clear__act(vlSelfRef.__VnbaTriggered);
+    }
+    return (__VnbaExecute);
+}
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__act(const VlUnpacked<QData/*63:0*/, 2> &triggers, const std::string &tag);
+#endif  // VL_DEBUG
+
+void Vtop___024root___eval(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    IData/*31:0*/ __VicoIterCount;
+    IData/*31:0*/ __VnbaIterCount;
+    // Body
+    __VicoIterCount = 0U;
+    vlSelfRef.__VicoFirstIteration = 1U;
+    do {
+        if (VL_UNLIKELY(((0x00002710U < __VicoIterCount)))) {
+#ifdef VL_DEBUG
+            Vtop___024root___dump_triggers__ico(vlSelfRef.__VicoTriggered, "ico"s);
+#endif
+            VL_FATAL_MT("/root/package/test/tb.v", 10, "", "DIDNOTCONVERGE: Input combinational region did not converge after '--converge-limit' of 10000 tries");
+        }
+        __VicoIterCount = ((IData)(1U) + __VicoIterCount);
+        vlSelfRef.__VicoPhaseResult = Vtop___024root___eval_phase__ico(vlSelf);
+        vlSelfRef.__VicoFirstIteration = 0U;
+    } while (vlSelfRef.__VicoPhaseResult);
+    __VnbaIterCount = 0U;
+    do {
+        if (VL_UNLIKELY(((0x00002710U < __VnbaIterCount)))) {
+#ifdef VL_DEBUG
+            Vtop___024root___dump_triggers__act(vlSelfRef.__VnbaTriggered, "nba"s);
+#endif
+            VL_FATAL_MT("/root/package/test/tb.v", 10, "", "DIDNOTCONVERGE: NBA region did not converge after '--converge-limit' of 10000 tries");
+        }
+        __VnbaIterCount = ((IData)(1U) + __VnbaIterCount);
+        vlSelfRef.__VinactIterCount = 0U;
+        do {
+            if (VL_UNLIKELY(((0x00002710U < vlSelfRef.__VinactIterCount)))) {
+                VL_FATAL_MT("/root/package/test/tb.v", 10, "", "DIDNOTCONVERGE: Inactive region did not converge after '--converge-limit' of 10000 tries");
+            }
+            vlSelfRef.__VinactIterCount = ((IData)(1U) 
+                                           + vlSelfRef.__VinactIterCount);
+            vlSelfRef.__VactIterCount = 0U;
+            do {
+                if (VL_UNLIKELY(((0x00002710U < vlSelfRef.__VactIterCount)))) {
+#ifdef VL_DEBUG
+                    Vtop___024root___dump_triggers__act_ext(vlSelfRef.__VactTriggered, "act"s);
+#endif
+                    VL_FATAL_MT("/root/package/test/tb.v", 10, "", "DIDNOTCONVERGE: Active region did not converge after '--converge-limit' of 10000 tries");
+                }
+                vlSelfRef.__VactIterCount = ((IData)(1U) 
+                                             + vlSelfRef.__VactIterCount);
+                vlSelfRef.__VactPhaseResult = Vtop___024root___eval_phase__act(vlSelf);
+            } while (vlSelfRef.__VactPhaseResult);
+            vlSelfRef.__VinactPhaseResult = Vtop___024root___eval_phase__inact(vlSelf);
+        } while (vlSelfRef.__VinactPhaseResult);
+        vlSelfRef.__VnbaPhaseResult = Vtop___024root___eval_phase__nba(vlSelf);
+    } while (vlSelfRef.__VnbaPhaseResult);
+}
+
+void Vtop___024root____VbeforeTrig_h190497a8__0(Vtop___024root* vlSelf, const char* __VeventDescription) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root____VbeforeTrig_h190497a8__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    VlUnpacked<QData/*63:0*/, 2> __VTmp;
+    // Body
+    __VTmp[0U] = 0ULL;
+    __VTmp[1U] = (QData)((IData)(((IData)(vlSelfRef.tb__DOT__bus_start) 
+                                  != (IData)(vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__bus_start__0))));
+    vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__bus_start__0 
+        = vlSelfRef.tb__DOT__bus_start;
+    if ((1ULL & __VTmp[1U])) {
+        vlSelfRef.__VtrigSched_h190497a8__0.ready(__VeventDescription);
+    }
+    vlSelfRef.__VactTriggeredAcc[1U] = (vlSelfRef.__VactTriggeredAcc[1U] 
+                                        | __VTmp[1U]);
+}
+
+void Vtop___024root____VbeforeTrig_h4398dd10__0(Vtop___024root* vlSelf, const char* __VeventDescription) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root____VbeforeTrig_h4398dd10__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    VlUnpacked<QData/*63:0*/, 2> __VTmp;
+    // Body
+    __VTmp[0U] = (QData)((IData)(((IData)(vlSelfRef.tb__DOT__clk) 
+                                  & (~ (IData)(vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__clk__0)))));
+    vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__clk__0 
+        = vlSelfRef.tb__DOT__clk;
+    if ((1ULL & __VTmp[0U])) {
+        vlSelfRef.__VtrigSched_h4398dd10__0.ready(__VeventDescription);
+    }
+    vlSelfRef.__VactTriggeredAcc[0U] = (vlSelfRef.__VactTriggeredAcc[0U] 
+                                        | __VTmp[0U]);
+}
+
+void Vtop___024root____VbeforeTrig_hbc41835d__0(Vtop___024root* vlSelf, const char* __VeventDescription) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root____VbeforeTrig_hbc41835d__0\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    VlUnpacked<QData/*63:0*/, 2> __VTmp;
+    // Body
+    __VTmp[0U] = 0ULL;
+    __VTmp[1U] = (QData)((IData)((((IData)(vlSelfRef.tb__DOT__sample_start) 
+                                   != (IData)(vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__sample_start__0)) 
+                                  << 1U)));
+    vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__sample_start__0 
+        = vlSelfRef.tb__DOT__sample_start;
+    if ((2ULL & __VTmp[1U])) {
+        vlSelfRef.__VtrigSched_hbc41835d__0.ready(__VeventDescription);
+    }
+    vlSelfRef.__VactTriggeredAcc[1U] = (vlSelfRef.__VactTriggeredAcc[1U] 
+                                        | __VTmp[1U]);
+}
+
+#ifdef VL_DEBUG
+void Vtop___024root___eval_debug_assertions(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_debug_assertions\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+}
+#endif  // VL_DEBUG
@@ -0,0 +1,579 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design implementation internals
+// See Vtop.h for the primary calling header
+
+#include "Vtop__pch.h"
+
+void Vtop___024root___timing_ready(Vtop___024root* vlSelf);
+
+VL_ATTR_COLD void Vtop___024root___eval_static(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_static\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.tb__DOT__bus_count = 0U;
+    vlSelfRef.tb__DOT__bus_start = 0U;
+    vlSelfRef.tb__DOT__bus_done = 0U;
+    vlSelfRef.tb__DOT__bus_restarts = 0U;
+    vlSelfRef.tb__DOT__sample_count = 0U;
+    vlSelfRef.tb__DOT__sample_period_ps = 0ULL;
+    vlSelfRef.tb__DOT__sample_start = 0U;
+    vlSelfRef.tb__DOT__sample_done = 0U;
+    vlSelfRef.tb__DOT__sample_strobes = 0U;
+    vlSelfRef.tb__DOT__sample_cycles = 0ULL;
+    vlSelfRef.tb__DOT__sample_until = 0ULL;
+    vlSelfRef.tb__DOT__sample_channels = 0x3fU;
+    vlSelfRef.tb__DOT__sample_file = 0U;
+    vlSelfRef.__VactTriggered[1U] = (1ULL | vlSelfRef.__VactTriggered[1U]);
+    vlSelfRef.__VactTriggered[1U] = (2ULL | vlSelfRef.__VactTriggered[1U]);
+    vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__clk__0 
+        = vlSelfRef.tb__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk__0 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__clk__0 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__clk__0 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__clk__0 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__clk__0 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__clk__0 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__clk__0 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__clk__0 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__clk__0 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__clk__0 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__clk__0 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__clk__0 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__clk__0 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__clk__0 
+        = vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__clk;
+    vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__bus_start__0 
+        = vlSelfRef.tb__DOT__bus_start;
+    vlSelfRef.__Vtrigprevexpr___TOP__tb__DOT__sample_start__0 
+        = vlSelfRef.tb__DOT__sample_start;
+    Vtop___024root___timing_ready(vlSelf);
+    do {
+        vlSelfRef.__VactTriggeredAcc[vlSelfRef.__Vi] 
+            = vlSelfRef.__VactTriggered[vlSelfRef.__Vi];
+        vlSelfRef.__Vi = ((IData)(1U) + vlSelfRef.__Vi);
+    } while ((1U >= vlSelfRef.__Vi));
+}
+
+VL_ATTR_COLD void Vtop___024root___eval_static__TOP(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_static__TOP\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.tb__DOT__bus_count = 0U;
+    vlSelfRef.tb__DOT__bus_start = 0U;
+    vlSelfRef.tb__DOT__bus_done = 0U;
+    vlSelfRef.tb__DOT__bus_restarts = 0U;
+    vlSelfRef.tb__DOT__sample_count = 0U;
+    vlSelfRef.tb__DOT__sample_period_ps = 0ULL;
+    vlSelfRef.tb__DOT__sample_start = 0U;
+    vlSelfRef.tb__DOT__sample_done = 0U;
+    vlSelfRef.tb__DOT__sample_strobes = 0U;
+    vlSelfRef.tb__DOT__sample_cycles = 0ULL;
+    vlSelfRef.tb__DOT__sample_until = 0ULL;
+    vlSelfRef.tb__DOT__sample_channels = 0x3fU;
+    vlSelfRef.tb__DOT__sample_file = 0U;
+}
+
+VL_ATTR_COLD void Vtop___024root___eval_initial__TOP(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_initial__TOP\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.tb__DOT__uio_oe = 0xf0U;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT__uio_oe = 0xf0U;
+    vlSelfRef.tb__DOT__tt_um_rejunity_ay8913_uut__DOT___unused = 0U;
+}
+
+VL_ATTR_COLD void Vtop___024root___eval_final(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_final\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+}
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__stl(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag);
+#endif  // VL_DEBUG
+VL_ATTR_COLD bool Vtop___024root___eval_phase__stl(Vtop___024root* vlSelf);
+
+VL_ATTR_COLD void Vtop___024root___eval_settle(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_settle\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    IData/*31:0*/ __VstlIterCount;
+    // Body
+    __VstlIterCount = 0U;
+    vlSelfRef.__VstlFirstIteration = 1U;
+    do {
+        if (VL_UNLIKELY(((0x00002710U < __VstlIterCount)))) {
+#ifdef VL_DEBUG
+            Vtop___024root___dump_triggers__stl(vlSelfRef.__VstlTriggered, "stl"s);
+#endif
+            VL_FATAL_MT("/root/package/test/tb.v", 10, "", "DIDNOTCONVERGE: Settle region did not converge after '--converge-limit' of 10000 tries");
+        }
+        __VstlIterCount = ((IData)(1U) + __VstlIterCount);
+        vlSelfRef.__VstlPhaseResult = Vtop___024root___eval_phase__stl(vlSelf);
+        vlSelfRef.__VstlFirstIteration = 0U;
+    } while (vlSelfRef.__VstlPhaseResult);
+}
+
+VL_ATTR_COLD void Vtop___024root___eval_triggers_vec__stl(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_triggers_vec__stl\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    vlSelfRef.__VstlTriggered[0U] = ((0xfffffffffffffffeULL 
+                                      & vlSelfRef.__VstlTriggered[0U]) 
+                                     | (IData)((IData)(vlSelfRef.__VstlFirstIteration)));
+}
+
+VL_ATTR_COLD bool Vtop___024root___trigger_anySet__stl(const VlUnpacked<QData/*63:0*/, 1> &in);
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__stl(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___dump_triggers__stl\n"); );
+    // Body
+    if ((1U & (~ (IData)(Vtop___024root___trigger_anySet__stl(triggers))))) {
+        VL_DBG_MSGS("         No '" + tag + "' region triggers active\n");
+    }
+    if ((1U & (IData)(triggers[0U]))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 0 is active: Internal 'stl' trigger - first iteration\n");
+    }
+}
+#endif  // VL_DEBUG
+
+VL_ATTR_COLD bool Vtop___024root___trigger_anySet__stl(const VlUnpacked<QData/*63:0*/, 1> &in) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___trigger_anySet__stl\n"); );
+    // Locals
+    IData/*31:0*/ n;
+    // Body
+    n = 0U;
+    do {
+        if (in[n]) {
+            return (1U);
+        }
+        n = ((IData)(1U) + n);
+    } while ((1U > n));
+    return (0U);
+}
+
+void Vtop___024root___ico_sequent__TOP__0(Vtop___024root* vlSelf);
+
+VL_ATTR_COLD void Vtop___024root___eval_stl(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_stl\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    if ((1ULL & vlSelfRef.__VstlTriggered[0U])) {
+        Vtop___024root___ico_sequent__TOP__0(vlSelf);
+    }
+}
+
+VL_ATTR_COLD bool Vtop___024root___eval_phase__stl(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___eval_phase__stl\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Locals
+    CData/*0:0*/ __VstlExecute;
+    // Body
+    Vtop___024root___eval_triggers_vec__stl(vlSelf);
+#ifdef VL_DEBUG
+    if (VL_UNLIKELY(vlSymsp->_vm_contextp__->debug())) {
+        Vtop___024root___dump_triggers__stl(vlSelfRef.__VstlTriggered, "stl"s);
+    }
+#endif
+    __VstlExecute = Vtop___024root___trigger_anySet__stl(vlSelfRef.__VstlTriggered);
+    if (__VstlExecute) {
+        Vtop___024root___eval_stl(vlSelf);
+    }
+    return (__VstlExecute);
+}
+
+bool Vtop___024root___trigger_anySet__ico(const VlUnpacked<QData/*63:0*/, 1> &in);
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__ico(const VlUnpacked<QData/*63:0*/, 1> &triggers, const std::string &tag) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___dump_triggers__ico\n"); );
+    // Body
+    if ((1U & (~ (IData)(Vtop___024root___trigger_anySet__ico(triggers))))) {
+        VL_DBG_MSGS("         No '" + tag + "' region triggers active\n");
+    }
+    if ((1U & (IData)(triggers[0U]))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 0 is active: Internal 'ico' trigger - first iteration\n");
+    }
+}
+#endif  // VL_DEBUG
+
+bool Vtop___024root___trigger_anySet__act(const VlUnpacked<QData/*63:0*/, 2> &in);
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__act(const VlUnpacked<QData/*63:0*/, 2> &triggers, const std::string &tag) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___dump_triggers__act\n"); );
+    // Body
+    if ((1U & (~ (IData)(Vtop___024root___trigger_anySet__act(triggers))))) {
+        VL_DBG_MSGS("         No '" + tag + "' region triggers active\n");
+    }
+    if ((1U & (IData)(triggers[0U]))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 0 is active: @(posedge tb.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 1U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 1 is active: @(posedge tb.tt_um_rejunity_ay8913_uut.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 2U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 2 is active: @(posedge tb.tt_um_rejunity_ay8913_uut.tone_A_generator.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 3U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 3 is active: @(posedge tb.tt_um_rejunity_ay8913_uut.tone_B_generator.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 4U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 4 is active: @(posedge tb.tt_um_rejunity_ay8913_uut.tone_C_generator.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 5U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 5 is active: @(posedge tb.tt_um_rejunity_ay8913_uut.noise_generator.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 6U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 6 is active: @(posedge tb.tt_um_rejunity_ay8913_uut.noise_generator.tone.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 7U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 7 is active: @(posedge tb.tt_um_rejunity_ay8913_uut.noise_generator.signal_edge.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 8U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 8 is active: @(posedge tb.tt_um_rejunity_ay8913_uut.envelope_generator.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 9U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 9 is active: @(posedge tb.tt_um_rejunity_ay8913_uut.envelope_generator.tone.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000000aU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 10 is active: @(posedge tb.tt_um_rejunity_ay8913_uut.envelope_generator.signal_edge.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000000bU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 11 is active: @(posedge tb.tt_um_rejunity_ay8913_uut.pwm_A.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000000cU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 12 is active: @(posedge tb.tt_um_rejunity_ay8913_uut.pwm_B.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000000dU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 13 is active: @(posedge tb.tt_um_rejunity_ay8913_uut.pwm_C.clk)\n");
+    }
+    if ((1U & (IData)((triggers[0U] >> 0x0000000eU)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 14 is active: @(posedge tb.tt_um_rejunity_ay8913_uut.pwm_master.clk)\n");
+    }
+    if ((1U & (IData)(triggers[1U]))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 64 is active: @( tb.bus_start)\n");
+    }
+    if ((1U & (IData)((triggers[1U] >> 1U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 65 is active: @( tb.sample_start)\n");
+    }
+    if ((1U & (IData)((triggers[1U] >> 2U)))) {
+        VL_DBG_MSGS("         '" + tag + "' region trigger index 66 is active: @([true] __VdlySched.awaitingCurrentTime())\n");
+    }
+}
+#endif  // VL_DEBUG
+
+#ifdef VL_DEBUG
+VL_ATTR_COLD void Vtop___024root___dump_triggers__act_ext(const VlUnpacked<QData/*63:0*/, 3> &ext, const std::string &tag) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___dump_triggers__act_ext\n"); );
+    // Locals
+    VlUnpacked<QData/*63:0*/, 2> vec;
+    IData/*31:0*/ i;
+    VlUnpacked<QData/*63:0*/, 2> pre;
+    IData/*31:0*/ j;
+    // Body
+    i = 0U;
+    do {
+        vec[i] = ext[i];
+        i = ((IData)(1U) + i);
+    } while ((2U > i));
+    Vtop___024root___dump_triggers__act(vec, tag);
+    j = 0U;
+    do {
+        pre[j] = ext[j];
+        j = ((IData)(1U) + j);
+    } while ((1U > j));
+    do {
+        pre[j] = 0ULL;
+        j = ((IData)(1U) + j);
+    } while ((2U > j));
+    Vtop___024root___dump_triggers__act(pre, VL_CONCATN_NNN(tag, " pre"s));
+}
+#endif  // VL_DEBUG
+
+VL_ATTR_COLD void Vtop___024root___ctor_var_reset(Vtop___024root* vlSelf) {
+    VL_DEBUG_IF(VL_DBG_MSGF("+    Vtop___024root___ctor_var_reset\n"); );
+    Vtop__Syms* const __restrict vlSymsp VL_ATTR_UNUSED = vlSelf->vlSymsp;
+    auto& vlSelfRef = std::ref(*vlSelf).get();
+    // Body
+    const uint64_t __VscopeHash = VL_MURMUR64_HASH(vlSelf->vlNamep);
+    vlSelf->tb__DOT__ui_in = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 1886437189221720169ull);
+    vlSelf->tb__DOT__uo_out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 9409335220426712242ull);
+    vlSelf->tb__DOT__uio_in = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 15728984712686303869ull);
+    vlSelf->tb__DOT__uio_out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 17352281219631353436ull);
+    vlSelf->tb__DOT__uio_oe = 240U;
+    ;
+    vlSelf->tb__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 6743979137201610926ull);
+    vlSelf->tb__DOT__rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 1178771653812172361ull);
+    vlSelf->tb__DOT__ena = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 8408164382330036260ull);
+    for (int __Vi0 = 0; __Vi0 < 65536; ++__Vi0) {
+        vlSelf->tb__DOT__bus_stimulus[__Vi0] = VL_SCOPED_RAND_RESET_I(16, __VscopeHash, 9327524806334914437ull);
+    }
+    vlSelf->tb__DOT__bus_index = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 5793705079307375805ull);
+    VL_SCOPED_RAND_RESET_W(2048, vlSelf->tb__DOT__bus_filename, __VscopeHash, 5584006280272342862ull);
+    vlSelf->tb__DOT__sample_index = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 13260358189630699248ull);
+    vlSelf->tb__DOT__sample_rewind = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 3978475543077810293ull);
+    VL_SCOPED_RAND_RESET_W(2048, vlSelf->tb__DOT__sample_filename, __VscopeHash, 15814325864668097524ull);
+    vlSelf->tb__DOT__sample_noise = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 7935098358576428870ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__ui_in = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 14005157991768359184ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__uo_out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 1051302386797798288ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__uio_in = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 5362223812347042319ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__uio_out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 14430489431851581339ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__uio_oe = 240U;
+    ;
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__ena = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16044562090400548948ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 13370144492170991128ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__rst_n = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 12101841123075010055ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__reset = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 8306679967773039350ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT___unused = 0U;
+    ;
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__master_clock_control = VL_SCOPED_RAND_RESET_I(2, __VscopeHash, 13153908602849975533ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__data = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 4145564449511271997ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk_counter = VL_SCOPED_RAND_RESET_I(7, __VscopeHash, 8060941150315503642ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk_master_strobe = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 17070787182530963657ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bdir = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 1792324783478061931ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bc1 = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 15065198090872018835ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bus_inactive = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 13341090848351358953ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bus_read = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 8532639734802313077ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bus_write = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11240319319159429569ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__bus_latch_reg = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 4375539592188546198ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__cs = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 6420658545569701451ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__latch = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 10596102524703907856ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__write = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 6695214822470359408ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__latched_register = VL_SCOPED_RAND_RESET_I(4, __VscopeHash, 973492230963945005ull);
+    for (int __Vi0 = 0; __Vi0 < 16; ++__Vi0) {
+        vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__register[__Vi0] = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 4524556697205864754ull);
+    }
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__active = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 9650257040644539200ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__restart_envelope = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 5898031330961221064ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_period_A = VL_SCOPED_RAND_RESET_I(12, __VscopeHash, 15585275566713553638ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_period_B = VL_SCOPED_RAND_RESET_I(12, __VscopeHash, 8585583837055812430ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_period_C = VL_SCOPED_RAND_RESET_I(12, __VscopeHash, 14657810630218137195ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_period = VL_SCOPED_RAND_RESET_I(5, __VscopeHash, 6139567075753804732ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_disable_A = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 14422873017562050881ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_disable_B = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 317920923283831265ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_disable_C = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 13196367040933469939ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_disable_A = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 12857413107720506895ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_disable_B = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 12552697436091865111ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_disable_C = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16043907696145693145ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_A = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 10117423217264246944ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_B = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 2946204920347817976ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_C = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 2259509181677783018ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__amplitude_A = VL_SCOPED_RAND_RESET_I(4, __VscopeHash, 11497770532577274406ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__amplitude_B = VL_SCOPED_RAND_RESET_I(4, __VscopeHash, 15301487263737268820ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__amplitude_C = VL_SCOPED_RAND_RESET_I(4, __VscopeHash, 5611024091461091420ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_period = VL_SCOPED_RAND_RESET_I(16, __VscopeHash, 13173840703355760864ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_continue = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11018656386659374610ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_attack = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 15067108432322341950ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_alternate = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 630118136266857211ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_hold = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 6261513775706936134ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 2006039921045946443ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 2849253089528284006ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 2999210381356135339ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 10875118676051902223ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope = VL_SCOPED_RAND_RESET_I(4, __VscopeHash, 16498402727182724507ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__channel_A = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11675516164150233048ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__channel_B = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 10679521612521250672ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__channel_C = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 2040224694279937525ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_A = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 9892615594759110384ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_B = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 14363529902542296452ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__volume_C = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 1446260443361964271ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__master = VL_SCOPED_RAND_RESET_I(9, __VscopeHash, 17729665116329127814ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__master_overflow = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 9058919823872101105ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__unnamedblk1__DOT__i = VL_SCOPED_RAND_RESET_I(32, __VscopeHash, 8668265731249234427ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11283731528447828677ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__enable = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 3886807840833289501ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__reset = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 1481590682091909722ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__period = VL_SCOPED_RAND_RESET_I(12, __VscopeHash, 6341467147188451092ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__out = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 4291305117981257202ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__counter = VL_SCOPED_RAND_RESET_I(12, __VscopeHash, 956293190481605912ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__state = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 2785421568674218880ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 13025573239874778495ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__enable = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11655656632385623985ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__reset = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 4039637276546129895ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__period = VL_SCOPED_RAND_RESET_I(12, __VscopeHash, 14354377368806926211ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__out = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11421988624028260872ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__counter = VL_SCOPED_RAND_RESET_I(12, __VscopeHash, 17432806204679825121ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__state = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 6170882263150623904ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 12368357803840383408ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__enable = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11017864037867372707ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__reset = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 2292820895563479042ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__period = VL_SCOPED_RAND_RESET_I(12, __VscopeHash, 17746293523900263499ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__out = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 13129061841923227448ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__counter = VL_SCOPED_RAND_RESET_I(12, __VscopeHash, 7736609095069872777ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__state = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 8219366624228216019ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 9842317566213586106ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__enable = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 10821030861007026787ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__reset = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 5506584684240015051ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__period = VL_SCOPED_RAND_RESET_I(5, __VscopeHash, 3991613034095870924ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__out = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 10004290472416693086ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__trigger = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11568013406784115525ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__trigger_edge = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 4497083526258171248ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__lfsr = VL_SCOPED_RAND_RESET_I(17, __VscopeHash, 16165893852364545454ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__is_lfsr_zero = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 9751902797153077819ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__lfsr_shift_in = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 8478218423643486148ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 13166491469684356417ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__enable = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 9393677853575895449ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__reset = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 17072330575210722065ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__period = VL_SCOPED_RAND_RESET_I(5, __VscopeHash, 9600689857185471561ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__out = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 12438537855383635840ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__counter = VL_SCOPED_RAND_RESET_I(5, __VscopeHash, 17069419102936667120ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__state = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 595706555996455609ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 15438708390213347734ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__reset = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11260840118051309038ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__signal = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 2317376675355163070ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__on_posedge = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 13850224782562408853ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__on_negedge = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 9740397895983987895ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__on_edge = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 3732916645311767655ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__previous_signal_state_0 = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 6278514233879812081ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__previous_signal_state_1 = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 4014834226932759636ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 12732525037048841057ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__enable = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 6524883931263663255ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__reset = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 10768268189997764807ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__hold = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 10452401718253922247ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__alternate = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 1836986908231006877ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__attack = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 14948490387408127127ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__continue_ = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16652215451559442297ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__period = VL_SCOPED_RAND_RESET_I(16, __VscopeHash, 5187166352315339477ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__out = VL_SCOPED_RAND_RESET_I(4, __VscopeHash, 11640158870851618524ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__hold_ = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16496833988814471390ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__alternate_ = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 17174390047165065369ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__attack_ = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 6726193134932361139ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__hold___05F = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 5971991916425009525ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__alternate___05F = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 6014074652573836905ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__attack___05F = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 7160098218828658739ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__trigger = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 10760723912056838722ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__trigger_edge = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 7467844161541194918ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__invert_output = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 4313569157854541089ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__envelope_counter = VL_SCOPED_RAND_RESET_I(4, __VscopeHash, 5890015814922777061ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__stop = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 10521924045889894375ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 12507226040760254118ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__enable = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 9960556091932115443ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__reset = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 7977590436765136440ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__period = VL_SCOPED_RAND_RESET_I(16, __VscopeHash, 13730250561728439463ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__out = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 9062246084204429245ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__counter = VL_SCOPED_RAND_RESET_I(16, __VscopeHash, 11743544396401574399ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__state = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 4821805107402898157ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 480991340204728002ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__reset = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 16885362972263144796ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__signal = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 7542772062297592243ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__on_posedge = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 2338589718246976478ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__on_negedge = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 12946440478966083352ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__on_edge = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 11711239401307303688ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__previous_signal_state_0 = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 5666106101488513505ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__previous_signal_state_1 = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 8046282915529203302ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_A__DOT__in = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 10763286900724893252ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_A__DOT__control = VL_SCOPED_RAND_RESET_I(4, __VscopeHash, 8286188826120350880ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_A__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 6966800276937718724ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_B__DOT__in = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 8253257411372064138ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_B__DOT__control = VL_SCOPED_RAND_RESET_I(4, __VscopeHash, 7678124690645591823ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_B__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 7477417962440885418ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_C__DOT__in = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 7152172843059017408ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_C__DOT__control = VL_SCOPED_RAND_RESET_I(4, __VscopeHash, 14234538565972679197ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_C__DOT__out = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 7703615725332325620ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 12266125808130645716ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__reset = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 14841172826831850506ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__value = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 208404562611540400ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__out = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 8007414803552405354ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__accumulator = VL_SCOPED_RAND_RESET_I(9, __VscopeHash, 7719183875357120954ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 9517109147003055842ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__reset = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 6417555048777818108ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__value = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 13452070071499079722ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__out = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 1065079316902313152ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__accumulator = VL_SCOPED_RAND_RESET_I(9, __VscopeHash, 8795451057513632092ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 14030579654561106119ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__reset = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 5948864862410755702ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__value = VL_SCOPED_RAND_RESET_I(8, __VscopeHash, 5425156640403224092ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__out = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 12262104561328493723ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__accumulator = VL_SCOPED_RAND_RESET_I(9, __VscopeHash, 14475742131065265990ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__clk = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 10173253778761029334ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__reset = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 3589192042068761951ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__value = VL_SCOPED_RAND_RESET_I(9, __VscopeHash, 11391944406347730786ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__out = VL_SCOPED_RAND_RESET_I(1, __VscopeHash, 5520450332693755581ull);
+    vlSelf->tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__accumulator = VL_SCOPED_RAND_RESET_I(10, __VscopeHash, 17214137831056452838ull);
+    vlSelf->__Vdly__tb__DOT__bus_restarts = 0;
+    vlSelf->__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__active = 0;
+    vlSelf->__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk_counter = 0;
+    vlSelf->__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__latched_register = 0;
+    vlSelf->__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__restart_envelope = 0;
+    vlSelf->__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__counter = 0;
+    vlSelf->__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__state = 0;
+    vlSelf->__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__counter = 0;
+    vlSelf->__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__state = 0;
+    vlSelf->__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__counter = 0;
+    vlSelf->__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__state = 0;
+    vlSelf->__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__lfsr = 0;
+    vlSelf->__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__counter = 0;
+    vlSelf->__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__state = 0;
+    vlSelf->__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__previous_signal_state_0 = 0;
+    vlSelf->__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__previous_signal_state_1 = 0;
+    vlSelf->__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__envelope_counter = 0;
+    vlSelf->__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__stop = 0;
+    vlSelf->__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__invert_output = 0;
+    vlSelf->__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__counter = 0;
+    vlSelf->__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__state = 0;
+    vlSelf->__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__previous_signal_state_0 = 0;
+    vlSelf->__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__previous_signal_state_1 = 0;
+    vlSelf->__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__accumulator = 0;
+    vlSelf->__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__accumulator = 0;
+    vlSelf->__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__accumulator = 0;
+    vlSelf->__Vdly__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__accumulator = 0;
+    vlSelf->__VdlyVal__tb__DOT__uio_in__v0 = 0;
+    vlSelf->__VdlySet__tb__DOT__uio_in__v0 = 0;
+    vlSelf->__VdlyVal__tb__DOT__ui_in__v0 = 0;
+    vlSelf->__VdlySet__tb__DOT__ui_in__v0 = 0;
+    for (int __Vi0 = 0; __Vi0 < 1; ++__Vi0) {
+        vlSelf->__VstlTriggered[__Vi0] = 0;
+    }
+    for (int __Vi0 = 0; __Vi0 < 1; ++__Vi0) {
+        vlSelf->__VicoTriggered[__Vi0] = 0;
+    }
+    for (int __Vi0 = 0; __Vi0 < 3; ++__Vi0) {
+        vlSelf->__VactTriggered[__Vi0] = 0;
+    }
+    for (int __Vi0 = 0; __Vi0 < 2; ++__Vi0) {
+        vlSelf->__VactTriggeredAcc[__Vi0] = 0;
+    }
+    vlSelf->__Vtrigprevexpr___TOP__tb__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__signal_edge__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__signal_edge__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__clk__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__tb__DOT__bus_start__0 = 0;
+    vlSelf->__Vtrigprevexpr___TOP__tb__DOT__sample_start__0 = 0;
+    for (int __Vi0 = 0; __Vi0 < 2; ++__Vi0) {
+        vlSelf->__VnbaTriggered[__Vi0] = 0;
+    }
+    vlSelf->__Vi = 0;
+}
@@ -0,0 +1,62 @@
+// Verilated -*- C++ -*-
+// DESCRIPTION: Verilator output: Design implementation internals
+// See Vtop.h for the primary calling header
+
+#include "Vtop__pch.h"
+
+// Parameter definitions for Vtop___024root
+constexpr CData/*3:0*/ Vtop___024root::tb__DOT__tt_um_rejunity_ay8913_uut__DOT__DA7_DA4_UPPER_ADDRESS_MASK;
+constexpr CData/*7:0*/ Vtop___024root::tb__DOT__tt_um_rejunity_ay8913_uut__DOT__MASTER_MAX_OUTPUT_VOLUME;
+constexpr CData/*3:0*/ Vtop___024root::tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__MAX_VALUE;
+constexpr IData/*31:0*/ Vtop___024root::tb__DOT__tt_um_rejunity_ay8913_uut__DOT__CHANNEL_OUTPUT_BITS;
+constexpr IData/*31:0*/ Vtop___024root::tb__DOT__tt_um_rejunity_ay8913_uut__DOT__MASTER_OUTPUT_BITS;
+constexpr IData/*31:0*/ Vtop___024root::tb__DOT__tt_um_rejunity_ay8913_uut__DOT__REGISTERS;
+constexpr IData/*31:0*/ Vtop___024root::tb__DOT__tt_um_rejunity_ay8913_uut__DOT__MASTER_ACCUMULATOR_BITS;
+constexpr IData/*31:0*/ Vtop___024root::tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_A_generator__DOT__PERIOD_BITS;
+constexpr IData/*31:0*/ Vtop___024root::tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_B_generator__DOT__PERIOD_BITS;
+constexpr IData/*31:0*/ Vtop___024root::tb__DOT__tt_um_rejunity_ay8913_uut__DOT__tone_C_generator__DOT__PERIOD_BITS;
+constexpr IData/*31:0*/ Vtop___024root::tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__LFSR_BITS;
+constexpr IData/*31:0*/ Vtop___024root::tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__LFSR_TAP0;
+constexpr IData/*31:0*/ Vtop___024root::tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__LFSR_TAP1;
+constexpr IData/*31:0*/ Vtop___024root::tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__PERIOD_BITS;
+constexpr IData/*31:0*/ Vtop___024root::tb__DOT__tt_um_rejunity_ay8913_uut__DOT__noise_generator__DOT__tone__DOT__PERIOD_BITS;
+constexpr IData/*31:0*/ Vtop___024root::tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__PERIOD_BITS;
+constexpr IData/*31:0*/ Vtop___024root::tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__ENVELOPE_BITS;
+constexpr IData/*31:0*/ Vtop___024root::tb__DOT__tt_um_rejunity_ay8913_uut__DOT__envelope_generator__DOT__tone__DOT__PERIOD_BITS;
+constexpr IData/*31:0*/ Vtop___024root::tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_A__DOT__CONTROL_BITS;
+constexpr IData/*31:0*/ Vtop___024root::tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_A__DOT__VOLUME_BITS;
+constexpr IData/*31:0*/ Vtop___024root::tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_B__DOT__CONTROL_BITS;
+constexpr IData/*31:0*/ Vtop___024root::tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_B__DOT__VOLUME_BITS;
+constexpr IData/*31:0*/ Vtop___024root::tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_C__DOT__CONTROL_BITS;
+constexpr IData/*31:0*/ Vtop___024root::tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_C__DOT__VOLUME_BITS;
+constexpr IData/*31:0*/ Vtop___024root::tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__VALUE_BITS;
+constexpr IData/*31:0*/ Vtop___024root::tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_A__DOT__ACCUMULATOR_BITS;
+constexpr IData/*31:0*/ Vtop___024root::tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__VALUE_BITS;
+constexpr IData/*31:0*/ Vtop___024root::tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_B__DOT__ACCUMULATOR_BITS;
+constexpr IData/*31:0*/ Vtop___024root::tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__VALUE_BITS;
+constexpr IData/*31:0*/ Vtop___024root::tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_C__DOT__ACCUMULATOR_BITS;
+constexpr IData/*31:0*/ Vtop___024root::tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__VALUE_BITS;
+constexpr IData/*31:0*/ Vtop___024root::tb__DOT__tt_um_rejunity_ay8913_uut__DOT__pwm_master__DOT__ACCUMULATOR_BITS;
+constexpr double Vtop___024root::tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_A__DOT__MAX_VOLUME;
+constexpr double Vtop___024root::tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_B__DOT__MAX_VOLUME;
+constexpr double Vtop___024root::tb__DOT__tt_um_rejunity_ay8913_uut__DOT__attenuation_C__DOT__MAX_VOLUME;
+
+
+void Vtop___024root___ctor_var_reset(Vtop___024root* vlSelf);
+
+Vtop___024root::Vtop___024root(Vtop__Syms* symsp, const char* namep)
+    : __VdlySched{*symsp->_vm_contextp__}
+ {
+    vlSymsp = symsp;
+    vlNamep = strdup(namep);
+    // Reset structure values
+    Vtop___024root___ctor_var_reset(this);
+}
+
+void Vtop___024root::__Vconfigure(bool first) {
+    (void)first;  // Prevent unused variable warning
+}
+
+Vtop___024root::~Vtop___024root() {
+    VL_DO_DANGLING(std::free(const_cast<char*>(vlNamep)), vlNamep);
+}
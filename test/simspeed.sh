@@ -0,0 +1,26 @@
+#!/bin/sh
+# Compares how fast Icarus and Verilator record the bundled tunes
+#
+# MAX_TIME=5 ./simspeed.sh
+#
+MAX_TIME=${MAX_TIME:-5}
+SIMS=${SIMS:-"icarus verilator"}
+export RENDER_CACHE=off     # every run has to simulate
+
+for sim in $SIMS; do
+    make -s SIM=$sim MODULE=record VGM=../music/Stormloard_03Start.atari_st.vgz MAX_TIME=1 > /dev/null 2>&1 # compile once
+done
+
+printf "%-48s" "tune (${MAX_TIME} sec)"
+for sim in $SIMS; do printf "%12s" $sim; done
+printf "\n"
+for vgm in ../music/*.vgz; do
+    printf "%-48s" $(basename $vgm)
+    for sim in $SIMS; do
+        start=$(date +%s.%N)
+        make -s SIM=$sim MODULE=record VGM=$vgm MAX_TIME=$MAX_TIME > /dev/null 2>&1
+        end=$(date +%s.%N)
+        awk "BEGIN { printf \"%11.1fs\", $end - $start }"
+    done
+    printf "\n"
+done
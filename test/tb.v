@@ -10,16 +10,53 @@ that can be driven / tested by the cocotb test.py
 module tb ();
 
     // this part dumps the trace to a vcd file that can be viewed with GTKWave
+    // Trace is dumped only when requested with +dump (see DUMP in Makefile):
+    //   +dump_file=<filename>    tb.vcd by default
+    //   +dump_scope=<scope>      one of: tb (default), uut, tone_A, tone_B, tone_C, noise, envelope
+    //   +dump_start=<ns>         start dumping at the given simulation time
+    //   +dump_stop=<ns>          stop dumping at the given simulation time
+    // NOTE: Verilator dumps the trace only when built with VERILATOR_TRACE=1
+`ifndef VERILATOR
+    reg [8*256-1:0] dump_file;
+    reg [8*32-1:0]  dump_scope;
+    reg [63:0]      dump_start;
+    reg [63:0]      dump_stop;
     initial begin
-        $dumpfile ("tb.vcd");
-        $dumpvars (0, tb);
-        #1;
+        if ($test$plusargs("dump")) begin
+            if (!$value$plusargs("dump_file=%s", dump_file))
+                dump_file = "tb.vcd";
+            if (!$value$plusargs("dump_scope=%s", dump_scope))
+                dump_scope = "tb";
+            $dumpfile (dump_file);
+            case (dump_scope)
+`ifndef GL_TEST
+                "tone_A":   $dumpvars (0, tt_um_rejunity_ay8913_uut.tone_A_generator);
+                "tone_B":   $dumpvars (0, tt_um_rejunity_ay8913_uut.tone_B_generator);
+                "tone_C":   $dumpvars (0, tt_um_rejunity_ay8913_uut.tone_C_generator);
+                "noise":    $dumpvars (0, tt_um_rejunity_ay8913_uut.noise_generator);
+                "envelope": $dumpvars (0, tt_um_rejunity_ay8913_uut.envelope_generator);
+`endif
+                "uut":      $dumpvars (0, tt_um_rejunity_ay8913_uut);
+                default:    $dumpvars (0, tb);
+            endcase
+
+            if ($value$plusargs("dump_start=%d", dump_start) && dump_start > 0) begin
+                $dumpoff;
+                #(dump_start);
+                $dumpon;
+            end
+            if ($value$plusargs("dump_stop=%d", dump_stop) && dump_stop > $time) begin
+                #(dump_stop - $time);
+                $dumpoff;
+            end
+        end
     end
+`endif
 
     // wire up the inputs and outputs
-    wire [7:0] ui_in;
+    reg  [7:0] ui_in;
     wire [7:0] uo_out;
-    wire [7:0] uio_in;
+    reg  [7:0] uio_in;
     wire [7:0] uio_out;
     wire [7:0] uio_oe;
     wire clk;
@@ -47,4 +84,126 @@ module tb ();
         .rst_n      (rst_n)     // not reset
     );
 
+    // Bus player used by the bus fuzzer in test.py to avoid waking up Python for every bus cycle.
+    // test.py writes {uio_in, ui_in} pairs into the +BUS=<filename> hex file ("bus.hex" by default),
+    // sets bus_count and toggles bus_start, then player drives one pair on every clock edge
+    // and toggles bus_done after the last edge.
+    reg [15:0]  bus_stimulus [0:65535];
+    reg [31:0]  bus_count = 0;
+    reg         bus_start = 0;
+    reg         bus_done = 0;
+    integer     bus_index;
+    reg [8*256-1:0] bus_filename;
+
+    always @(bus_start) begin
+        if (bus_count > 0) begin
+            if (!$value$plusargs("BUS=%s", bus_filename))
+                bus_filename = "bus.hex";
+            $readmemh(bus_filename, bus_stimulus, 0, bus_count - 1);
+            for (bus_index = 0; bus_index < bus_count; bus_index = bus_index + 1) begin
+                {uio_in, ui_in} <= bus_stimulus[bus_index]; // non-blocking, the edge samples the previous pair
+                @(posedge clk);
+            end
+            bus_done = ~bus_done;
+        end
+    end
+
+`ifndef GL_TEST
+    // Number of clock cycles restart_envelope was asserted, used by the bus fuzzer
+    reg [31:0]  bus_restarts = 0;
+    always @(posedge clk)
+        if (tt_um_rejunity_ay8913_uut.restart_envelope)
+            bus_restarts <= bus_restarts + 1;
+
+    // Bulk sampler used by record.py to avoid waking up Python for every sample.
+    // Outputs are written as lines into the +SAMPLES=<filename> file ("samples.txt" by default).
+    //
+    // Sample grid mode: record.py sets sample_count and toggles sample_start, then sampler writes sample_count
+    // lines of outputs every sample_period_ps and toggles sample_done once all the samples are flushed to the file.
+    //
+    // Strobe mode: once sample_strobes is set, outputs are written on every clock cycle (native strobe rate of
+    // the chip without clock divider) and sample_cycles counts the written lines. record.py sets sample_until
+    // and sampler toggles sample_done once sample_cycles reaches it and all the lines are flushed to the file.
+    //
+    // In both modes sample_channels selects the channels written into every line (see CHANNELS in record.py).
+    // The file is rewound after every batch and record.py truncates it once read, so it never grows beyond one batch.
+    reg [31:0]  sample_count = 0;
+    reg [63:0]  sample_period_ps = 0;
+    reg         sample_start = 0;
+    reg         sample_done = 0;
+    reg         sample_strobes = 0;
+    reg [63:0]  sample_cycles = 0;
+    reg [63:0]  sample_until = 0;
+    reg [5:0]   sample_channels = 6'b111111;
+    integer     sample_file = 0;
+    integer     sample_index;
+    integer     sample_rewind;
+    reg [8*256-1:0] sample_filename;
+
+    wire sample_noise = &{tt_um_rejunity_ay8913_uut.noise_disable_A,
+                          tt_um_rejunity_ay8913_uut.noise_disable_B,
+                          tt_um_rejunity_ay8913_uut.noise_disable_C} ? 1'b0 : tt_um_rejunity_ay8913_uut.noise;
+
+    task sample_open;
+        if (sample_file == 0) begin
+            if (!$value$plusargs("SAMPLES=%s", sample_filename))
+                sample_filename = "samples.txt";
+            sample_file = $fopen(sample_filename, "w");
+        end
+    endtask
+
+    task sample_flush;
+        begin
+            $fflush(sample_file);
+            sample_rewind = $rewind(sample_file);
+            sample_done = ~sample_done;
+        end
+    endtask
+
+    task sample_write;
+        // same channels as record.py: master, A, B, C, noise, envelope
+        // sample_channels selects the columns to write, bit 0 is master
+        if (sample_channels == 6'b111111)
+            $fwrite(sample_file, "%0d %0d %0d %0d %0d %0d\n",
+                uo_out,
+                tt_um_rejunity_ay8913_uut.volume_A,
+                tt_um_rejunity_ay8913_uut.volume_B,
+                tt_um_rejunity_ay8913_uut.volume_C,
+                sample_noise,
+                tt_um_rejunity_ay8913_uut.envelope);
+        else if (sample_channels == 6'b000001)
+            $fwrite(sample_file, "%0d\n", uo_out);
+        else begin
+            if (sample_channels[0]) $fwrite(sample_file, "%0d ", uo_out);
+            if (sample_channels[1]) $fwrite(sample_file, "%0d ", tt_um_rejunity_ay8913_uut.volume_A);
+            if (sample_channels[2]) $fwrite(sample_file, "%0d ", tt_um_rejunity_ay8913_uut.volume_B);
+            if (sample_channels[3]) $fwrite(sample_file, "%0d ", tt_um_rejunity_ay8913_uut.volume_C);
+            if (sample_channels[4]) $fwrite(sample_file, "%0d ", sample_noise);
+            if (sample_channels[5]) $fwrite(sample_file, "%0d ", tt_um_rejunity_ay8913_uut.envelope);
+            $fwrite(sample_file, "\n");
+        end
+    endtask
+
+    always @(sample_start) begin
+        if (sample_count > 0) begin
+            sample_open;
+            for (sample_index = 0; sample_index < sample_count; sample_index = sample_index + 1) begin
+                #(sample_period_ps / 1000.0);
+                sample_write;
+            end
+            sample_flush;
+        end
+    end
+
+    always @(posedge clk) begin
+        if (sample_strobes) begin
+            sample_open;
+            sample_write;
+            sample_cycles = sample_cycles + 1;
+            if (sample_cycles == sample_until)
+                sample_flush;
+        end
+    end
+`endif
+
 endmodule
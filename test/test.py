@@ -1,8 +1,26 @@
+import glob
+import os
+import random
+import time
+
+import numpy as np
 import cocotb
 from cocotb.clock import Clock
-from cocotb.triggers import RisingEdge, FallingEdge, Timer, ClockCycles
+from cocotb.triggers import RisingEdge, FallingEdge, Timer, ClockCycles, Edge, First
+from cocotb.utils import get_sim_time
+
+import aymodel
+import differential
+import busfuzz
+from bus import RegisterWriter
+import record
+import regdump
+from timeline import Timeline, vgm_to_timeline, register_states
+
+GATE_LEVEL = os.environ.get("GATES") == "yes" # tests that peek into the internals of the design are skipped
 
 MASTER_CLOCK = 2_000_000 # 2MHZ
+STROBE_CYCLES = 8 # tone, noise & envelope counters are enabled every 8th cycle in the default clock configuration
 
 ZERO_VOLUME = 2 # int(0.2 * 256) # AY might be outputing low constant DC as silence instead of complete 0V
 MAX_VOLUME = 255/2
@@ -49,12 +67,21 @@ def print_chip_state(dut):
     except:
         print(dut.uio_in.value, dut.ui_in.value, ">", dut.uo_out.value)
 
+_clock = None
+_registers = None
+def start_clock(dut):
+    # Clock is started once and keeps running until the end of the test, even if the test resets the chip again.
+    # cocotb kills the coroutines of a finished test, so the next test starts a new one.
+    global _clock
+    if _clock is None or _clock.done():
+        master_clock = MASTER_CLOCK # // 8
+        cycle_in_nanoseconds = 1e9 / master_clock # 1 / 2Mhz / nanosecond
+        dut._log.info("start")
+        clock = Clock(dut.clk, cycle_in_nanoseconds, units="ns")
+        _clock = cocotb.start_soon(clock.start())
+
 async def reset(dut):
-    master_clock = MASTER_CLOCK # // 8
-    cycle_in_nanoseconds = 1e9 / master_clock # 1 / 2Mhz / nanosecond
-    dut._log.info("start")
-    clock = Clock(dut.clk, cycle_in_nanoseconds, units="ns")
-    cocotb.start_soon(clock.start())
+    start_clock(dut)
 
     dut.uio_in.value =       0b1111_1111 # Emulate pull-ups on BIDIRECTIONAL pins
 
@@ -68,18 +95,13 @@ async def done(dut):
     dut._log.info("DONE!")
 
 async def set_register(dut, reg, val):
-    dut.uio_in.value =       0b000000_11 # Latch register index
-    dut.ui_in.value  = reg & 15
-    await ClockCycles(dut.clk, 2)
-    print_chip_state(dut)
-    dut.uio_in.value =       0b000000_10 # Write value to register
-    dut.ui_in.value  = val
-    await ClockCycles(dut.clk, 1)
-    print_chip_state(dut)
-    dut.uio_in.value =       0b000000_00 # Inactivate: disable writes and trigger envelope restart, if last write was to Envelope register
-    dut.ui_in.value  = 0
-    await ClockCycles(dut.clk, 1)
-    print_chip_state(dut)
+    # Tests reset the chip behind the back of the writer and expect every write to reach the bus,
+    # so writes are never elided here
+    global _registers
+    if _registers is None or _registers.dut is not dut:
+        _registers = RegisterWriter(dut, elide=False)
+    await _registers.write([(reg, val)])
+    await _registers.edge                   # Inactive cycle: envelope restarts and the outputs follow the new value
 
 def get_output(dut):
     return int(dut.uo_out.value)
@@ -172,7 +194,53 @@ async def set_envelope(dut, frequency=-1, period=-1, shape=-1):
         assert 0 <= shape and shape <= 15
         await set_register(dut, 13, shape)                      # Envelope: set shape
 
-async def assert_output(dut, frequency=-1, period=-1, constant=False, noise=False, v0 = ZERO_VOLUME, v1 = MAX_VOLUME):
+async def fast_forward(dut, generator, max_strobes, strobes_left=2):
+    # Preloads the counter of the tone, noise or envelope `generator` (handle of the tone module instance),
+    # so it wraps around after `strobes_left` strobes instead of counting through the whole period.
+    # Skips at most `max_strobes`, returns the number of skipped clock cycles.
+    await FallingEdge(dut.clk)                                  # deposit between clock edges, while the counter is stable
+    period = max(int(generator.period.value), 1)
+    counter = int(generator.counter.value)
+    skip = min(period - strobes_left + 1 - counter, max_strobes)
+    if skip <= 0:
+        return 0
+    generator.counter.value = counter + skip
+    return skip * STROBE_CYCLES
+
+async def measure_transitions(dut, cycles, threshold, generator=None):
+    # Returns [(timestamp in ns, rising)] of the output crossing the threshold during the next `cycles` of the master clock.
+    # Python wakes up only when the output changes instead of polling it every few cycles.
+    #
+    # If `generator` is given, its counter is fast forwarded close to the wraparound after every flip and
+    # timestamps are extrapolated to the time they would have happened at without skipping.
+    ns_per_cycle = 1e9 / MASTER_CLOCK
+    skipped = 0                                                 # in ns
+    end = get_sim_time(units="ns") + cycles * ns_per_cycle
+    if generator is not None:
+        skipped += await fast_forward(dut, generator, cycles // STROBE_CYCLES) * ns_per_cycle
+    state = get_output(dut) > threshold
+    timestamps = []
+    changes = [Edge(dut.uo_out)] + ([Edge(generator.state)] if generator is not None else [])
+    while True:
+        now = get_sim_time(units="ns")
+        if now + skipped >= end:
+            break
+        trigger = await First(*changes, Timer(end - now - skipped, units="ns", round_mode="round"))
+        if trigger not in changes:
+            break
+        timestamp = get_sim_time(units="ns") + skipped
+        if generator is not None:
+            max_strobes = int((end - timestamp) / ns_per_cycle) // STROBE_CYCLES
+            skipped += await fast_forward(dut, generator, max_strobes) * ns_per_cycle
+        new_state = get_output(dut) > threshold
+        if new_state != state:
+            timestamps.append((timestamp, new_state))
+            state = new_state
+    return timestamps
+
+async def assert_output(dut, frequency=-1, period=-1, constant=False, noise=False, v0 = ZERO_VOLUME, v1 = MAX_VOLUME, fast_forward=None):
+    # fast_forward: handle of the tone module instance (tone, noise or envelope counter) to fast forward during
+    # the measurement, see measure_transitions()
     if frequency > 0:
         period = MASTER_CLOCK // (16 * frequency)
     if period == 0:
@@ -193,19 +261,19 @@ async def assert_output(dut, frequency=-1, period=-1, constant=False, noise=Fals
         cycles_to_collect_data *= pulses_to_collect * 2
     
     mid_volume = (v0 + v1) // 2
-    state_changes = 0
-    for i in range(cycles_to_collect_data//8):
-        last_state = get_output(dut) > mid_volume
-        await ClockCycles(dut.clk, 8)
-        # print_chip_state(dut)
-        new_state = get_output(dut) > mid_volume
-        if last_state != new_state:
-            state_changes += 1
+    timestamps = await measure_transitions(dut, cycles_to_collect_data, mid_volume, generator=fast_forward)
+    state_changes = len(timestamps)
 
     # print(period, cycles_to_collect_data, state_changes)
 
-    time_passed_to_collect_data = cycles_to_collect_data / MASTER_CLOCK
-    measured_frequency = (state_changes / 2) / time_passed_to_collect_data
+    # frequency from the time between the first and the last rising crossing, the output is not a 50% duty square wave
+    # (envelope goes through the logarithmic attenuation and stays above the threshold only for a fraction of the period)
+    rises = [timestamp for timestamp, rising in timestamps if rising]
+    if len(rises) >= 2:
+        measured_frequency = (len(rises) - 1) / ((rises[-1] - rises[0]) / 1e9)
+    else:
+        time_passed_to_collect_data = cycles_to_collect_data / MASTER_CLOCK
+        measured_frequency = (state_changes / 2) / time_passed_to_collect_data
     frequency = MASTER_CLOCK / (16 * period)
 
     if not constant:
@@ -382,6 +450,21 @@ async def test_tone_frequencies(dut):
 
     await done(dut)
 
+# fast forwarding deposits into the counters inside the design, cross-checks the extrapolation against the real measurement
+@cocotb.test(skip=GATE_LEVEL)
+async def test_tone_with_fast_forward(dut):
+    await reset(dut)
+
+    dut._log.info("enable tone on Channel A with maximum volume")
+    await set_mixer(dut, tones_on='A')                          # Mixer: only Channel A tone is enabled
+    await set_volume(dut, 'A', 15)                              # Channel A: no envelope, set channel to maximum volume
+
+    dut._log.info("test tone with the maximum period of 4095 with fast forwarded counter")
+    await set_tone(dut, 'A', period=4095)                       # Tone A: set period to max
+    await assert_output(dut, period=4095, fast_forward=dut.tt_um_rejunity_ay8913_uut.tone_A_generator)
+
+    await done(dut)
+
 @cocotb.test()
 async def test_rapid_tone_frequency_change(dut):
     await reset(dut)
@@ -517,20 +600,22 @@ async def test_envelope_frequency(dut):
 
     await done(dut)
 
-# TOO SLOW, 0.12 Hz requires almost 10 sec of samples!!!
-# @cocotb.test()
-# async def test_envelope_with_lowest_frequency(dut):
-#     await reset(dut)
+# 0.06 Hz requires almost 17 sec of samples, envelope counter is fast forwarded close to the wraparound instead
+@cocotb.test(skip=GATE_LEVEL)
+async def test_envelope_with_lowest_frequency(dut):
+    await reset(dut)
 
-#     dut._log.info("route envelope value directly to the Channel A output")
-#     await set_mixer_off(dut)                                    # Mixer: disable all tones and noises
-#     await set_volume(dut, 'A', envelope=True)                   # Channel A: set channel A to envelope mode
+    dut._log.info("route envelope value directly to the Channel A output")
+    await set_mixer_off(dut)                                    # Mixer: disable all tones and noises
+    await set_volume(dut, 'A', envelope=True)                   # Channel A: set channel A to envelope mode
 
-#     await set_envelope(dut, shape=r"/\/\ ", period=65535)           # Envelope: set /\/\ shape
-#     await assert_output(dut, frequency=0.12)
-#     await assert_output(dut, period=65535*16)
+    envelope = dut.tt_um_rejunity_ay8913_uut.envelope_generator.tone
+    await set_envelope(dut, shape=r"/\/\ ", period=65535)           # Envelope: set /\/\ shape
+    await ClockCycles(dut.clk, 1) # wait for 1 cycle before measuring frequency, see test_envelope_frequency
+    await assert_output(dut, frequency=3906/65535, fast_forward=envelope)
+    await assert_output(dut, period=65535*32, fast_forward=envelope)
 
-#     await done(dut)
+    await done(dut)
 
 # TEMP DISABLED, fails after envelope clock fix!
 # @cocotb.test()
@@ -612,6 +697,122 @@ async def test_envelope_restarts(dut):
 
     await done(dut)
 
+@cocotb.test(skip=GATE_LEVEL)
+async def test_random_writes_against_model(dut):
+    start_clock(dut)
+    player = differential.Player(dut)
+
+    dut._log.info(f"play {differential.DIFF_FRAMES} frames of random register writes, seed {differential.DIFF_SEED}")
+    frames = differential.random_frames(random.Random(differential.DIFF_SEED), differential.DIFF_FRAMES)
+    start = time.time()
+    mismatch = await player.play(frames)
+    dut._log.info(f"compared {player.lines} cycles against the model in {time.time() - start:.2f} sec")
+
+    if mismatch is not None:
+        dut._log.info("shrink the failing sequence")
+        frames, mismatch = await player.shrink(frames)
+        dut._log.error(differential.describe(frames, mismatch))
+    await player.stop()
+    assert mismatch is None
+
+    await done(dut)
+
+@cocotb.test(skip=GATE_LEVEL)
+async def test_bus_fuzzing(dut):
+    await reset(dut)
+
+    dut._log.info(f"issue {busfuzz.FUZZ_CYCLES} random bus cycles, seed {busfuzz.FUZZ_SEED}")
+    fuzzer = busfuzz.BusFuzzer(dut)
+    start = time.time()
+    await fuzzer.run(busfuzz.FUZZ_CYCLES)
+    elapsed = time.time() - start
+    dut._log.info(f"{fuzzer.cycles} bus cycles in {fuzzer.chunks} chunks took {elapsed:.2f} sec, "
+                  f"{fuzzer.cycles / elapsed:.0f} bus cycles per second")
+
+    await done(dut)
+
+# register timelines replay the same register states as the VGM stream, loop points inside a frame included
+@cocotb.test()
+async def test_timeline_loops_match_vgm_stream(dut):
+    for vgm in sorted(glob.glob("../music/*.vgz")):
+        timeline = Timeline(*vgm_to_timeline(vgm))
+        if len(timeline) > 500_000:
+            dut._log.info(f"skip {vgm}, {len(timeline)} frames take minutes to compare")
+            continue
+        dut._log.info(f"compare {vgm} played twice, loop frame {timeline.loop_frame}")
+        music, _, _, _ = record.stream_vgm(vgm, loops=2)
+        assert register_states(timeline.commands(loops=2)) == register_states(music)
+
+# loops of register dumps restore the full register state of the loop frame, not just the registers it changes
+@cocotb.test()
+async def test_register_dump_loops_restore_state(dut):
+    dump = [[0] * 4 for _ in range(14)]     # YM3! is interleaved: all frames of R0, then all frames of R1, ...
+    dump[8] = [0, 15, 15, 15]               # Channel A volume
+    dump[13] = [0x0A, 0xFF, 0xFF, 0xFF]     # Envelope shape written only in the first frame
+    timeline = Timeline(*regdump.parse_ym(b"YM3!" + bytes(sum(dump, []))))
+
+    registers, volumes, restarts = [0] * 14, [], []
+    restarted = False
+    for reg, value in timeline.commands(loops=2):
+        if reg >= 0:
+            registers[reg] = value
+            restarted |= reg == 13
+        else:
+            volumes.append(registers[8])
+            restarts.append(restarted)
+            restarted = False
+    assert volumes == [0, 15, 15, 15, 0, 15, 15, 15]
+    assert restarts == [True, False, False, False, True, False, False, False]
+
+# fixture.ym packed with -lh5- (level 0 header) and stored with -lh0- (level 2 header),
+# both archives extract to fixture.ym with lhafile and bsdtar
+YM_FIXTURE = "fixtures/fixture.ym"
+LHA_FIXTURES = ["fixtures/fixture.lh5.ym", "fixtures/fixture.lh0.ym"]
+
+@cocotb.test()
+async def test_lha_packed_ym_decodes_to_the_same_frames(dut):
+    with open(YM_FIXTURE, "rb") as f:
+        raw = f.read()
+    frames, info = regdump.load_ym(YM_FIXTURE)
+    assert len(frames) == 256 and info["loop_frame"] == 64 and info["title"] == "Fixture"
+    assert list(frames['registers'][5, 8:11]) == [10, 16, 9]   # Channel A, B, C amplitudes of the 6th frame
+
+    for packed in LHA_FIXTURES:
+        dut._log.info(f"decode {packed}")
+        with open(packed, "rb") as f:
+            name, data = regdump.lha_extract(f.read())
+        assert name == "fixture.ym"
+        assert data == raw
+        packed_frames, packed_info = regdump.load_ym(packed)
+        assert (packed_frames == frames).all()
+        assert packed_info["loop_frame"] == info["loop_frame"]
+
+# tune that plays samples by writing amplitude registers every few samples, one of the densest in ../music
+DENSE_VGM = "../music/Turrican_01Welcome.atari_st.vgz"
+
+@cocotb.test()
+async def test_model_renders_dense_tune_faster_than_real_time(dut):
+    music, length_in_seconds, clock_rate, sampling_rate = record.load_vgm(DENSE_VGM)
+    start = time.time()
+    samples = aymodel.render_commands(music, clock_rate, sampling_rate)
+    elapsed = time.time() - start
+    dut._log.info(f"rendered {len(samples[0]) / sampling_rate:.2f} sec of {DENSE_VGM} in {elapsed:.2f} sec")
+    assert elapsed < length_in_seconds / 4
+
+    # waits gathered by render_commands() render exactly the same outputs as rendering every wait on its own
+    max_time = 0.25
+    chip = aymodel.AY8913(clock_rate, sampling_rate)
+    chunks = []
+    for reg, val in music:
+        if reg >= 0:
+            chip.write(reg, val)
+        elif chip.samples < max_time * sampling_rate:
+            chunks.append(chip.render(min(val, int(max_time * sampling_rate) - chip.samples)))
+    outputs = np.concatenate(chunks, axis=1)
+    expected = [aymodel.to_pcm(out, bits) for out, bits in zip(outputs, aymodel.CHANNEL_BITS)]
+    for got, want in zip(aymodel.render_commands(music, clock_rate, sampling_rate, max_time), expected):
+        assert (got == want).all()
+
 # @cocotb.test()
 async def test_psg(dut):
 
@@ -0,0 +1,244 @@
+# Frame based register timeline of a tune
+#
+# VGM commands are converted once into a dense array of frames, one frame per group of register writes
+# followed by a wait. Every frame holds the state of all 14 sound registers after its writes, the mask of
+# the registers written in the frame (bit 13 is set when the Envelope Shape register is written and the
+# envelope restarts, even if the value did not change), the wait in samples and the start of the frame in
+# samples since the start of the tune. Any time position is located by a binary search over the starts and
+# since every frame holds the full register state, playback can start from any frame.
+#
+# Timelines are stored next to the source as a .npy file that is loaded memory-mapped without any parsing,
+# clock rate and loop information go into a small .json file alongside. Loops of VGM files replay the writes
+# of the frames from the loop frame on, while loops of register dumps ("snapshots" in the info, see regdump.py)
+# restore the full register state of the loop frame.
+#
+# How to run this script from command line:
+#
+# python timeline.py ../music/*.vgz         # converts tunes, up-to-date timelines are skipped
+# python timeline.py ../music/*.ym          # YM and PSG register dumps are converted too, see regdump.py
+#
+
+import json
+import os
+import sys
+import numpy as np
+
+import vgmparse
+
+REGISTERS = 14      # I/O port registers 14 and 15 have no effect on the sound and are dropped
+ENVELOPE_SHAPE = 13
+
+TIMELINE_DTYPE = np.dtype([
+    ('registers', 'u1', (REGISTERS,)),
+    ('written', '<u2'),
+    ('wait', '<u4'),
+    ('start', '<u8'),
+])
+
+CMD_AY8910 = 0xA0
+CMD_WAITS = [0x61, 0x62, 0x63] + list(range(0x70, 0x80))
+CMD_EOF = 0x66
+
+def timeline_filename(filename):
+    return filename + ".timeline.npy"
+
+def info_filename(filename):
+    return filename[:-len(".npy")] + ".json" if filename.endswith(".npy") else filename + ".json"
+
+def frames_from_commands(command, aa, dd, wait, split=None):
+    # Columns of VGM commands (see vgmparse.Parser.command_dtype) into an array of frames, no per command objects.
+    # split: index of the command that has to start a new frame (loop point), even in the middle of a frame
+    is_write = (command == CMD_AY8910) & (aa < REGISTERS)
+    is_wait = np.isin(command, CMD_WAITS)
+
+    # a write right after a wait starts a new frame, waits before the first write make up a frame without writes,
+    # dropped commands (writes to the I/O ports) belong to the frame of the preceding command
+    kept = np.flatnonzero(is_write | is_wait)
+    after_wait = np.concatenate([[True], is_wait[kept][:-1]])
+    starts = is_write[kept] & after_wait | (np.arange(len(kept)) == 0)
+    if split is not None:
+        starts[np.searchsorted(kept, split):][:1] = True      # first kept command at or after the split
+    kept_frame = np.cumsum(starts) - 1
+    frame = kept_frame[np.maximum(np.cumsum(is_write | is_wait) - 1, 0)] if len(kept) > 0 else \
+            np.zeros(len(command), dtype=np.int64)
+    count = int(kept_frame[-1]) + 1 if len(kept) > 0 else 0
+
+    frames = np.zeros(count, dtype=TIMELINE_DTYPE)
+    frames['wait'] = np.bincount(frame[is_wait], weights=wait[is_wait], minlength=count).astype(np.uint32)
+    frames['start'][1:] = np.cumsum(frames['wait'], dtype=np.uint64)[:-1]
+
+    write_frame, write_reg, write_data = frame[is_write], aa[is_write].astype(np.int64), dd[is_write]
+    np.bitwise_or.at(frames['written'], write_frame, (1 << write_reg).astype(np.uint16))
+
+    # the last write of every register in a frame wins, then the register values are carried forward
+    for reg in range(REGISTERS):
+        mask = write_reg == reg
+        frames_written, data = write_frame[mask], write_data[mask]
+        values = np.zeros(count, dtype=np.uint8)
+        last = np.full(count, -1, dtype=np.int64)
+        last[frames_written] = np.arange(len(frames_written))      # later writes overwrite earlier ones
+        written = last >= 0
+        values[written] = data[last[written]]
+        carry = np.maximum.accumulate(np.where(written, np.arange(count), -1))
+        frames['registers'][:, reg] = np.where(carry >= 0, values[np.maximum(carry, 0)], 0)
+    return frames, frame
+
+def vgm_to_timeline(filename):
+    # Returns the frames and the info dict of a VGM file
+    with open(filename, "rb") as f:
+        vgm_data = vgmparse.Parser(f.read())
+    metadata = vgm_data.metadata
+    commands = vgm_data.commands
+    eof = np.flatnonzero(commands['command'] == CMD_EOF)
+    if len(eof) > 0:
+        commands = commands[:eof[0]]
+
+    command = commands['command']
+    unsupported = np.flatnonzero(~((command == CMD_AY8910) | np.isin(command, CMD_WAITS)))
+    if len(unsupported) > 0:
+        raise ValueError(f"Unsupported command 0x{command[unsupported[0]]:02x} in {filename}")
+
+    # Loop offset is relative to its own location in the header, 0 means there is no loop.
+    # Loop point starts a frame of its own, so writes before it in the same frame are not replayed by loops.
+    loop_command = None
+    if metadata.get('loop_offset', 0):
+        loop_command = int(np.searchsorted(commands['offset'], metadata['loop_offset'] + 0x1c))
+        loop_command = loop_command if loop_command < len(command) else None
+    frames, frame = frames_from_commands(command, commands['aa'], commands['dd'], commands['wait'], split=loop_command)
+
+    loop_frame = 0
+    if loop_command is not None:
+        is_kept = (command != CMD_AY8910) | (commands['aa'] < REGISTERS)
+        kept_after_loop = np.flatnonzero(is_kept[loop_command:])
+        loop_frame = int(frame[loop_command + kept_after_loop[0]]) if len(kept_after_loop) > 0 else 0
+    info = {
+        "source": os.path.basename(filename),
+        "clock_rate": metadata['ay8910_clock'],
+        "sampling_rate": 44100,                 # sampling rate is hardcoded in VGM
+        "total_samples": int(frames['wait'].sum()),
+        "loop_frame": loop_frame,
+    }
+    return frames, info
+
+def save_timeline(frames, info, filename):
+    np.save(filename, frames)
+    with open(info_filename(filename), "w") as f:
+        json.dump(info, f, indent=2)
+
+def convert(filename, output=None, force=False):
+    # Converts the tune into a timeline next to it, unless the timeline is newer than the tune
+    output = output or timeline_filename(filename)
+    if not force and os.path.exists(output) and os.path.exists(info_filename(output)) and \
+       os.path.getmtime(output) >= os.path.getmtime(filename):
+        return output, False
+    if filename.lower().endswith((".ym", ".psg")):
+        import regdump
+        frames, info = regdump.load(filename)
+    else:
+        frames, info = vgm_to_timeline(filename)
+    save_timeline(frames, info, output)
+    return output, True
+
+def register_states(commands):
+    # Collapses [register, value] writes and [-1, samples] waits into [(registers, envelope restarted, samples)],
+    # one entry per wait. Consecutive waits are merged and the order of writes between waits does not matter,
+    # so command streams of the same tune compare equal regardless of how their writes were grouped into frames.
+    registers = [0] * REGISTERS
+    restarted = False
+    written = True
+    states = []
+    for reg, value in commands:
+        if reg >= REGISTERS:
+            continue                            # I/O ports
+        if reg >= 0:
+            registers[reg] = value
+            restarted |= reg == ENVELOPE_SHAPE
+            written = True
+        elif value > 0:
+            if written:
+                states.append((tuple(registers), restarted, value))
+            else:
+                states[-1] = states[-1][:2] + (states[-1][2] + value,)
+            restarted = written = False
+    return states
+
+class Timeline:
+    def __init__(self, frames, info):
+        self.frames = frames
+        self.info = info
+        self.clock_rate = self.info["clock_rate"]
+        self.sampling_rate = self.info["sampling_rate"]
+        self.loop_frame = self.info["loop_frame"]
+
+    @classmethod
+    def load(cls, filename, mmap=True):
+        frames = np.load(filename, mmap_mode="r" if mmap else None)
+        assert frames.dtype == TIMELINE_DTYPE, f"{filename} is not a register timeline"
+        with open(info_filename(filename)) as f:
+            return cls(frames, json.load(f))
+
+    def __len__(self):
+        return len(self.frames)
+
+    def total_samples(self, loops=1):
+        loop_samples = self.info["total_samples"] - int(self.frames['start'][self.loop_frame]) if len(self) else 0
+        return self.info["total_samples"] + (loops - 1) * loop_samples
+
+    @property
+    def envelope_restarts(self):
+        # frames that write the Envelope Shape register
+        return (self.frames['written'] >> ENVELOPE_SHAPE & 1).astype(bool)
+
+    def seek(self, position):
+        # Index of the frame playing at the given position in samples since the start of the tune
+        return max(int(np.searchsorted(self.frames['start'], position, side="right")) - 1, 0)
+
+    def writes(self, frame, full=False):
+        # [(register, value)] written by the frame, full=True returns all the registers (to start playback mid-tune)
+        registers = self.frames['registers'][frame].tolist()
+        written = int(self.frames['written'][frame])
+        return [(reg, registers[reg]) for reg in range(REGISTERS) if full or written >> reg & 1]
+
+    def commands(self, loops=1, start_frame=0, chunk_size=4096):
+        # Yields the same commands as load_vgm() in record.py: [register, value] writes and [-1, samples] waits.
+        # Registers are written in ascending order within a frame. Frames are decoded in chunks.
+        # registers written on top of the first frame: playback starting mid-tune needs the full register state,
+        # loops of register dumps restore the state of the loop frame, Envelope Shape only if the frame writes it
+        restore = (1 << REGISTERS) - 1 if start_frame > 0 else 0
+        loop_restore = (1 << ENVELOPE_SHAPE) - 1 if self.info.get("snapshots") else 0
+        frame = start_frame
+        while loops > 0:
+            while frame < len(self):
+                chunk = self.frames[frame:frame + chunk_size]
+                written = chunk['written']
+                if restore:
+                    written = written.copy()
+                    written[0] |= restore
+                    restore = 0
+                bits = (written[:, None] >> np.arange(REGISTERS)) & 1
+                counts = bits.sum(axis=1).tolist()
+                rows, regs = np.nonzero(bits)
+                values = chunk['registers'][rows, regs].tolist()
+                regs = regs.tolist()
+                waits = chunk['wait'].tolist()
+                i = 0
+                for count, wait in zip(counts, waits):
+                    for j in range(i, i + count):
+                        yield [regs[j], values[j]]
+                    i += count
+                    if wait > 0:
+                        yield [-1, wait]
+                frame += len(chunk)
+            loops -= 1
+            frame = self.loop_frame
+            restore = loop_restore
+
+def main():
+    for filename in sys.argv[1:]:
+        output, converted = convert(filename)
+        timeline = Timeline.load(output)
+        print(f"{output}: {len(timeline)} frames, {timeline.info['total_samples'] / timeline.sampling_rate:.2f} sec"
+              + ("" if converted else " (up to date)"))
+
+if __name__ == "__main__":
+    main()
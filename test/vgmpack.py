@@ -0,0 +1,131 @@
+# Packed corpus of pre-decompressed VGM files
+#
+# Tunes are decompressed once and concatenated into a single file followed by a table of offsets.
+# The pack is opened with mmap and every tune is a zero-copy memoryview slice of it, ready for
+# vgmparse.Parser, vgmparse.Stream and vgmparse.scan, so corpus-wide jobs pay neither for gunzipping
+# nor for opening thousands of files.
+#
+# Layout (little endian):
+#   header  8s magic, u32 version, u32 number of tunes, u64 offset of the table
+#   payload decompressed VGM files, every one aligned to 16 bytes
+#   table   u64 offset, u64 size, u16 name length, name (UTF-8) for every tune
+#
+# How to run this script from command line:
+#
+# python vgmpack.py ../music/corpus.vgmpack ../music/*.vgz        # builds the pack
+# python vgmpack.py ../music/corpus.vgmpack                       # lists the tunes in the pack
+#
+# make MODULE=record PACK=../music/corpus.vgmpack VGM=Arcanoid_01Story.vgz
+#
+
+import gzip
+import mmap
+import os
+import struct
+import sys
+
+import vgmparse
+
+MAGIC = b"VGMPACK\0"
+VERSION = 1
+ALIGNMENT = 16
+
+HEADER = struct.Struct("<8sIIQ")
+ENTRY = struct.Struct("<QQH")
+
+def read_vgm(filename):
+    # Decompressed contents of a VGM or VGZ file
+    with open(filename, "rb") as f:
+        data = f.read()
+    if data[:4] != vgmparse.Parser.vgm_magic_number:
+        data = gzip.decompress(data)
+    if data[:4] != vgmparse.Parser.vgm_magic_number:
+        raise ValueError(f"{filename} does not appear to be a valid VGM file")
+    return data
+
+def build(pack_filename, filenames):
+    # Tunes are named by their file names, returns the number of tunes packed
+    names = [os.path.basename(filename) for filename in filenames]
+    assert len(set(names)) == len(names), "tunes in a pack must have unique file names"
+    entries = []
+    with open(pack_filename + ".tmp", "wb") as pack:
+        pack.write(HEADER.pack(MAGIC, VERSION, 0, 0))
+        for name, filename in zip(names, filenames):
+            data = read_vgm(filename)
+            pack.write(b"\0" * (-pack.tell() % ALIGNMENT))
+            entries.append((pack.tell(), len(data), name.encode()))
+            pack.write(data)
+        table_offset = pack.tell()
+        for offset, size, name in entries:
+            pack.write(ENTRY.pack(offset, size, len(name)) + name)
+        pack.seek(0)
+        pack.write(HEADER.pack(MAGIC, VERSION, len(entries), table_offset))
+    os.replace(pack_filename + ".tmp", pack_filename)
+    return len(entries)
+
+class Pack:
+    def __init__(self, filename):
+        self.filename = filename
+        with open(filename, "rb") as f:
+            self.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.buffer = memoryview(self.mmap)
+        magic, version, count, table_offset = HEADER.unpack_from(self.buffer)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{filename} is not a VGM pack")
+
+        self.entries = {}   # name: (offset, size)
+        pos = table_offset
+        for _ in range(count):
+            offset, size, name_length = ENTRY.unpack_from(self.buffer, pos)
+            pos += ENTRY.size
+            self.entries[bytes(self.buffer[pos:pos + name_length]).decode()] = (offset, size)
+            pos += name_length
+
+    def names(self):
+        return list(self.entries)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, name):
+        return name in self.entries
+
+    def open(self, name):
+        # Zero-copy view of the decompressed VGM file
+        offset, size = self.entries[name]
+        return self.buffer[offset:offset + size]
+
+    def close(self):
+        # Views returned by open() may outlive the pack (a Parser keeps its view),
+        # then the file stays mapped until the last of them is collected
+        if self.mmap is None:
+            return
+        self.buffer.release()
+        try:
+            self.mmap.close()
+        except BufferError:
+            pass
+        self.mmap = self.buffer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+def main():
+    if len(sys.argv) < 2:
+        print("usage: python vgmpack.py PACK [TUNES...]")
+        return 1
+    pack_filename, filenames = sys.argv[1], sys.argv[2:]
+    if filenames:
+        count = build(pack_filename, filenames)
+        print(f"Packed {count} tunes into {pack_filename}, {os.path.getsize(pack_filename) / 1e6:.1f} MB")
+    with Pack(pack_filename) as pack:
+        for name in pack.names():
+            print(f"{name:60s} {pack.entries[name][1]:10d} bytes")
+        print(f"{len(pack)} tunes")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
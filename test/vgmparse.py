@@ -1,6 +1,12 @@
+import bisect
 import gzip
+import io
 import struct
 import sys
+import zlib
+from array import array
+
+import numpy as np
 
 if (sys.version_info > (3, 0)):
     from io import BytesIO as ByteBuffer
@@ -11,6 +17,61 @@ else:
 class VersionError(Exception):
     pass
 
+class MetadataLayout:
+    # Metadata fields of a single VGM version, unpacked by a single struct.Struct shared by all the versions.
+    # Steps are (name, slot in the unpacked values or None for constants, offset or constant, condition, late),
+    # late steps are bounded by the header end calculated from the VGM data offset.
+    # late_data_offset tells whether the VGM data offset is taken from the header at all.
+    def __init__(self, steps, late_data_offset):
+        self.steps = steps
+        self.late_data_offset = late_data_offset
+
+def compile_metadata_layouts(metadata_offsets):
+    # Replays what parsing every version dictionary of metadata_offsets in turn would do, once per version.
+    # Fields overridden by a later version are dropped, so every field is unpacked and stored just once.
+    fields = sorted({(data['offset'], data['size'], data['type_format'])
+                     for offsets in metadata_offsets.values() for data in offsets.values() if isinstance(data, dict)})
+    header_format = '<'
+    end = 0
+    slots = {}
+    for offset, size, type_format in fields:
+        header_format += 'x' * (offset - end) + (type_format.lstrip('<') if type_format else f'{size}s')
+        slots[offset] = len(slots)
+        end = offset + size
+    header_struct = struct.Struct(header_format)
+
+    layouts = {}
+    versions = list(metadata_offsets)
+    for last, version in enumerate(versions):
+        definitions = {}    # name: [(position, iteration, data)]
+        position = 0
+        for iteration, offsets in enumerate(metadata_offsets[v] for v in versions[:last + 1]):
+            for name, data in offsets.items():
+                definitions.setdefault(name, []).append((position, iteration, data))
+                position += 1
+
+        def conditional(data):
+            return isinstance(data, dict) and 'condition' in data
+
+        data_offset_defined = min([i for _, i, _ in definitions.get('vgm_data_offset', [])], default=None)
+        steps = []
+        for name, defs in definitions.items():
+            # the last unconditional definition always sets the value, earlier ones do not matter,
+            # but the field keeps the position of its first definition in the metadata dict
+            unconditional = [j for j, (_, _, data) in enumerate(defs) if not conditional(data)]
+            if unconditional and not conditional(defs[0][2]):
+                defs = [(defs[0][0],) + defs[unconditional[-1]][1:]] + defs[unconditional[-1] + 1:]
+            for position, iteration, data in defs:
+                late = data_offset_defined is not None and iteration > data_offset_defined
+                if isinstance(data, dict):
+                    steps.append((position, name, slots[data['offset']], data['offset'], data.get('condition'), late))
+                else:
+                    steps.append((position, name, None, data, None, False))
+        steps = [step[1:] for step in sorted(steps, key=lambda step: step[0])]
+        late_data_offset = data_offset_defined is not None and data_offset_defined < last
+        layouts[version] = MetadataLayout(steps, late_data_offset)
+    return header_struct, slots, layouts
+
 #
 # VGM Specification: https://vgmrips.net/wiki/VGM_Specification
 #
@@ -375,14 +436,149 @@ class Parser:
         },
     }
 
-    def __init__(self, vgm_data):
+    # Header layouts of every version compiled from metadata_offsets, see parse_metadata()
+    header_struct, metadata_slots, metadata_layouts = compile_metadata_layouts(metadata_offsets)
+
+    # Number of operand bytes following each of the VGM command opcodes.
+    # Negative value ~n marks commands with n operand bytes that are stepped over, but not stored.
+    command_sizes = [~0] * 256
+
+    # 0x31 dd - AY8910 stereo mask, dd is a bit mask of i y r3 l3 r2 l2 r1 l1 (bit 7 ... 0)
+    #           i   chip instance (0 or 1)
+    #           y   set stereo mask for YM2203 SSG (1) or AY8910 (0)
+    #           l1/l2/l3    enable channel 1/2/3 on left speaker
+    #           r1/r2/r3    enable channel 1/2/3 on right speaker
+    # 0x4f dd - Game Gear PSG stereo, write dd to port 0x06
+    # 0x50 dd - PSG (SN76489/SN76496) write value dd
+    for command in [0x31, 0x4f, 0x50]:
+        command_sizes[command] = 1
+
+    # 0x51 aa dd - YM2413, write value dd to register aa
+    # 0x52 aa dd - YM2612 port 0, write value dd to register aa
+    # 0x53 aa dd - YM2612 port 1, write value dd to register aa
+    # 0x54 aa dd - YM2151, write value dd to register aa
+    # 0x55 aa dd - YM2203, write value dd to register aa
+    # 0x56 aa dd - YM2608 port 0, write value dd to register aa
+    # 0x57 aa dd - YM2608 port 1, write value dd to register aa
+    # 0x58 aa dd - YM2610 port 0, write value dd to register aa
+    # 0x59 aa dd - YM2610 port 1, write value dd to register aa
+    # 0x5A aa dd - YM3812, write value dd to register aa
+    # 0x5B aa dd - YM3526, write value dd to register aa
+    # 0x5C aa dd - Y8950, write value dd to register aa
+    # 0x5D aa dd - YMZ280B, write value dd to register aa
+    # 0x5E aa dd - YMF262 port 0, write value dd to register aa
+    # 0x5F aa dd - YMF262 port 1, write value dd to register aa
+    # 0xA0 aa dd - AY8910, write value dd to register aa
+    # 0xB0 aa dd - RF5C68, write value dd to register aa
+    # 0xB1 aa dd - RF5C164, write value dd to register aa
+    # 0xB2 ad dd - PWM, write value ddd to register a (d is MSB, dd is LSB)
+    # 0xB3 aa dd - GameBoy DMG, write value dd to register aa
+    # 0xB4 aa dd - NES APU, write value dd to register aa
+    # 0xB5 aa dd - MultiPCM, write value dd to register aa
+    # 0xB6 aa dd - uPD7759, write value dd to register aa
+    # 0xB7 aa dd - OKIM6258, write value dd to register aa
+    # 0xB8 aa dd - OKIM6295, write value dd to register aa
+    # 0xB9 aa dd - HuC6280, write value dd to register aa
+    # 0xBA aa dd - K053260, write value dd to register aa
+    # 0xBB aa dd - Pokey, write value dd to register aa
+    # 0xBC aa dd - WonderSwan, write value dd to register aa
+    # 0xBD aa dd - SAA1099, write value dd to register aa
+    # 0xBE aa dd - ES5506, write value dd to register aa
+    # 0xBF aa dd - GA20, write value dd to register aa
+    for command in list(range(0x51, 0x60)) + [0xa0] + list(range(0xb0, 0xc0)):
+        command_sizes[command] = 2
+
+    # 0x61 nn nn - Wait n samples, n can range from 0 to 65535
+    command_sizes[0x61] = 2
+
+    # 0x62 - Wait 735 samples (60th of a second)
+    # 0x63 - Wait 882 samples (50th of a second)
+    # 0x66 - End of sound data
+    for command in [0x62, 0x63, 0x66]:
+        command_sizes[command] = 0
+
+    # 0x67 0x66 tt ss ss ss ss - Data block, variable size, handled separately
+
+    # 0x68 0x66 cc oo oo oo dd dd dd ss ss ss - PCM RAM write
+    command_sizes[0x68] = 11
+
+    # 0x7n - Wait n+1 samples, n can range from 0 to 15
+    # 0x8n - YM2612 port 0 address 2A write from the data bank, then
+    #        wait n samples; n can range from 0 to 15
+    for command in range(0x70, 0x90):
+        command_sizes[command] = 0
+
+    # 0x90 ss tt pp cc - DAC Setup Stream Control
+    # 0x91 ss dd ll bb - DAC Set Stream Data
+    # 0x92 ss ff ff ff ff - DAC Set Stream Frequency
+    # 0x93 ss aa aa aa aa mm ll ll ll ll - DAC Start Stream
+    # 0x94 ss - DAC Stop Stream
+    # 0x95 ss bb bb ff - DAC Start Stream (fast call)
+    for command, size in [(0x90, 4), (0x91, 4), (0x92, 5), (0x93, 10), (0x94, 1), (0x95, 4)]:
+        command_sizes[command] = size
+
+    # 0xC0 bbaa dd - Sega PCM, write value dd to memory offset aabb
+    # 0xC1 bbaa dd - RF5C68, write value dd to memory offset aabb
+    # 0xC2 bbaa dd - RF5C164, write value dd to memory offset aabb
+    # 0xC3 cc bbaa - MultiPCM, write set bank offset aabb to channel cc
+    # 0xC4 mmll rr - QSound, write value mmll to register rr (mm - data MSB, ll - data LSB)
+    # 0xC5 mmll dd - SCSP, write value dd to memory offset mmll (mm - offset MSB, ll - offset LSB)
+    # 0xC6 mmll dd - WonderSwan, write value dd to memory offset mmll (mm - offset MSB, ll - offset LSB)
+    # 0xC7 mmll dd - VSU, write value dd to memory offset mmll (mm - offset MSB, ll - offset LSB)
+    # 0xC8 mmll dd - X1-010, write value dd to memory offset mmll (mm - offset MSB, ll - offset LSB)
+    # 0xD0 pp aa dd - YMF278B, port pp, write value dd to register aa
+    # 0xD1 pp aa dd - YMF271, port pp, write value dd to register aa
+    # 0xD2 pp aa dd - SCC1, port pp, write value dd to register aa
+    # 0xD3 pp aa dd - K054539, write value dd to register ppaa
+    # 0xD4 pp aa dd - C140, write value dd to register ppaa
+    # 0xD5 pp aa dd - ES5503, write value dd to register ppaa
+    # 0xD6 pp aa dd - ES5506, write value aadd to register pp
+    for command in list(range(0xc0, 0xc9)) + list(range(0xd0, 0xd7)):
+        command_sizes[command] = 3
+
+    # 0xE0 dddddddd - Seek to offset dddddddd (Intel byte order) in PCM
+    #                 data bank
+    # 0xE1 mmll aadd - C352, write value aadd to register mmll
+    for command in [0xe0, 0xe1]:
+        command_sizes[command] = 4
+
+    # Number of samples to wait for every opcode, 0x61 nn nn is the only command with a variable wait
+    command_waits = [0] * 256
+    command_waits[0x62] = 735
+    command_waits[0x63] = 882
+    for command in range(0x70, 0x80):
+        command_waits[command] = (command & 15) + 1
+    for command in range(0x80, 0x90):
+        command_waits[command] = command & 15
+
+    # Reserved ranges from the specification, operands are skipped
+    for first, last, size in [(0x30, 0x3f, 1), (0x40, 0x4e, 2), (0xa1, 0xaf, 2),
+                              (0xc9, 0xcf, 3), (0xd7, 0xdf, 3), (0xe2, 0xff, 4)]:
+        for command in range(first, last + 1):
+            if command_sizes[command] < 0:
+                command_sizes[command] = ~size
+    del command, size, first, last
+
+    # Parsed commands: offset of the command in the VGM data, opcode, number of operand bytes,
+    # the first two operand bytes (register & value for the chip writes) and number of samples to wait
+    command_dtype = np.dtype([
+        ('offset', '<u4'),
+        ('command', 'u1'),
+        ('size', 'u1'),
+        ('aa', 'u1'),
+        ('dd', 'u1'),
+        ('wait', '<u4'),
+    ])
+
+    def __init__(self, vgm_data, header_only=False):
         # Store the VGM data and validate it
-        self.data = ByteBuffer(vgm_data)
+        self.buffer = memoryview(vgm_data)
         self.validate_vgm_data()
 
         # Set up the variables that will be populated
         self.vgm_data_offset = 0x40
-        self.command_list = []
+        self.commands = np.zeros(0, dtype=self.command_dtype)
+        self._command_list = None
         self.data_block = None
         self.data_block_type = None
         self.gd3_data = {}
@@ -393,357 +589,169 @@ class Parser:
         self.validate_vgm_version()
 
         # Parse GD3 data and the VGM commands
-        self.parse_gd3()
-        self.parse_commands()
-
-    def parse_commands(self):
-        # Save the current position of the VGM data
-        original_pos = self.data.tell()
-
-        # Seek to the start of the VGM data
-        self.data.seek(
-            self.vgm_data_offset
-            #self.metadata['vgm_data_offset'] +
-            #self.metadata_offsets[self.metadata['version']]['vgm_data_offset']['offset']
-        )
-
-        while True:
-            # Read a byte, this will be a VGM command, we will then make
-            # decisions based on the given command
-            command = self.data.read(1)
-
-            # Break if we are at the end of the file
-            if command == '':
-                break
-
-            # @TODO: automatize reading of command operands based on reserved ranges in specification (that should take care of dual chip support as well)
-            # @TODO: add optional flag to unpack operands
-            # @TODO: implement extra header (v1.70) support
-
-            # 0x31 dd - AY8910 stereo mask, dd is a bit mask of i y r3 l3 r2 l2 r1 l1 (bit 7 ... 0)
-            #           i   chip instance (0 or 1)
-            #           y   set stereo mask for YM2203 SSG (1) or AY8910 (0)
-            #           l1/l2/l3    enable channel 1/2/3 on left speaker
-            #           r1/r2/r3    enable channel 1/2/3 on right speaker
-            # 0x4f dd - Game Gear PSG stereo, write dd to port 0x06
-            # 0x50 dd - PSG (SN76489/SN76496) write value dd
-            if command in [b'\x31', b'\x4f', b'\x50']:
-                self.command_list.append({
-                    'command': command,
-                    'data': self.data.read(1),
-                })
-
-            # 0x51 aa dd - YM2413, write value dd to register aa
-            # 0x52 aa dd - YM2612 port 0, write value dd to register aa
-            # 0x53 aa dd - YM2612 port 1, write value dd to register aa
-            # 0x54 aa dd - YM2151, write value dd to register aa
-            # 0x55 aa dd - YM2203, write value dd to register aa
-            # 0x56 aa dd - YM2608 port 0, write value dd to register aa
-            # 0x57 aa dd - YM2608 port 1, write value dd to register aa
-            # 0x58 aa dd - YM2610 port 0, write value dd to register aa
-            # 0x59 aa dd - YM2610 port 1, write value dd to register aa
-            # 0x5A aa dd - YM3812, write value dd to register aa
-            # 0x5B aa dd - YM3526, write value dd to register aa
-            # 0x5C aa dd - Y8950, write value dd to register aa
-            # 0x5D aa dd - YMZ280B, write value dd to register aa
-            # 0x5E aa dd - YMF262 port 0, write value dd to register aa
-            # 0x5F aa dd - YMF262 port 1, write value dd to register aa
-            # 0xA0 aa dd - AY8910, write value dd to register aa
-            # 0xB0 aa dd - RF5C68, write value dd to register aa
-            # 0xB1 aa dd - RF5C164, write value dd to register aa
-            # 0xB2 ad dd - PWM, write value ddd to register a (d is MSB, dd is LSB)
-            # 0xB3 aa dd - GameBoy DMG, write value dd to register aa
-            # 0xB4 aa dd - NES APU, write value dd to register aa
-            # 0xB5 aa dd - MultiPCM, write value dd to register aa
-            # 0xB6 aa dd - uPD7759, write value dd to register aa
-            # 0xB7 aa dd - OKIM6258, write value dd to register aa
-            # 0xB8 aa dd - OKIM6295, write value dd to register aa
-            # 0xB9 aa dd - HuC6280, write value dd to register aa
-            # 0xBA aa dd - K053260, write value dd to register aa
-            # 0xBB aa dd - Pokey, write value dd to register aa
-            # 0xBC aa dd - WonderSwan, write value dd to register aa
-            # 0xBD aa dd - SAA1099, write value dd to register aa
-            # 0xBE aa dd - ES5506, write value dd to register aa
-            # 0xBF aa dd - GA20, write value dd to register aa
-            elif command in [b'\x51', b'\x52', b'\x53', b'\x54',
-                             b'\x55', b'\x56', b'\x57', b'\x58',
-                             b'\x59', b'\x5a', b'\x5b', b'\x5c',
-                             b'\x5d', b'\x5e', b'\x5f', b'\xa0',
-                             b'\xb0', b'\xb1', b'\xb2', b'\xb3',
-                             b'\xb4', b'\xb5', b'\xb6', b'\xb7',
-                             b'\xb8', b'\xb9', b'\xba', b'\xbb',
-                             b'\xbc', b'\xbd', b'\xbe', b'\xbf',
-                            ]:
-                self.command_list.append({
-                    'command': command,
-                    'data': self.data.read(2),
-                })
-
-            # 0x61 nn nn - Wait n samples, n can range from 0 to 65535
-            elif command == b'\x61':
-                self.command_list.append({
-                    'command': command,
-                    'data': self.data.read(2), # struct.unpack('<H', self.data.read(2))[0],
-                })
+        if not header_only:
+            self.parse_gd3()
+            self.parse_commands()
 
-            # 0x62 - Wait 735 samples (60th of a second)
-            # 0x63 - Wait 882 samples (50th of a second)
-            # 0x66 - End of sound data
-            elif command in [b'\x62', b'\x63', b'\x66']:
-                self.command_list.append({'command': command, 'data': None})
+    @property
+    def data(self):
+        # File-like copy of the VGM data, made only on demand since the parser itself works on the memoryview
+        return ByteBuffer(self.buffer)
 
-                # Stop processing commands if we are at the end of the music
-                # data
-                if command == b'\x66':
-                    break
+    def parse_commands(self):
+        # Walk the VGM data with the help of the table of command sizes and store only the offsets of the commands.
+        # Opcodes and operands are then gathered into a structured array by NumPy in one go,
+        # no per command objects are allocated.
+        buffer = self.buffer
+        sizes = self.command_sizes
+        end = len(buffer)
+        offsets = array('I')
+        append = offsets.append
+
+        pos = self.vgm_data_offset
+        while pos < end:
+            command = buffer[pos]
 
             # 0x67 0x66 tt ss ss ss ss - Data block
-            elif command == b'\x67':
-                # Skip the compatibility byte (0x66)
-                self.data.seek(1, 1)
-
-                self.data_block_type = self.data.read(1)
-
-                # Read the size of the data block
-                data_block_size = struct.unpack('<I', self.data.read(4))[0]
+            if command == 0x67:
+                # Skip the compatibility byte (0x66), read the type and the size of the data block
+                self.data_block_type = bytes(buffer[pos+2:pos+3])
+                data_block_size = struct.unpack_from('<I', buffer, pos+3)[0]
 
                 # Store the data block for later use
-                self.data_block = ByteBuffer(self.data.read(data_block_size))
-
-            # 0x68 0x66 cc oo oo oo dd dd dd ss ss ss - PCM RAM write
-            elif command == b'\x68':
-                # Skip the compatibility byte (0x66)
-                self.data.seek(1, 1)
-                # Read the rest of data cc oo oo oo dd dd dd ss ss ss
-                self.command_list.append({
-                    'command': command,
-                    'data': self.data.read(10),
-                })
-
-            # 0x7n - Wait n+1 samples, n can range from 0 to 15
-            # 0x8n - YM2612 port 0 address 2A write from the data bank, then
-            #        wait n samples; n can range from 0 to 15
-            elif b'\x70' <= command <= b'\x8f':
-                self.command_list.append({'command': command, 'data': None})
-
-            # 0x90 ss tt pp cc - DAC Setup Stream Control
-            elif command == b'\x90':
-                self.command_list.append({
-                    'command': command,
-                    'data': self.data.read(4),
-                })
-            # 0x91 ss dd ll bb - DAC Set Stream Data
-            elif command == b'\x91':
-                self.command_list.append({
-                    'command': command,
-                    'data': self.data.read(4),
-                })
-            # 0x92 ss ff ff ff ff - DAC Set Stream Frequency
-            elif command == b'\x92':
-                self.command_list.append({
-                    'command': command,
-                    'data': self.data.read(5),
-                })
-            # 0x93 ss aa aa aa aa mm ll ll ll ll - DAC Start Stream
-            elif command == b'\x93':
-                self.command_list.append({
-                    'command': command,
-                    'data': self.data.read(10),
-                })
-            # 0x94 ss - DAC Stop Stream
-            elif command == b'\x94':
-                self.command_list.append({
-                    'command': command,
-                    'data': self.data.read(1),
-                })
-            # 0x95 ss bb bb ff - DAC Start Stream (fast call)
-            elif command == b'\x95':
-                self.command_list.append({
-                    'command': command,
-                    'data': self.data.read(4),
-                })
-
-            # 0xC0 bbaa dd - Sega PCM, write value dd to memory offset aabb
-            # 0xC1 bbaa dd - RF5C68, write value dd to memory offset aabb
-            # 0xC2 bbaa dd - RF5C164, write value dd to memory offset aabb
-            # 0xC3 cc bbaa - MultiPCM, write set bank offset aabb to channel cc
-            # 0xC4 mmll rr - QSound, write value mmll to register rr (mm - data MSB, ll - data LSB)
-            # 0xC5 mmll dd - SCSP, write value dd to memory offset mmll (mm - offset MSB, ll - offset LSB)
-            # 0xC6 mmll dd - WonderSwan, write value dd to memory offset mmll (mm - offset MSB, ll - offset LSB)
-            # 0xC7 mmll dd - VSU, write value dd to memory offset mmll (mm - offset MSB, ll - offset LSB)
-            # 0xC8 mmll dd - X1-010, write value dd to memory offset mmll (mm - offset MSB, ll - offset LSB)
-            # 0xD0 pp aa dd - YMF278B, port pp, write value dd to register aa
-            # 0xD1 pp aa dd - YMF271, port pp, write value dd to register aa
-            # 0xD2 pp aa dd - SCC1, port pp, write value dd to register aa
-            # 0xD3 pp aa dd - K054539, write value dd to register ppaa
-            # 0xD4 pp aa dd - C140, write value dd to register ppaa
-            # 0xD5 pp aa dd - ES5503, write value dd to register ppaa
-            # 0xD6 pp aa dd - ES5506, write value aadd to register pp
-            elif command in [b'\xc0', b'\xc1', b'\xc2', b'\xc3',
-                             b'\xc4', b'\xc5', b'\xc6', b'\xc7',
-                             b'\xc8',
-                             b'\xd0', b'\xd1', b'\xd2', b'\xd3',
-                             b'\xd4', b'\xd5', b'\xd6',
-                            ]:
-                self.command_list.append({
-                    'command': command,
-                    'data': self.data.read(3),
-                })
+                self.data_block = ByteBuffer(buffer[pos+7:pos+7+data_block_size])
+                pos += 7 + data_block_size
+                continue
 
-            # 0xE0 dddddddd - Seek to offset dddddddd (Intel byte order) in PCM
-            #                 data bank
-            elif command == b'\xe0':
-                self.command_list.append({
-                    'command': command,
-                    'data': self.data.read(4),
-                })
+            size = sizes[command]
+            if size >= 0:
+                append(pos)
+            else:
+                size = ~size    # command is skipped, but its operands still have to be stepped over
 
-            # 0xE1 mmll aadd - C352, write value aadd to register mmll
-            elif command == b'\xe1':
-                self.command_list.append({
-                    'command': command,
-                    'data': self.data.read(4),
+            # Stop processing commands if we are at the end of the music data
+            if command == 0x66:
+                break
+            pos += 1 + size
+
+        self.commands = self.gather_commands(np.frombuffer(offsets, dtype=np.uint32))
+        self._command_list = None
+
+    def gather_commands(self, offsets):
+        data = np.frombuffer(self.buffer, dtype=np.uint8)
+        commands = np.zeros(len(offsets), dtype=self.command_dtype)
+        commands['offset'] = offsets
+        commands['command'] = command = data[offsets]
+        commands['size'] = size = np.array(self.command_sizes, dtype=np.int16)[command]
+        commands['aa'] = np.where(size >= 1, data.take(offsets.astype(np.int64) + 1, mode='clip'), 0)
+        commands['dd'] = np.where(size >= 2, data.take(offsets.astype(np.int64) + 2, mode='clip'), 0)
+
+        aa = commands['aa'].astype(np.uint32)
+        dd = commands['dd'].astype(np.uint32)
+        commands['wait'] = np.where(command == 0x61, aa | dd << 8,
+                                    np.array(self.command_waits, dtype=np.uint32)[command])
+        return commands
+
+    @property
+    def command_list(self):
+        # Compatibility view of the commands - a list of {'command': bytes, 'data': bytes or None} dicts,
+        # built on the first access only
+        if self._command_list is None:
+            buffer = self.buffer
+            command_list = []
+            for offset, command, size in zip(self.commands['offset'].tolist(),
+                                             self.commands['command'].tolist(),
+                                             self.commands['size'].tolist()):
+                if command == 0x68:
+                    offset += 1 # skip the compatibility byte (0x66)
+                    size -= 1
+                command_list.append({
+                    'command': bytes((command,)),
+                    'data': bytes(buffer[offset+1:offset+1+size]) if size > 0 else None,
                 })
-
-        # Seek back to the original position in the VGM data
-        self.data.seek(original_pos)
+            self._command_list = command_list
+        return self._command_list
 
     def parse_gd3(self):
-        # Save the current position of the VGM data
-        original_pos = self.data.tell()
-
-        # Seek to the start of the GD3 data
-        self.data.seek(
-            self.metadata['gd3_offset'] +
-            self.metadata_offsets[self.metadata['version']]['gd3_offset']['offset']
-        )
-
-        # Skip 8 bytes ('Gd3 ' string and 4 byte version identifier)
-        self.data.seek(8, 1)
-
-        # Get the length of the GD3 data, then read it
-        gd3_length = struct.unpack('<I', self.data.read(4))[0]
-        gd3_data = ByteBuffer(self.data.read(gd3_length))
-
-        # Parse the GD3 data
-        gd3_fields = []
-        current_field = b''
-        while True:
-            # Read two bytes. All characters (English and Japanese) in the GD3
-            # data use two byte encoding
-            char = gd3_data.read(2)
-
-            # Break if we are at the end of the GD3 data
-            if char == b'':
-                break
-
-            # Check if we are at the end of a field, if not then continue to
-            # append to "current_field"
-            if char == b'\x00\x00':
-                gd3_fields.append(current_field)
-                current_field = b''
-            else:
-                current_field += char
-
-        # Once all the fields have been parsed, create a dict with the data
-        self.gd3_data = {
-            'title_eng': gd3_fields[0],
-            'title_jap': gd3_fields[1],
-            'game_eng': gd3_fields[2],
-            'game_jap': gd3_fields[3],
-            'console_eng': gd3_fields[4],
-            'console_jap': gd3_fields[5],
-            'artist_eng': gd3_fields[6],
-            'artist_jap': gd3_fields[7],
-            'date': gd3_fields[8],
-            'vgm_creator': gd3_fields[9],
-            'notes': gd3_fields[10],
-        }
-
-        # Seek back to the original position in the VGM data
-        self.data.seek(original_pos)
+        # GD3 offset is relative to its own location in the header
+        gd3_start = self.metadata['gd3_offset'] + \
+                    self.metadata_offsets[self.metadata['version']]['gd3_offset']['offset']
+
+        # Skip 8 bytes ('Gd3 ' string and 4 byte version identifier), then get the length of the GD3 data
+        gd3_length = struct.unpack_from('<I', self.buffer, gd3_start + 8)[0]
+        self.gd3_data = self.decode_gd3(self.buffer[gd3_start + 12:gd3_start + 12 + gd3_length])
+
+    # GD3 fields in the order they are stored
+    gd3_fields = ['title_eng', 'title_jap', 'game_eng', 'game_jap', 'console_eng', 'console_jap',
+                  'artist_eng', 'artist_jap', 'date', 'vgm_creator', 'notes']
+
+    @classmethod
+    def decode_gd3(cls, data, text=False):
+        # All characters (English and Japanese) in the GD3 data use two byte encoding (UTF-16LE) and every field
+        # is terminated by a NUL character. The data is decoded and split in a single pass. Returns the fields
+        # as UTF-16LE bytes like gd3_data, or as str with text=True. Unterminated data at the end is dropped.
+        text_data = bytes(data[:len(data) & ~1]).decode('utf-16-le', errors='surrogatepass')
+        fields = text_data.split('\0')[:-1]
+        fields += [''] * (len(cls.gd3_fields) - len(fields))
+        if not text:
+            fields = [field.encode('utf-16-le', errors='surrogatepass') for field in fields]
+        return dict(zip(cls.gd3_fields, fields))
 
     def parse_metadata(self):
-        # Save the current position of the VGM data
-        original_pos = self.data.tell()
-
-        # Create the list to store the VGM metadata
-        self.metadata = {}
-
-        # Iterate over the offsets and parse the metadata
-        highest_supported_version = self.supported_ver_list[-1]
-        for version, offsets in self.metadata_offsets.items():
-            # Skip parsing metadata from VGM versions later than the version of the file
-            if version <= self.metadata.get('version', highest_supported_version):
-
-                # Calculate offset of VGM data
-                if 'vgm_data_offset' in self.metadata:
-                    self.vgm_data_offset =  self.metadata['vgm_data_offset'] + \
-                                            self.metadata_offsets[version]['vgm_data_offset']['offset']
-                header_end = self.vgm_data_offset # Header ends where VGM data starts
-
-                for value, offset_data in offsets.items():
-
-                    if not isinstance(offset_data, dict):
-                        self.metadata[value] = offset_data
-                        continue
-
-                    # Skip parsing metadata attributes that are located outside the header,
-                    # set them to 0 instead.
-                    #
-                    # See specification: "All header sizes are valid for all versions from 1.50 on,
-                    # as long as header has at least 64 bytes. If the VGM data starts at an offset
-                    # that is lower than 0x100, all overlapping header bytes have to be handled as
-                    # they were zero."
-                    if offset_data['offset'] >= header_end:
-                        self.metadata[value] = 0
-                        continue
-
-                    # Seek to the data location and read the data
-                    self.data.seek(offset_data['offset'])
-                    data = self.data.read(offset_data['size'])
-
-                    # Unpack the data if required
-                    if offset_data['type_format'] is not None:
-                        data = struct.unpack(
-                            offset_data['type_format'],
-                            data,
-                        )[0]
-
-                    # Check if special condition applies
-                    # mostly used for a backwards compatibility handling in pre 1.10 formats
-                    if 'condition' in offset_data and not offset_data['condition'](data):
-                        continue
-
-                    self.metadata[value] = data
-
-        # Seek back to the original position in the VGM data
-        self.data.seek(original_pos)
+        # All the header fields are unpacked at once with the layout of the file version compiled at import,
+        # see compile_metadata_layouts(). Header bytes past the end of the data are handled as zero.
+        header_struct = self.header_struct
+        header = self.buffer[:header_struct.size]
+        if len(header) < header_struct.size:
+            header = bytes(header).ljust(header_struct.size, b'\0')
+        values = header_struct.unpack_from(header)
+
+        # Layout of the latest supported version that is not later than the version of the file
+        version = values[self.metadata_slots[self.metadata_offsets[0x100]['version']['offset']]]
+        layout_version = self.supported_ver_list[max(bisect.bisect_right(self.supported_ver_list, version) - 1, 0)]
+        layout = self.metadata_layouts[layout_version]
+
+        # Header ends where VGM data starts. VGM data offset is relative to its own location in the header.
+        header_end = self.vgm_data_offset
+        data_offset = self.metadata_offsets[0x150]['vgm_data_offset']['offset']
+        late_header_end = values[self.metadata_slots[data_offset]] + data_offset
+
+        # Skip parsing metadata attributes that are located outside the header, set them to 0 instead.
+        #
+        # See specification: "All header sizes are valid for all versions from 1.50 on,
+        # as long as header has at least 64 bytes. If the VGM data starts at an offset
+        # that is lower than 0x100, all overlapping header bytes have to be handled as
+        # they were zero."
+        metadata = {}
+        for name, slot, offset, condition, late in layout.steps:
+            if slot is None:
+                metadata[name] = offset
+            elif offset >= (late_header_end if late else header_end):
+                metadata[name] = 0
+            else:
+                value = values[slot]
+                # Check if special condition applies
+                # mostly used for a backwards compatibility handling in pre 1.10 formats
+                if condition is None or condition(value):
+                    metadata[name] = value
+        self.metadata = metadata
+        if layout.late_data_offset:
+            self.vgm_data_offset = late_header_end
 
     def validate_vgm_data(self):
-        # Save the current position of the VGM data
-        original_pos = self.data.tell()
-
-        # Seek to the start of the file
-        self.data.seek(0)
-
         # Perform basic validation on the given file by checking for the VGM
         # magic number ('Vgm ')
-        if self.data.read(4) != self.vgm_magic_number:
+        if self.buffer[:4] != self.vgm_magic_number:
             # Could not find the magic number. The file could be gzipped (e.g.
-            # a vgz file). Try un-gzipping the file and trying again.
-            self.data.seek(0)
-            self.data = gzip.GzipFile(fileobj=self.data, mode='rb')
-
+            # a vgz file). Un-gzip the whole file once and try again.
             try:
-                if self.data.read(4) != self.vgm_magic_number:
-                    raise ValueError('Data does not appear to be a valid VGM file')
-            except IOError:
+                self.buffer = memoryview(gzip.decompress(self.buffer))
+            except (IOError, EOFError, zlib.error):
                 # IOError will be raised if the file is not a valid gzip file
                 raise ValueError('Data does not appear to be a valid VGM file')
 
-        # Seek back to the original position in the VGM data
-        self.data.seek(original_pos)
+            if self.buffer[:4] != self.vgm_magic_number:
+                raise ValueError('Data does not appear to be a valid VGM file')
 
     def validate_vgm_version(self):
         def bcd_version_to_str(bcd):
@@ -756,3 +764,150 @@ class Parser:
         if self.metadata['version'] not in self.supported_ver_list:
             version = self.metadata['version']
             raise VersionError(f'VGM version {bcd_version_to_str(version>>8)}.{bcd_version_to_str(version&255)} is not supported')
+
+
+class MemoryFile(io.RawIOBase):
+    # Read-only file over a buffer (for example a memoryview slice of an mmap), the buffer is never copied as a whole
+    def __init__(self, buffer):
+        self.buffer = memoryview(buffer).cast('B')
+        self.pos = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, b):
+        n = max(min(len(b), len(self.buffer) - self.pos), 0)
+        b[:n] = self.buffer[self.pos:self.pos + n]
+        self.pos += n
+        return n
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self.pos, io.SEEK_END: len(self.buffer)}[whence]
+        self.pos = max(base + offset, 0)
+        return self.pos
+
+    def tell(self):
+        return self.pos
+
+def open_vgm(filename):
+    # Opens VGM file for reading, VGZ files are decompressed on the fly.
+    # Accepts a buffer holding the file as well (see vgmpack.py).
+    if isinstance(filename, (bytes, bytearray, memoryview)):
+        file = MemoryFile(filename)
+        is_vgm = bytes(file.buffer[:4]) == Parser.vgm_magic_number
+        return file if is_vgm else gzip.GzipFile(fileobj=file, mode='rb')
+    with open(filename, 'rb') as f:
+        is_vgm = f.read(4) == Parser.vgm_magic_number
+    return open(filename, 'rb') if is_vgm else gzip.open(filename, 'rb')
+
+#
+# Streaming alternative to the Parser: only the header is parsed upfront,
+# commands are decoded incrementally while they are consumed.
+# Memory usage is constant regardless of the file size or number of loops.
+#
+class Stream:
+    # Longest command with fixed size: 0x68 0x66 cc oo oo oo dd dd dd ss ss ss
+    max_command_size = 12
+    header_size = 0x100
+
+    def __init__(self, filename, chunk_size=1 << 16):
+        self.chunk_size = chunk_size
+        self.file = open_vgm(filename)
+        header = Parser(self.file.read(self.header_size), header_only=True)
+        self.metadata = header.metadata
+        self.vgm_data_offset = header.vgm_data_offset
+
+        # Loop offset is relative to its own location in the header, 0 means there is no loop
+        loop_offset = self.metadata.get('loop_offset', 0)
+        self.loop_start = loop_offset + 0x1c if loop_offset else self.vgm_data_offset
+
+    def total_samples(self, loops=1):
+        loop_samples = self.metadata.get('loop_samples', 0) if self.metadata.get('loop_offset', 0) else \
+                       self.metadata['total_samples']
+        return self.metadata['total_samples'] + (loops - 1) * loop_samples
+
+    def commands(self, loops=1):
+        # Yields (command, aa, dd, wait) tuples, see Parser.command_dtype.
+        # Once the end of sound data is reached, playback jumps back to the loop offset
+        # until the requested number of loops is played. 0x66 is yielded only at the very end.
+        sizes = Parser.command_sizes
+        waits = Parser.command_waits
+        file = self.file
+
+        file.seek(self.vgm_data_offset)
+        buffer = b''
+        pos = 0
+        while True:
+            if len(buffer) - pos < self.max_command_size:
+                buffer = buffer[pos:] + file.read(self.chunk_size)
+                pos = 0
+                if not buffer:
+                    return
+
+            command = buffer[pos]
+
+            # 0x67 0x66 tt ss ss ss ss - Data block, skip it
+            if command == 0x67:
+                data_block_end = pos + 7 + struct.unpack_from('<I', buffer, pos+3)[0]
+                if data_block_end > len(buffer):
+                    file.seek(data_block_end - len(buffer), 1)
+                    buffer = b''
+                    data_block_end = 0
+                pos = data_block_end
+                continue
+
+            # 0x66 - End of sound data, seek back to the loop start if needed
+            if command == 0x66:
+                if loops > 1:
+                    loops -= 1
+                    file.seek(self.loop_start)
+                    buffer = b''
+                    pos = 0
+                    continue
+                yield (command, 0, 0, 0)
+                return
+
+            size = sizes[command]
+            if size < 0:
+                pos += 1 + ~size
+                continue
+            if pos + 1 + size > len(buffer):
+                return  # truncated command at the end of file
+
+            aa = buffer[pos+1] if size >= 1 else 0
+            dd = buffer[pos+2] if size >= 2 else 0
+            wait = aa | dd << 8 if command == 0x61 else waits[command]
+            yield (command, aa, dd, wait)
+            pos += 1 + size
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+#
+# Header and GD3 tags only, commands are not parsed at all.
+# VGZ files are decompressed just up to the end of the header, or up to the GD3 tags if they are requested
+# (gzip has no random access, data in front of the GD3 tags is decompressed in chunks and dropped).
+#
+def scan(filename, gd3=True):
+    # Returns (metadata, gd3_data) dicts, same as Parser.metadata and Parser.gd3_data
+    with open_vgm(filename) as file:
+        header = Parser(file.read(Stream.header_size), header_only=True)
+        gd3_data = {}
+        gd3_offset = header.metadata.get('gd3_offset', 0)
+        if gd3 and gd3_offset:
+            # GD3 offset is relative to its own location in the header
+            file.seek(gd3_offset + Parser.metadata_offsets[0x100]['gd3_offset']['offset'])
+            gd3_header = file.read(12)
+            if gd3_header[:4] == b'Gd3 ' and len(gd3_header) == 12:
+                gd3_length = struct.unpack_from('<I', gd3_header, 8)[0]
+                gd3_data = Parser.decode_gd3(file.read(gd3_length))
+    return header.metadata, gd3_data
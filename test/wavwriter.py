@@ -0,0 +1,75 @@
+# Incremental writer for mono 16-bit PCM WAV files
+#
+# Samples are collected in a preallocated int16 buffer and appended to the open file once the buffer is full.
+# RIFF and data chunk sizes in the header are patched on every flush(), so the file on disk is always
+# a valid WAV file that can be listened to while the recording is still in progress.
+
+import struct
+import numpy as np
+
+class WaveWriter:
+    HEADER_SIZE = 44
+
+    def __init__(self, filename, sampling_rate, buffer_size=4096):
+        self.filename = filename
+        self.sampling_rate = sampling_rate
+        self.buffer = np.zeros(buffer_size, dtype=np.int16)
+        self.buffered = 0
+        self.frames_written = 0
+        self.file = open(filename, "wb")
+        self.write_header()
+
+    def write_header(self):
+        data_size = self.frames_written * 2
+        channels, bits = 1, 16
+        block_align = channels * bits // 8
+        self.file.write(struct.pack("<4sI4s4sIHHIIHH4sI",
+            b"RIFF", 36 + data_size, b"WAVE",
+            b"fmt ", 16, 1, channels, self.sampling_rate, self.sampling_rate * block_align, block_align, bits,
+            b"data", data_size))
+
+    def patch_header(self):
+        data_size = self.frames_written * 2
+        self.file.seek(4)
+        self.file.write(struct.pack("<I", 36 + data_size))
+        self.file.seek(40)
+        self.file.write(struct.pack("<I", data_size))
+        self.file.seek(0, 2)
+
+    def append(self, sample):
+        self.buffer[self.buffered] = sample
+        self.buffered += 1
+        if self.buffered == len(self.buffer):
+            self.write_buffer()
+
+    def extend(self, samples):
+        samples = np.asarray(samples, dtype=np.int16)
+        if self.buffered > 0:
+            self.write_buffer()
+        self.file.write(samples.astype("<i2", copy=False).tobytes())
+        self.frames_written += len(samples)
+
+    def write_buffer(self):
+        self.file.write(self.buffer[:self.buffered].astype("<i2", copy=False).tobytes())
+        self.frames_written += self.buffered
+        self.buffered = 0
+
+    def flush(self):
+        self.write_buffer()
+        self.patch_header()
+        self.file.flush()
+
+    def close(self):
+        if self.file.closed:
+            return
+        self.flush()
+        self.file.close()
+
+    def __len__(self):
+        return self.frames_written + self.buffered
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()